@@ -28,6 +28,9 @@ python ../scripts/evaluation_manager.py import-aa \
 --model-name <model-name> \
 --repo-id <repo-id> \
 [--create-pr]
+
+For many models, `evaluation_manager.py import-aa-batch` resolves them all
+from a single (cached) catalogue download.
 """
 
 import argparse
@@ -50,16 +53,22 @@ if not HF_TOKEN:
     raise ValueError("HF_TOKEN is not set")
 
 
-def get_model_evaluations_data(creator_slug, model_name):
-    response = requests.get(URL, headers=HEADERS)
-    response_data = response.json()["data"]
-    for model in response_data:
-        if (
-            model["model_creator"]["slug"] == creator_slug
-            and model["slug"] == model_name
-        ):
-            return model
-    raise ValueError(f"Model {model_name} not found")
+def get_models_index():
+    """Download the catalogue once and index it by (creator_slug, model_slug)."""
+    response = requests.get(URL, headers=HEADERS, timeout=30)
+    response.raise_for_status()
+    return {
+        (model["model_creator"]["slug"], model["slug"]): model
+        for model in response.json()["data"]
+    }
+
+
+def get_model_evaluations_data(creator_slug, model_name, models_index=None):
+    models_index = models_index if models_index is not None else get_models_index()
+    model = models_index.get((creator_slug, model_name))
+    if model is None:
+        raise ValueError(f"Model {model_name} not found")
+    return model
 
 
 def aa_evaluations_to_model_index(
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "huggingface-hub>=1.1.4",
+#     "markdown-it-py>=3.0.0",
+#     "numpy>=1.26",
+#     "python-dotenv>=1.2.1",
+#     "pyyaml>=6.0.3",
+#     "requests>=2.32.5",
+#     "urllib3>=2",
+# ]
+# ///
+
+"""
+Microbenchmarks for the README table extraction engine.
+
+Times extract_tables_with_parser, parse_markdown_table, is_transposed_table and
+extract_metrics_from_table on the offline corpus in examples/benchmark_corpus,
+plus a multi-MB card assembled from it, without network access or HF tokens.
+YAML serialization of a large generated model-index is timed as well: plain
+PyYAML against the libyaml-backed load_yaml/dump_yaml and the card rewrite.
+
+Results can be saved as JSON and compared against an earlier run, so changes
+to the engine are measured rather than guessed:
+
+    python scripts/benchmark_extraction.py --output before.json
+    # ... change evaluation_manager_core.py ...
+    python scripts/benchmark_extraction.py --compare before.json
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import timeit
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+import yaml
+
+from evaluation_manager import (
+    _parse_tables,
+    dump_yaml,
+    extract_metrics_from_table,
+    extract_tables_from_markdown,
+    extract_tables_with_parser,
+    is_transposed_table,
+    load_yaml,
+    parse_markdown_table,
+    replace_card_model_index,
+)
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples", "benchmark_corpus")
+
+# Model whose scores extract_metrics_from_table looks up in each fixture
+FIXTURE_MODEL_NAMES = {
+    "wide_comparison": "Nova-8B-Instruct",
+    "transposed_leaderboard": "Nova-8B-Instruct",
+    "realistic_card": "Nova-8B",
+    "large_card": "Nova-8B",
+}
+
+
+def load_corpus(corpus_dir: str, large_mb: float) -> Dict[str, str]:
+    """Read the fixtures and add `large_card`: all of them repeated to about large_mb megabytes."""
+    corpus = {}
+    for filename in sorted(os.listdir(corpus_dir)):
+        if filename.endswith(".md"):
+            with open(os.path.join(corpus_dir, filename), encoding="utf-8", newline="") as f:
+                corpus[filename[:-3]] = f.read()
+
+    if large_mb > 0 and corpus:
+        section = "\n\n".join(corpus.values())
+        target = int(large_mb * 1024 * 1024)
+        corpus["large_card"] = "\n\n".join([section] * max(1, target // len(section)))
+    return corpus
+
+
+def corpus_digest(corpus: Dict[str, str]) -> str:
+    digest = hashlib.sha256()
+    for name, content in sorted(corpus.items()):
+        digest.update(name.encode("utf-8"))
+        digest.update(content.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def build_cases(corpus: Dict[str, str]) -> List[Tuple[str, Callable[[], Any]]]:
+    """One (name, callable) per function and fixture; each call processes every table of the fixture."""
+    cases = []
+    for fixture, content in corpus.items():
+        raw_tables = [(t.headers, t.rows) for t in extract_tables_with_parser(content)]
+        table_strings = extract_tables_from_markdown(content)
+        model_name = FIXTURE_MODEL_NAMES.get(fixture)
+
+        def parse(content=content):
+            # Parsed tables are memoized per content; measure the parse itself
+            _parse_tables.cache_clear()
+            return extract_tables_with_parser(content)
+
+        def parse_strings(table_strings=table_strings):
+            return [parse_markdown_table(table_str) for table_str in table_strings]
+
+        # Raw (headers, rows) lists, so each call builds its table and per-table caches from scratch
+        def transposed(raw_tables=raw_tables):
+            return [is_transposed_table(headers, rows) for headers, rows in raw_tables]
+
+        def metrics(raw_tables=raw_tables, model_name=model_name):
+            return [extract_metrics_from_table(headers, rows, model_name=model_name) for headers, rows in raw_tables]
+
+        cases += [
+            (f"extract_tables_with_parser/{fixture}", parse),
+            (f"parse_markdown_table/{fixture}", parse_strings),
+            (f"is_transposed_table/{fixture}", transposed),
+            (f"extract_metrics_from_table/{fixture}", metrics),
+        ]
+    return cases
+
+
+def large_model_index(result_sets: int, metrics_per_set: int = 20) -> List[Dict[str, Any]]:
+    """A deterministic model-index with result_sets x metrics_per_set scores."""
+    rng = random.Random(0)
+    results = []
+    for i in range(result_sets):
+        results.append({
+            "task": {"type": "text-generation"},
+            "dataset": {"name": f"Benchmark {i} (5-Shot)", "type": f"org/benchmark-{i}", "split": "test",
+                        "args": {"num_few_shot": 5}},
+            "metrics": [
+                {"name": f"Metric {j}", "type": f"metric_{j}", "value": round(rng.uniform(0, 100), 2)}
+                for j in range(metrics_per_set)
+            ],
+            "source": {"name": "Open LLM Leaderboard", "url": f"https://example.org/results/{i}"},
+        })
+    return [{"name": "Nova-8B", "results": results}]
+
+
+def build_serialization_cases(result_sets: int) -> List[Tuple[str, Callable[[], Any]]]:
+    """PyYAML's pure-Python SafeLoader/SafeDumper next to the evaluation_manager helpers."""
+    model_index = large_model_index(result_sets)
+    document = {"license": "apache-2.0", "tags": ["evaluation"], "model-index": model_index}
+    text = yaml.dump(document, Dumper=yaml.SafeDumper, sort_keys=False)
+    card = f"---\n{text}---\n\n# Nova-8B\n"
+    return [
+        ("yaml.dump(SafeDumper)/large_model_index", lambda: yaml.dump(document, Dumper=yaml.SafeDumper, sort_keys=False)),
+        ("dump_yaml/large_model_index", lambda: dump_yaml(document)),
+        ("yaml.load(SafeLoader)/large_model_index", lambda: yaml.load(text, Loader=yaml.SafeLoader)),
+        ("load_yaml/large_model_index", lambda: load_yaml(text)),
+        ("replace_card_model_index/large_model_index", lambda: replace_card_model_index(card, model_index)),
+    ]
+
+
+def time_case(func: Callable[[], Any], repeat: int, min_time: float) -> Dict[str, Any]:
+    """Time func like timeit: calibrate a loop count, then take `repeat` samples of seconds per call."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [timer.timeit(number) / number for _ in range(repeat)]
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "loops": number,
+        "repeat": repeat,
+    }
+
+
+def environment_info(corpus: Dict[str, str], model_index_results: int) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "libyaml": yaml.__with_libyaml__,
+        "cpu_count": os.cpu_count(),
+        "corpus": corpus_digest(corpus),
+        "fixture_bytes": {name: len(content.encode("utf-8")) for name, content in corpus.items()},
+        "model_index_results": model_index_results,
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print median ratios against a baseline run; returns the number of regressions."""
+    if baseline["environment"].get("corpus") != results["environment"]["corpus"]:
+        print("Note: the corpus differs from the baseline run; ratios may not be comparable")
+    if baseline["environment"].get("python") != results["environment"]["python"]:
+        print(f"Note: baseline used Python {baseline['environment'].get('python')}")
+
+    regressions = 0
+    print(f"\n{'Benchmark':<60} {'Baseline':>11} {'Current':>11} {'Ratio':>7}")
+    print("-" * 92)
+    for name, current in results["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if not before:
+            print(f"{name:<60} {'-':>11} {format_seconds(current['median'])} {'new':>7}")
+            continue
+        ratio = current["median"] / before["median"]
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "  slower"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            mark = "  faster"
+        print(f"{name:<60} {format_seconds(before['median'])} {format_seconds(current['median'])} {ratio:6.2f}x{mark}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark README table extraction on an offline corpus.")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Directory of README fixtures (*.md)")
+    parser.add_argument("--large-mb", type=float, default=2.0, help="Size of the generated large_card fixture in MB (0 to skip)")
+    parser.add_argument("--model-index-results", type=int, default=200,
+                        help="Result sets (20 metrics each) in the generated model-index for YAML benchmarks (0 to skip)")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per benchmark (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per sample (default: 0.2)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a JSON file from an earlier --output")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative median change reported as slower/faster (default: 0.10)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.large_mb)
+    if not corpus:
+        sys.exit(f"No *.md fixtures found in {args.corpus}")
+
+    results = {"environment": environment_info(corpus, args.model_index_results), "benchmarks": {}}
+    print(f"Corpus: {', '.join(f'{name} ({len(content) / 1024:.0f} KiB)' for name, content in corpus.items())}")
+    print(f"\n{'Benchmark':<60} {'Median':>11} {'Min':>11} {'Stdev':>8}")
+    print("-" * 93)
+
+    cases = build_cases(corpus)
+    if args.model_index_results > 0:
+        cases += build_serialization_cases(args.model_index_results)
+    for name, func in cases:
+        if args.filter not in name:
+            continue
+        # extract_metrics_from_table prints guidance when a model is missing
+        with redirect_stdout(io.StringIO()):
+            timing = time_case(func, args.repeat, args.min_time)
+        results["benchmarks"][name] = timing
+        spread = timing["stdev"] / timing["median"] * 100 if timing["median"] else 0.0
+        print(f"{name:<60} {format_seconds(timing['median'])} {format_seconds(timing['min'])} {spread:6.1f}%")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{regressions} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
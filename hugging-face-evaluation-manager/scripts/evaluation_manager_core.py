@@ -0,0 +1,6050 @@
+"""
+Manage evaluation results in Hugging Face model cards.
+
+Implementation of scripts/evaluation_manager.py, which runs main() and, when
+imported, stands in for this module. This module provides three methods:
+1. Extract evaluation tables from model README files
+2. Import evaluation scores from Artificial Analysis API
+3. Import local lighteval results and inspect logs
+
+All methods update the model-index metadata in model cards.
+"""
+
+import io
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext, redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache, wraps
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import argparse
+
+_MODULE_STARTED = time.perf_counter()
+
+
+# ============================================================================
+# Startup Profiling
+# ============================================================================
+
+
+class PhaseProfiler:
+    """
+    Wall-clock time per phase (import, env, fetch, parse, classify, extract, push)
+    and event counters (tables seen, cells parsed, cache hits, ...).
+
+    Phases are exclusive: while an inner phase runs, the outer one is paused, so
+    the phases of a single-threaded run add up to the time spent inside them.
+    Nothing is recorded unless enabled (--profile-startup / --metrics); otherwise
+    a phase or a count costs one attribute check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.startup_seconds: Optional[float] = None
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.seconds = {}
+        self.calls = {}
+        self.counters = {}
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Recorded values as plain data, e.g. to send back from a worker process."""
+        with self._lock:
+            return {"seconds": dict(self.seconds), "calls": dict(self.calls), "counters": dict(self.counters)}
+
+    def merge(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """Add the values of a snapshot taken in another process."""
+        with self._lock:
+            for attr in ("seconds", "calls", "counters"):
+                totals = getattr(self, attr)
+                for name, value in snapshot.get(attr, {}).items():
+                    totals[name] = totals.get(name, 0) + value
+
+    def _add(self, name: str, seconds: float, call: bool = False) -> None:
+        with self._lock:
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+            if call:
+                self.calls[name] = self.calls.get(name, 0) + 1
+
+    def phase(self, name: str):
+        """Context manager timing its body as `name`; a shared no-op when disabled."""
+        if not self.enabled:
+            return _NO_PHASE
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name: str):
+        stack = self._local.__dict__.setdefault("stack", [])
+        now = time.perf_counter()
+        if stack:
+            self._add(stack[-1][0], now - stack[-1][1])
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, started = stack.pop()
+            self._add(name, now - started, call=True)
+            if stack:
+                stack[-1][1] = now
+
+    def timed(self, name: str):
+        """Decorator running every call of a function inside a phase."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._phase(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def iterate(self, name: str, iterable: Iterable[Any]) -> Iterable[Any]:
+        """Yield from an iterator, timing the work done to produce each item."""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                item = next(iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            yield item
+
+    def report(self, total_seconds: float) -> Dict[str, Any]:
+        phases = {
+            name: {"ms": round(seconds * 1000, 2), "calls": self.calls.get(name, 0)}
+            for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1])
+        }
+        report: Dict[str, Any] = {}
+        if self.startup_seconds is not None:
+            report["startup_ms"] = round(self.startup_seconds * 1000, 2)
+        report["phases"] = phases
+        report["counters"] = dict(sorted(self.counters.items()))
+        report["total_ms"] = round(total_seconds * 1000, 2)
+        return report
+
+
+_EXHAUSTED = object()
+_NO_PHASE = nullcontext()
+PROFILER = PhaseProfiler()
+
+METRICS_PREFIX = "eval_manager"
+
+
+def render_openmetrics(report: Dict[str, Any]) -> str:
+    """Render a PhaseProfiler report in the OpenMetrics text format."""
+    command = report.get("command") or ""
+    lines = [
+        f"# TYPE {METRICS_PREFIX}_run_seconds gauge",
+        f"# HELP {METRICS_PREFIX}_run_seconds Wall-clock time of the run.",
+        f'{METRICS_PREFIX}_run_seconds{{command="{command}"}} {report["total_ms"] / 1000:.6f}',
+    ]
+    if "startup_ms" in report:
+        lines += [
+            f"# TYPE {METRICS_PREFIX}_startup_seconds gauge",
+            f"# HELP {METRICS_PREFIX}_startup_seconds Module body and argument parsing.",
+            f'{METRICS_PREFIX}_startup_seconds{{command="{command}"}} {report["startup_ms"] / 1000:.6f}',
+        ]
+    lines += [
+        f"# TYPE {METRICS_PREFIX}_phase_seconds counter",
+        f"# HELP {METRICS_PREFIX}_phase_seconds Exclusive wall-clock time per phase.",
+    ]
+    lines += [
+        f'{METRICS_PREFIX}_phase_seconds_total{{command="{command}",phase="{name}"}} {phase["ms"] / 1000:.6f}'
+        for name, phase in report["phases"].items()
+    ]
+    lines += [
+        f"# TYPE {METRICS_PREFIX}_phase_calls counter",
+        f"# HELP {METRICS_PREFIX}_phase_calls Number of times each phase was entered.",
+    ]
+    lines += [
+        f'{METRICS_PREFIX}_phase_calls_total{{command="{command}",phase="{name}"}} {phase["calls"]}'
+        for name, phase in report["phases"].items()
+    ]
+    for name, value in report["counters"].items():
+        lines += [
+            f"# TYPE {METRICS_PREFIX}_{name} counter",
+            f'{METRICS_PREFIX}_{name}_total{{command="{command}"}} {value}',
+        ]
+    buckets = report.get("rate_limit", {}).get("buckets", {})
+    if buckets:
+        lines += [
+            f"# TYPE {METRICS_PREFIX}_rate_limit_wait_seconds counter",
+            f"# HELP {METRICS_PREFIX}_rate_limit_wait_seconds Time requests queued in the rate limiter, per host.",
+        ]
+        lines += [
+            f'{METRICS_PREFIX}_rate_limit_wait_seconds_total{{command="{command}",bucket="{bucket}"}} {stat["wait_seconds"]:.6f}'
+            for bucket, stat in buckets.items()
+        ]
+        lines += [
+            f"# TYPE {METRICS_PREFIX}_rate_limit_requests counter",
+            f"# HELP {METRICS_PREFIX}_rate_limit_requests Requests that took a rate limiter token, per host.",
+        ]
+        lines += [
+            f'{METRICS_PREFIX}_rate_limit_requests_total{{command="{command}",bucket="{bucket}"}} {stat["requests"]}'
+            for bucket, stat in buckets.items()
+        ]
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def check_startup_budget(report: Dict[str, Any], budget_path: str) -> List[str]:
+    """
+    Compare a profile report against a JSON budget of milliseconds.
+
+    The budget maps "startup", "total" or a phase name to its limit, e.g.
+    {"startup": 150, "env": 20, "parse": 500}. Returns the exceeded entries.
+    """
+    with open(budget_path, encoding="utf-8") as f:
+        budget = json.load(f)
+    measured = {name: phase["ms"] for name, phase in report["phases"].items()}
+    measured["total"] = report["total_ms"]
+    if "startup_ms" in report:
+        measured["startup"] = report["startup_ms"]
+    return [
+        f"{name}: {measured[name]:.1f} ms > {limit} ms"
+        for name, limit in budget.items()
+        if name in measured and measured[name] > limit
+    ]
+
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load .env (once per process) if python-dotenv is available; keep help usable without it."""
+    with PROFILER.phase("env"):
+        try:
+            import dotenv  # type: ignore
+        except ModuleNotFoundError:
+            return
+        dotenv.load_dotenv()
+
+
+def require_markdown_it():
+    with PROFILER.phase("import"):
+        try:
+            from markdown_it import MarkdownIt  # type: ignore
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "markdown-it-py is required for table parsing. "
+                "Install with `uv add markdown-it-py` or `pip install markdown-it-py`."
+            ) from exc
+    return MarkdownIt
+
+
+def require_model_card():
+    with PROFILER.phase("import"):
+        try:
+            from huggingface_hub import ModelCard  # type: ignore
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "huggingface-hub is required for model card operations. "
+                "Install with `uv add huggingface_hub` or `pip install huggingface-hub`."
+            ) from exc
+    return ModelCard
+
+
+def require_hf_api():
+    with PROFILER.phase("import"):
+        try:
+            from huggingface_hub import HfApi  # type: ignore
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "huggingface-hub is required for model card operations. "
+                "Install with `uv add huggingface_hub` or `pip install huggingface-hub`."
+            ) from exc
+    return HfApi
+
+
+def require_requests():
+    with PROFILER.phase("import"):
+        try:
+            import requests  # type: ignore
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "requests is required for Artificial Analysis import. "
+                "Install with `uv add requests` or `pip install requests`."
+            ) from exc
+    return requests
+
+
+def require_numpy():
+    with PROFILER.phase("import"):
+        try:
+            import numpy  # type: ignore
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "numpy is required for table value extraction. "
+                "Install with `uv add numpy` or `pip install numpy`."
+            ) from exc
+    return numpy
+
+
+def require_yaml():
+    with PROFILER.phase("import"):
+        try:
+            import yaml  # type: ignore
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "PyYAML is required for YAML output. "
+                "Install with `uv add pyyaml` or `pip install pyyaml`."
+            ) from exc
+    return yaml
+
+
+# Key order of model-index mappings in emitted YAML; other keys follow in their original order
+MODEL_INDEX_KEY_ORDER = (
+    "name", "task", "dataset", "metrics", "results", "source",
+    "type", "config", "split", "revision", "value", "args", "verified", "verifyToken", "url",
+)
+_KEY_RANK = {key: rank for rank, key in enumerate(MODEL_INDEX_KEY_ORDER)}
+
+
+def ordered_model_index(value: Any) -> Any:
+    """Copy of a model-index with every mapping's keys in MODEL_INDEX_KEY_ORDER."""
+    if isinstance(value, dict):
+        keys = sorted(value, key=lambda k: _KEY_RANK.get(k, len(_KEY_RANK)))
+        return {k: ordered_model_index(value[k]) for k in keys}
+    if isinstance(value, list):
+        return [ordered_model_index(item) for item in value]
+    return value
+
+
+def _represent_float(dumper: Any, value: float) -> Any:
+    # 15 significant digits: 0.1 + 0.2 is written as 0.3, not 0.30000000000000004
+    return dumper.represent_float(float(f"{value:.15g}") if math.isfinite(value) else value)
+
+
+@lru_cache(maxsize=1)
+def _yaml_classes() -> Tuple[Any, Any]:
+    """(loader, dumper): libyaml's CSafeLoader/CSafeDumper when PyYAML was built with it."""
+    yaml = require_yaml()
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    class Dumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+        pass
+
+    Dumper.add_representer(float, _represent_float)
+    return loader, Dumper
+
+
+def load_yaml(text: str) -> Any:
+    """yaml.safe_load, through libyaml when available."""
+    return require_yaml().load(text, Loader=_yaml_classes()[0])
+
+
+def dump_yaml(data: Any, line_break: str = "\n") -> str:
+    """
+    Deterministic YAML for card metadata, through libyaml when available.
+
+    Keys keep their insertion order (use ordered_model_index for model-index
+    data), floats are written with at most 15 significant digits and non-ASCII
+    text is kept as is, so the same data always gives the same bytes.
+    """
+    return require_yaml().dump(
+        data,
+        Dumper=_yaml_classes()[1],
+        sort_keys=False,
+        allow_unicode=True,
+        default_flow_style=False,
+        line_break=line_break,
+    )
+
+
+# ============================================================================
+# Table Engine (parse once, reuse everywhere)
+# ============================================================================
+
+
+def parse_numeric_cell(cell: str) -> Optional[float]:
+    """Parse a table cell as a finite float, ignoring `%` and thousands separators."""
+    value_str = cell.replace("%", "").replace(",", "").strip()
+    if not value_str:
+        return None
+    try:
+        value = float(value_str)
+    except ValueError:
+        return None
+    # "nan"/"inf" placeholders are not scores
+    return value if math.isfinite(value) else None
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher compiled into a single alternation regex.
+
+    Equivalent to `any(keyword in text for keyword in keywords)`, but one regex
+    scan per text instead of one substring check per keyword. `search` also
+    reports which keyword matched (the longest one at the leftmost position),
+    and `benchmark_type` maps that match to its canonical metric type.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(k.strip().lower() for k in keywords if k.strip()))
+        # Longest first so "gsm8k" wins over "gsm" when both are known
+        alternation = "|".join(re.escape(k) for k in sorted(self.keywords, key=len, reverse=True))
+        self._pattern = re.compile(alternation) if alternation else None
+        # Registry lookup key and canonical type of each keyword that names a benchmark
+        index = _benchmark_index()
+        self.types: Dict[str, Tuple[str, str]] = {}
+        for keyword in self.keywords:
+            lookup_key = _benchmark_lookup_key(keyword)
+            if lookup_key in index:
+                self.types[keyword] = (lookup_key, index[lookup_key])
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the matched keyword, or None."""
+        if self._pattern is None:
+            return None
+        match = self._pattern.search(text.lower())
+        return match.group(0) if match else None
+
+    def benchmark_type(self, keyword: str, text: str) -> Optional[str]:
+        """
+        Canonical type of `text` when the keyword `search` found in it is the
+        whole text (ignoring case and punctuation) and names a registered
+        benchmark; None otherwise, e.g. for "MMLU-Pro" matched by "mmlu".
+        """
+        known = self.types.get(keyword)
+        if known and _benchmark_lookup_key(text) == known[0]:
+            return known[1]
+        return None
+
+    def extended(self, keywords: Iterable[str]) -> "KeywordMatcher":
+        return KeywordMatcher(self.keywords + tuple(keywords))
+
+
+# First-column headers that mark an evaluation table
+EVAL_TABLE_KEYWORDS = (
+    "benchmark", "task", "dataset", "eval", "test", "metric",
+    "mmlu", "humaneval", "gsm", "hellaswag", "arc", "winogrande",
+    "truthfulqa", "boolq", "piqa", "siqa"
+)
+
+# Column headers that look like benchmarks in transposed tables
+BENCHMARK_HEADER_KEYWORDS = (
+    "mmlu", "humaneval", "gsm", "hellaswag", "arc", "winogrande",
+    "eval", "score", "benchmark", "test", "math", "code", "mbpp",
+    "truthfulqa", "boolq", "piqa", "siqa", "drop", "squad"
+)
+
+# First-column headers that suggest models as rows
+MODEL_HEADER_KEYWORDS = ("model", "system", "llm", "name")
+
+# Canonical metric type -> (display name, other spellings of the benchmark).
+# Spellings are compared ignoring case, spaces and punctuation ("MMLU-Pro",
+# "mmlu_pro" and "MMLU Pro" are one name), so only genuinely different names
+# are listed. Every extractor derives metric.type through canonicalize().
+BENCHMARK_ALIASES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "mmlu": ("MMLU", ("Massive Multitask Language Understanding",)),
+    "mmlu_pro": ("MMLU-Pro", ()),
+    "mmlu_redux": ("MMLU-Redux", ()),
+    "mmmlu": ("MMMLU", ("Multilingual MMLU",)),
+    "gpqa": ("GPQA", ()),
+    "gpqa_diamond": ("GPQA Diamond", ("GPQA-D", "GPQA (Diamond)")),
+    "supergpqa": ("SuperGPQA", ()),
+    "hle": ("Humanity's Last Exam", ("HLE",)),
+    "arc_challenge": ("ARC-Challenge", ("ARC-C", "arc_c", "ARC (Challenge)")),
+    "arc_easy": ("ARC-Easy", ("ARC-E", "arc_e", "ARC (Easy)")),
+    "hellaswag": ("HellaSwag", ()),
+    "winogrande": ("WinoGrande", ()),
+    "truthfulqa": ("TruthfulQA", ()),
+    "boolq": ("BoolQ", ()),
+    "piqa": ("PIQA", ()),
+    "siqa": ("SIQA", ("Social IQa", "social_iqa")),
+    "bbh": ("BBH", ("BIG-Bench Hard", "BigBench Hard")),
+    "drop": ("DROP", ()),
+    "squad": ("SQuAD", ()),
+    "gsm8k": ("GSM8K", ()),
+    "math": ("MATH", ("Hendrycks MATH", "competition_math")),
+    "math_500": ("MATH-500", ()),
+    "math_hard": ("MATH Lvl 5", ("MATH Hard", "MATH Level 5")),
+    "aime_2024": ("AIME 2024", ("AIME24", "AIME 24")),
+    "aime_2025": ("AIME 2025", ("AIME25", "AIME 25")),
+    "humaneval": ("HumanEval", ()),
+    "humaneval_plus": ("HumanEval+", ()),
+    "mbpp": ("MBPP", ()),
+    "mbpp_plus": ("MBPP+", ()),
+    "livecodebench": ("LiveCodeBench", ("LCB",)),
+    "scicode": ("SciCode", ()),
+    "swe_bench_verified": ("SWE-bench Verified", ()),
+    "ifeval": ("IFEval", ()),
+    "ifbench": ("IFBench", ()),
+    "musr": ("MuSR", ()),
+    "mt_bench": ("MT-Bench", ()),
+    "arena_hard": ("Arena-Hard", ()),
+    "alpacaeval_2": ("AlpacaEval 2.0", ("AlpacaEval 2", "alpaca_eval_2")),
+    "artificial_analysis_intelligence_index": ("Artificial Analysis Intelligence Index", ()),
+    "artificial_analysis_coding_index": ("Artificial Analysis Coding Index", ()),
+    "artificial_analysis_math_index": ("Artificial Analysis Math Index", ()),
+}
+
+
+def _benchmark_lookup_key(name: str) -> str:
+    # "+" is significant (HumanEval vs HumanEval+); other punctuation is not
+    return re.sub(r"[\W_]+", "", name.replace("+", "plus").casefold())
+
+
+@lru_cache(maxsize=1)
+def _benchmark_index() -> Dict[str, str]:
+    """Lookup key of every registered spelling -> canonical type."""
+    index = {}
+    for canonical, (display, aliases) in BENCHMARK_ALIASES.items():
+        for spelling in (canonical, display, *aliases):
+            index.setdefault(_benchmark_lookup_key(spelling), canonical)
+    return index
+
+
+@lru_cache(maxsize=8192)
+def canonicalize(name: str) -> str:
+    """
+    Canonical metric type of a benchmark name.
+
+    Registered benchmarks map to their BENCHMARK_ALIASES key whatever the
+    spelling ("MMLU-Pro", "mmlu_pro", "**MMLU Pro**" -> "mmlu_pro"). Other
+    names become a lowercase underscore slug, so one name always gives one type.
+    """
+    cleaned = strip_markdown(name)
+    canonical = _benchmark_index().get(_benchmark_lookup_key(cleaned))
+    if canonical:
+        return canonical
+    slug = re.sub(r"[\W_]+", "_", cleaned.replace("+", "_plus").casefold()).strip("_")
+    return slug or cleaned.casefold()
+
+
+def benchmark_display_name(name: str, default: Optional[str] = None) -> str:
+    """Registry display name of a benchmark; `default` (or the name itself) if unknown."""
+    entry = BENCHMARK_ALIASES.get(canonicalize(name))
+    if entry:
+        return entry[0]
+    return name if default is None else default
+
+
+def register_benchmark(name: str, *aliases: str) -> str:
+    """
+    Add a benchmark or extra spellings of one to the registry.
+
+    If `name` is already known, the aliases are added to that entry; otherwise
+    a new entry is keyed by canonicalize(name) with `name` as its display name.
+
+    Returns:
+        The canonical type the names now map to
+    """
+    canonical = canonicalize(name)
+    display, known = BENCHMARK_ALIASES.get(canonical, (name, ()))
+    BENCHMARK_ALIASES[canonical] = (display, tuple(dict.fromkeys(known + aliases)))
+    clear_benchmark_caches()
+    return canonical
+
+
+def clear_benchmark_caches() -> None:
+    """Forget lookups derived from BENCHMARK_ALIASES (after it changed)."""
+    _benchmark_index.cache_clear()
+    canonicalize.cache_clear()
+    # Parsed tables memoize the canonical types of their cells
+    _parse_tables.cache_clear()
+
+
+# Built after the registry, whose canonical types they record
+EVAL_TABLE_MATCHER = KeywordMatcher(EVAL_TABLE_KEYWORDS)
+BENCHMARK_HEADER_MATCHER = KeywordMatcher(BENCHMARK_HEADER_KEYWORDS)
+MODEL_HEADER_MATCHER = KeywordMatcher(MODEL_HEADER_KEYWORDS)
+
+
+def load_benchmark_vocabulary(path: str) -> int:
+    """
+    Add benchmark names from a vocabulary file to the table classifiers.
+
+    The file lists one benchmark name per line; blank lines and `#` comments
+    are ignored. Names are matched as case-insensitive substrings of headers.
+    A line may also give other spellings of the benchmark after `=`, separated
+    by commas (`GPQA Diamond = GPQA-D, gpqa_d`); those spellings are then
+    reported under the same metric type (see canonicalize).
+
+    Returns:
+        Number of names read from the file
+    """
+    global EVAL_TABLE_MATCHER, BENCHMARK_HEADER_MATCHER
+    names = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            name, _, aliases = line.split("#", 1)[0].partition("=")
+            name = name.strip()
+            if not name:
+                continue
+            aliases = [alias.strip() for alias in aliases.split(",") if alias.strip()]
+            register_benchmark(name, *aliases)
+            names += [name, *aliases]
+    EVAL_TABLE_MATCHER = EVAL_TABLE_MATCHER.extended(names)
+    BENCHMARK_HEADER_MATCHER = BENCHMARK_HEADER_MATCHER.extended(names)
+    return len(names)
+
+
+def strip_markdown(text: str) -> str:
+    """Remove markdown links and bold from a table cell."""
+    cleaned = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)  # Remove markdown links
+    cleaned = re.sub(r'\*\*([^\*]+)\*\*', r'\1', cleaned)  # Remove bold
+    return cleaned.strip()
+
+
+@lru_cache(maxsize=4096)
+def _model_name_tokens(name: str) -> Tuple[FrozenSet[str], str]:
+    # Remove markdown formatting
+    cleaned = strip_markdown(name)
+
+    # Normalize and tokenize
+    normalized = cleaned.lower().replace("-", " ").replace("_", " ")
+    return frozenset(normalized.split()), normalized
+
+
+class ModelNameIndex:
+    """
+    Token-set index over the model names along one axis of a table.
+
+    Exact lookups are a dict hit on the normalized token set; fuzzy ranking only
+    scores names that share at least one token with the query.
+    """
+
+    def __init__(self, entries: List[Tuple[int, str, FrozenSet[str]]]):
+        """
+        Args:
+            entries: (table index, display name, name tokens) per candidate, in table order
+        """
+        self.entries = entries
+        self.exact: Dict[FrozenSet[str], int] = {}
+        self.by_token: Dict[str, List[int]] = {}
+        for position, (index, _, tokens) in enumerate(entries):
+            self.exact.setdefault(tokens, index)
+            for token in tokens:
+                self.by_token.setdefault(token, []).append(position)
+
+    @property
+    def labels(self) -> List[str]:
+        """Display names of all candidates with a non-empty name."""
+        return [name for _, name, tokens in self.entries if tokens]
+
+    def find(self, model_name: str) -> Optional[int]:
+        """Table index of the exact normalized match, or None."""
+        return self.exact.get(_model_name_tokens(model_name)[0])
+
+    def rank(self, model_name: str, limit: int = 5) -> List[Tuple[str, int, float]]:
+        """
+        Rank candidates by token overlap (Jaccard similarity) with model_name.
+
+        Returns:
+            Up to `limit` (display name, table index, score) tuples, best first
+        """
+        query = _model_name_tokens(model_name)[0]
+        positions = {p for token in query for p in self.by_token.get(token, ())}
+        scored = []
+        for position in positions:
+            index, name, tokens = self.entries[position]
+            scored.append((len(query & tokens) / len(query | tokens), position, name, index))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(name, index, score) for score, _, name, index in scored[:limit]]
+
+
+@dataclass(frozen=True)
+class ParsedTable:
+    """
+    A markdown table with its cells pre-processed for classification and extraction.
+
+    Attributes:
+        headers: Raw header cells
+        rows: Raw data rows
+        header_keys: Lowercased, stripped header cells
+        header_tokens: Normalized model-name tokens for each header cell
+        first_col_tokens: Normalized model-name tokens for the first cell of each row
+        values: Numeric value of each cell (None when the cell is not numeric)
+        matrix: Cell values as a float matrix (rows × widest row), NaN where not
+            numeric or missing
+        percent_mask: True where a numeric cell was written with a `%` suffix
+    """
+
+    headers: List[str]
+    rows: List[List[str]]
+    header_keys: List[str]
+    header_tokens: List[FrozenSet[str]]
+    first_col_tokens: List[FrozenSet[str]]
+    values: List[List[Optional[float]]]
+    matrix: Any = field(repr=False, compare=False)
+    percent_mask: Any = field(repr=False, compare=False)
+
+    @classmethod
+    def from_rows(cls, headers: List[str], rows: List[List[str]]) -> "ParsedTable":
+        """
+        Build a table from raw header and row cells.
+
+        Every cell is parsed once, in a single pass that fills the per-row
+        values, the float matrix and the percent mask together; classification
+        and extraction then work on the arrays. Placeholder cells repeated down
+        a leaderboard ("-", "N/A") are only parsed the first time.
+        """
+        np = require_numpy()
+        width = max((len(row) for row in rows), default=0)
+        nan = float("nan")
+        values, flat, percent = [], [], []
+        not_numeric = set()
+        for row in rows:
+            row_values = []
+            for cell in row:
+                value = None if cell in not_numeric else parse_numeric_cell(cell)
+                row_values.append(value)
+                if value is None:
+                    not_numeric.add(cell)
+                    flat.append(nan)
+                    percent.append(False)
+                else:
+                    flat.append(value)
+                    percent.append(cell.rstrip().endswith("%"))
+            padding = width - len(row)
+            flat += [nan] * padding
+            percent += [False] * padding
+            values.append(row_values)
+        return cls(
+            headers=headers,
+            rows=rows,
+            header_keys=[h.lower().strip() for h in headers],
+            header_tokens=[_model_name_tokens(h)[0] for h in headers],
+            first_col_tokens=[
+                _model_name_tokens(row[0])[0] if row else frozenset() for row in rows
+            ],
+            values=values,
+            matrix=np.array(flat, dtype=float).reshape(len(rows), width),
+            percent_mask=np.array(percent, dtype=bool).reshape(len(rows), width),
+        )
+
+    @cached_property
+    def digest(self) -> str:
+        """sha256 of the raw cells; equal for tables with identical content."""
+        import hashlib
+
+        payload = json.dumps([self.headers, self.rows], ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @cached_property
+    def numeric_mask(self):
+        """True where a cell holds a number."""
+        np = require_numpy()
+        return ~np.isnan(self.matrix)
+
+    @cached_property
+    def present_mask(self):
+        """True where a row actually has a cell (rows can be ragged)."""
+        np = require_numpy()
+        lengths = np.array([len(row) for row in self.rows], dtype=int)
+        return np.arange(self.matrix.shape[1]) < lengths[:, None]
+
+    @property
+    def has_numeric_values(self) -> bool:
+        return bool(self.numeric_mask.any())
+
+    @cached_property
+    def column_names(self) -> ModelNameIndex:
+        """Model-name index over the header cells (first column excluded)."""
+        return ModelNameIndex([
+            (i, header, self.header_tokens[i])
+            for i, header in enumerate(self.headers)
+            if i > 0 and header
+        ])
+
+    @cached_property
+    def row_names(self) -> ModelNameIndex:
+        """Model-name index over the first cell of each row (separator rows excluded)."""
+        entries = []
+        for i, row in enumerate(self.rows):
+            row_name = row[0].strip() if row and row[0] else ""
+            if row_name and not row_name.startswith("---"):
+                entries.append((i, row_name, self.first_col_tokens[i]))
+        return ModelNameIndex(entries)
+
+    @cached_property
+    def header_benchmarks(self) -> List[Optional[str]]:
+        """
+        Canonical type of each header cell that names a benchmark (None when no keyword matched).
+
+        A header that is exactly a registered benchmark keyword takes its type
+        from the match; only the others go through canonicalize.
+        """
+        matcher = BENCHMARK_HEADER_MATCHER
+        types = []
+        for header, key in zip(self.headers, self.header_keys):
+            keyword = matcher.search(key)
+            if keyword is None:
+                types.append(None)
+            else:
+                types.append(matcher.benchmark_type(keyword, header) or canonicalize(header))
+        return types
+
+    @cached_property
+    def header_types(self) -> List[str]:
+        """Canonical metric type of every header cell, reusing the benchmark matches."""
+        return [
+            matched or canonicalize(header)
+            for header, matched in zip(self.headers, self.header_benchmarks)
+        ]
+
+    @cached_property
+    def row_types(self) -> List[Optional[str]]:
+        """Canonical metric type of the first cell of each row (None for empty rows)."""
+        return [canonicalize(row[0]) if row and row[0].strip() else None for row in self.rows]
+
+
+def as_parsed_table(
+    header: Union[ParsedTable, List[str]],
+    rows: Optional[List[List[str]]] = None
+) -> ParsedTable:
+    """Accept either a ParsedTable or raw (header, rows) lists."""
+    if isinstance(header, ParsedTable):
+        return header
+    return ParsedTable.from_rows(header or [], rows or [])
+
+
+# ============================================================================
+# Method 1: Extract Evaluations from README
+# ============================================================================
+
+
+def extract_tables_from_markdown(markdown_content: str) -> List[str]:
+    """Extract all markdown tables from content."""
+    # Pattern to match markdown tables
+    table_pattern = r"(\|[^\n]+\|(?:\r?\n\|[^\n]+\|)+)"
+    tables = re.findall(table_pattern, markdown_content)
+    return tables
+
+
+def parse_markdown_table(table_str: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Parse a markdown table string into headers and rows.
+
+    Returns:
+        Tuple of (headers, data_rows)
+    """
+    lines = [line.strip() for line in table_str.strip().split("\n")]
+
+    # Remove separator line (the one with dashes)
+    lines = [line for line in lines if not re.match(r"^\|[\s\-:]+\|$", line)]
+
+    if len(lines) < 2:
+        return [], []
+
+    # Parse header
+    header = [cell.strip() for cell in lines[0].split("|")[1:-1]]
+
+    # Parse data rows
+    data_rows = []
+    for line in lines[1:]:
+        cells = [cell.strip() for cell in line.split("|")[1:-1]]
+        if cells:
+            data_rows.append(cells)
+
+    return header, data_rows
+
+
+@PROFILER.timed("classify")
+def is_evaluation_table(
+    header: Union[ParsedTable, List[str]],
+    rows: Optional[List[List[str]]] = None
+) -> bool:
+    """Determine if a table contains evaluation results."""
+    table = as_parsed_table(header, rows)
+    if not table.headers or not table.rows:
+        return False
+
+    # Check if first column looks like benchmark names
+    has_benchmark_header = EVAL_TABLE_MATCHER.search(table.header_keys[0]) is not None
+
+    # Check if there are numeric values in the table
+    is_eval = has_benchmark_header or table.has_numeric_values
+    if is_eval:
+        PROFILER.count("eval_tables")
+    return is_eval
+
+
+def normalize_model_name(name: str) -> tuple[set[str], str]:
+    """
+    Normalize a model name for matching.
+
+    Args:
+        name: Model name to normalize
+
+    Returns:
+        Tuple of (token_set, normalized_string)
+    """
+    tokens, normalized = _model_name_tokens(name)
+    return set(tokens), normalized
+
+
+def find_main_model_column(
+    header: Union[ParsedTable, List[str]], model_name: str
+) -> Optional[int]:
+    """
+    Identify the column index that corresponds to the main model.
+
+    Only returns a column if there's an exact normalized match with the model name.
+    This prevents extracting scores from training checkpoints or similar models.
+
+    Args:
+        header: Table column headers (or a ParsedTable)
+        model_name: Model name from repo_id (e.g., "OLMo-3-32B-Think")
+
+    Returns:
+        Column index of the main model, or None if no exact match found
+    """
+    table = as_parsed_table(header)
+    if not table.headers or not model_name:
+        return None
+
+    # Exact normalized token match only (first column holds benchmark names)
+    return table.column_names.find(model_name)
+
+
+def find_main_model_row(
+    rows: Union[ParsedTable, List[List[str]]], model_name: str
+) -> tuple[Optional[int], List[str]]:
+    """
+    Identify the row index that corresponds to the main model in a transposed table.
+
+    In transposed tables, each row represents a different model, with the first
+    column containing the model name.
+
+    Args:
+        rows: Table data rows (or a ParsedTable)
+        model_name: Model name from repo_id (e.g., "OLMo-3-32B")
+
+    Returns:
+        Tuple of (row_index, available_models)
+        - row_index: Index of the main model, or None if no exact match found
+        - available_models: List of all model names found in the table
+    """
+    table = rows if isinstance(rows, ParsedTable) else ParsedTable.from_rows([], rows or [])
+    if not table.rows or not model_name:
+        return None, []
+
+    # Exact normalized token match only (separator rows are not indexed)
+    return table.row_names.find(model_name), table.row_names.labels
+
+
+def is_transposed_table(
+    header: Union[ParsedTable, List[str]],
+    rows: Optional[List[List[str]]] = None
+) -> bool:
+    """
+    Determine if a table is transposed (models as rows, benchmarks as columns).
+
+    A table is considered transposed if:
+    - The first column contains model-like names (not benchmark names)
+    - Most other columns contain numeric values
+    - Header row contains benchmark-like names
+
+    Args:
+        header: Table column headers (or a ParsedTable)
+        rows: Table data rows
+
+    Returns:
+        True if table appears to be transposed, False otherwise
+    """
+    table = as_parsed_table(header, rows)
+    if not table.headers or not table.rows or len(table.headers) < 3:
+        return False
+
+    # Check if first column header suggests model names
+    has_model_header = MODEL_HEADER_MATCHER.search(table.header_keys[0]) is not None
+
+    # Check if remaining headers look like benchmarks
+    benchmark_header_count = sum(1 for match in table.header_benchmarks[1:] if match)
+    has_benchmark_headers = benchmark_header_count >= 2
+
+    # Check if data rows have numeric values in most columns (except first 5 rows, first column)
+    total_cells = int(table.present_mask[:5, 1:].sum())
+    numeric_count = int(table.numeric_mask[:5, 1:].sum())
+
+    has_numeric_data = total_cells > 0 and (numeric_count / total_cells) > 0.5
+
+    return (has_model_header or has_benchmark_headers) and has_numeric_data
+
+
+@PROFILER.timed("classify")
+def resolve_table_format(table: ParsedTable, table_format: str = "auto") -> str:
+    """
+    Resolve "auto" to the concrete layout of a table.
+
+    Returns:
+        "transposed" (models as rows), "rows" (benchmarks as rows) or
+        "columns" (benchmarks as columns); any explicit format is returned unchanged
+    """
+    if table_format != "auto":
+        return table_format
+
+    # First check if it's a transposed table (models as rows)
+    if is_transposed_table(table):
+        return "transposed"
+
+    # Check if first column header is empty/generic (indicates benchmarks in rows)
+    first_header = table.header_keys[0] if table.headers else ""
+    is_first_col_benchmarks = not first_header or first_header in ["", "benchmark", "task", "dataset", "metric", "eval"]
+
+    if is_first_col_benchmarks or not table.rows:
+        return "rows"
+
+    # Heuristic: if first row has mostly numeric values, benchmarks are columns
+    numeric_count = int(table.numeric_mask[0].sum())
+    return "columns" if numeric_count > len(table.rows[0]) / 2 else "rows"
+
+
+@PROFILER.timed("extract")
+def extract_metrics_for_all_models(
+    table: ParsedTable, table_format: str = "auto"
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Extract metrics for every model in a comparison or transposed table.
+
+    Models are the header columns (benchmarks as rows) or the first-column rows
+    (transposed tables). Each model is located through the table's name index,
+    so the table is parsed and classified only once.
+
+    Args:
+        table: Parsed table
+        table_format: Same values as extract_metrics_from_table
+
+    Returns:
+        Mapping of model name (as written in the table) to its metrics;
+        models without any numeric score are omitted
+    """
+    table_format = resolve_table_format(table, table_format)
+    per_model: Dict[str, List[Dict[str, Any]]] = {}
+
+    if table_format == "transposed":
+        for index, name, tokens in table.row_names.entries:
+            # Rows whose names normalize identically resolve to the first one
+            if not tokens or table.row_names.exact.get(tokens) != index:
+                continue
+            metrics = extract_metrics_from_table(table, table_format="transposed", model_name=name)
+            if metrics:
+                per_model[name] = metrics
+
+    elif table_format == "rows":
+        for index, name, _ in table.column_names.entries:
+            metrics = extract_metrics_from_table(table, table_format="rows", model_column_index=index)
+            if metrics:
+                per_model[name] = metrics
+
+    return per_model
+
+
+@PROFILER.timed("extract")
+def extract_metrics_from_table(
+    header: Union[ParsedTable, List[str]],
+    rows: Optional[List[List[str]]] = None,
+    table_format: str = "auto",
+    model_name: Optional[str] = None,
+    model_column_index: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extract metrics from parsed table data.
+
+    Args:
+        header: Table column headers, or a ParsedTable (then rows is ignored)
+        rows: Table data rows
+        table_format: "rows" (benchmarks as rows), "columns" (benchmarks as columns),
+                     "transposed" (models as rows, benchmarks as columns), or "auto"
+        model_name: Optional model name to identify the correct column/row
+
+    Returns:
+        List of metric dictionaries with name, type, and value
+    """
+    table = as_parsed_table(header, rows)
+    header, rows, values = table.headers, table.rows, table.values
+    metrics = []
+
+    table_format = resolve_table_format(table, table_format)
+
+    if table_format == "rows":
+        # Benchmarks are in rows, scores in columns
+        # Try to identify the main model column if model_name is provided
+        target_column = model_column_index
+        if target_column is None and model_name:
+            target_column = find_main_model_column(table, model_name)
+            # Comparison table without the model: say so instead of silently using the first score
+            model_columns = [
+                (index, name) for index, name, tokens in table.column_names.entries
+                if tokens and table.header_benchmarks[index] is None
+            ]
+            if target_column is None and len(model_columns) > 1:
+                print(f"\n⚠ Could not find model '{model_name}' among the table's columns")
+                print("Using the first numeric value of each row instead.")
+                closest = table.column_names.rank(model_name)
+                if closest:
+                    print("\nClosest matches:")
+                    for name, index, score in closest:
+                        print(f"  - {name}  (column {index}, {score:.0%} token overlap)")
+                print("\nAvailable model columns:")
+                for index, name in model_columns:
+                    print(f"  {index}. {name}")
+                suggestion = closest[0][1] if closest else model_columns[0][0]
+                print("\nTo pick a column, pass:")
+                print(f"  --model-column-index {suggestion}")
+
+        # First numeric column (after the benchmark name) of every row, in one pass
+        score_cells = table.numeric_mask[:, 1:]
+        if score_cells.shape[1]:
+            has_score = score_cells.any(axis=1)
+            first_score_col = score_cells.argmax(axis=1) + 1
+        else:
+            has_score = first_score_col = [False] * len(rows)
+
+        for r, row in enumerate(rows):
+            if not row:
+                continue
+
+            benchmark_name = row[0].strip()
+            if not benchmark_name:
+                continue
+
+            # If we identified a specific column, use it; otherwise use first numeric value
+            if target_column is not None and target_column < len(row):
+                value = values[r][target_column]
+                if value is not None:
+                    metrics.append({
+                        "name": benchmark_name,
+                        "type": table.row_types[r],
+                        "value": value
+                    })
+            elif has_score[r]:
+                # Only take first numeric value per row (original behavior)
+                i = int(first_score_col[r])
+
+                # Determine metric name
+                metric_name = benchmark_name
+                if len(header) > i and table.header_keys[i] not in ["score", "value", "result"]:
+                    metric_name = f"{benchmark_name} ({header[i]})"
+
+                metrics.append({
+                    "name": metric_name,
+                    "type": table.row_types[r],
+                    "value": values[r][i]
+                })
+
+    elif table_format == "transposed":
+        # Models are in rows (first column), benchmarks are in columns (header)
+        # Find the row that matches the target model
+        if not model_name:
+            print("Warning: model_name required for transposed table format")
+            return metrics
+
+        target_row_idx, available_models = find_main_model_row(table, model_name)
+
+        if target_row_idx is None:
+            print(f"\n⚠ Could not find model '{model_name}' in transposed table")
+            if available_models:
+                closest = table.row_names.rank(model_name)
+                if closest:
+                    print("\nClosest matches:")
+                    for name, _, score in closest:
+                        print(f"  - {name}  ({score:.0%} token overlap)")
+                print("\nAvailable models in table:")
+                for i, model in enumerate(available_models, 1):
+                    print(f"  {i}. {model}")
+                print("\nPlease select the correct model name from the list above.")
+                print("You can specify it using the --model-name-override flag:")
+                suggestion = closest[0][0] if closest else available_models[0]
+                print(f'  --model-name-override "{suggestion}"')
+            return metrics
+
+        np = require_numpy()
+        target_values = values[target_row_idx]
+
+        # Extract metrics from each numeric column (skip first column which is model name)
+        for i in np.flatnonzero(table.numeric_mask[target_row_idx, 1:len(header)]) + 1:
+            benchmark_name = header[i].strip()
+            if not benchmark_name:
+                continue
+
+            metrics.append({
+                "name": benchmark_name,
+                "type": table.header_types[i],
+                "value": target_values[i]
+            })
+
+    else:  # table_format == "columns"
+        # Benchmarks are in columns
+        if not rows:
+            return metrics
+
+        np = require_numpy()
+
+        # Use first data row for values
+        data_values = values[0]
+
+        for i in np.flatnonzero(table.numeric_mask[0, :len(header)]):
+            benchmark_name = header[i]
+            if not benchmark_name:
+                continue
+
+            metrics.append({
+                "name": benchmark_name,
+                "type": table.header_types[i],
+                "value": data_values[i]
+            })
+
+    return metrics
+
+
+def extract_evaluations_from_readme(
+    repo_id: str,
+    task_type: str = "text-generation",
+    dataset_name: str = "Benchmarks",
+    dataset_type: str = "benchmark",
+    model_name_override: Optional[str] = None,
+    table_index: Optional[int] = None,
+    model_column_index: Optional[int] = None,
+    readme_path: Optional[str] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extract evaluation results from a model's README.
+
+    Args:
+        repo_id: Hugging Face model repository ID
+        task_type: Task type for model-index (e.g., "text-generation")
+        dataset_name: Name for the benchmark dataset
+        dataset_type: Type identifier for the dataset
+        model_name_override: Override model name for matching (column header for comparison tables)
+        table_index: 1-indexed table number from inspect-tables output
+        readme_path: Read this local README instead of fetching repo_id's card
+
+    Returns:
+        Model-index formatted results or None if no evaluations found
+    """
+    try:
+        if readme_path:
+            return extract_evaluations_from_content(
+                local_readme_lines(readme_path),
+                repo_id,
+                task_type=task_type,
+                dataset_name=dataset_name,
+                dataset_type=dataset_type,
+                model_name_override=model_name_override,
+                table_index=table_index,
+                model_column_index=model_column_index
+            )
+
+        load_env()
+        hf_token = os.getenv("HF_TOKEN")
+        snapshot = load_card_snapshot(repo_id, token=hf_token)
+
+        return extract_evaluations_from_content(
+            snapshot.content,
+            repo_id,
+            task_type=task_type,
+            dataset_name=dataset_name,
+            dataset_type=dataset_type,
+            model_name_override=model_name_override,
+            table_index=table_index,
+            model_column_index=model_column_index,
+            tables=snapshot.tables() if snapshot.content else None
+        )
+
+    except Exception as e:
+        PROFILER.count("extract_errors")
+        print(f"Error extracting evaluations from README: {e}")
+        return None
+
+
+@PROFILER.timed("extract")
+def extract_evaluations_from_content(
+    readme_content: Union[str, Iterable[str]],
+    repo_id: str,
+    task_type: str = "text-generation",
+    dataset_name: str = "Benchmarks",
+    dataset_type: str = "benchmark",
+    model_name_override: Optional[str] = None,
+    table_index: Optional[int] = None,
+    model_column_index: Optional[int] = None,
+    tables: Optional[List[ParsedTable]] = None,
+    metrics_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extract evaluation results from README text that has already been fetched.
+
+    Takes the same options as extract_evaluations_from_readme; repo_id is used
+    for the default model name and the source URL. Pass `tables` when they are
+    already known (e.g. from the card cache) to skip markdown parsing.
+    `readme_content` may also be an iterable of lines (see local_readme_lines).
+
+    `metrics_cache` maps table digests to the metrics extracted from them by an
+    earlier run with the same options: selected tables found there are not
+    extracted again. On return it holds exactly the selected tables' entries.
+    """
+    if not readme_content:
+        print(f"No README content found for {repo_id}")
+        return None
+
+    # Extract model name from repo_id or use override
+    if model_name_override:
+        model_name = model_name_override
+        print(f"Using model name override: '{model_name}'")
+    else:
+        model_name = repo_id.split("/")[-1] if "/" in repo_id else repo_id
+
+    # Use markdown-it parser for accurate table extraction (streamed, so --table N stops early)
+    all_tables = tables if tables is not None else iter_tables(readme_content)
+    tables_to_process = select_tables(all_tables, table_index, repo_id)
+    if tables_to_process is None:
+        return None
+
+    # Extract metrics from selected table(s)
+    all_metrics = []
+    known_metrics = dict(metrics_cache or {})
+    for table in tables_to_process:
+        if metrics_cache is not None and table.digest in known_metrics:
+            PROFILER.count("tables_unchanged")
+            metrics = known_metrics[table.digest]
+        else:
+            metrics = extract_metrics_from_table(
+                table,
+                model_name=model_name,
+                model_column_index=model_column_index
+            )
+        if metrics_cache is not None:
+            metrics_cache[table.digest] = metrics
+        all_metrics.extend(metrics)
+
+    if metrics_cache is not None:
+        for digest in set(metrics_cache) - {table.digest for table in tables_to_process}:
+            del metrics_cache[digest]
+
+    if not all_metrics:
+        print(f"No metrics extracted from table")
+        return None
+
+    PROFILER.count("metrics_emitted", len(all_metrics))
+    return readme_results(all_metrics, repo_id, task_type, dataset_name, dataset_type)
+
+
+def select_tables(
+    all_tables: Iterable[ParsedTable], table_index: Optional[int], repo_id: str
+) -> Optional[List[ParsedTable]]:
+    """
+    Pick the table(s) to extract from: the --table selection, or the only evaluation table.
+
+    `all_tables` may be a lazy iterator (see iter_tables); with --table, nothing
+    after the selected table is consumed.
+
+    Prints guidance and returns None when the choice is ambiguous or invalid.
+    """
+    seen = 0
+    eval_tables = []
+    for table in all_tables:
+        seen += 1
+        PROFILER.count("tables_seen")
+        # If table_index specified, use that specific table
+        if table_index is not None:
+            if seen == table_index:
+                return [table]
+        # Filter to evaluation tables only
+        elif is_evaluation_table(table):
+            eval_tables.append(table)
+
+    if not seen:
+        print(f"No tables found in README for {repo_id}")
+        return None
+
+    if table_index is not None:
+        print(f"Invalid table index {table_index}. Found {seen} tables.")
+        print("Run inspect-tables to see available tables.")
+        return None
+
+    if len(eval_tables) > 1:
+        print(f"\n⚠ Found {len(eval_tables)} evaluation tables.")
+        print("Run inspect-tables first, then use --table to select one:")
+        print(f'  uv run scripts/evaluation_manager.py inspect-tables --repo-id "{repo_id}"')
+        return None
+    elif len(eval_tables) == 0:
+        print(f"No evaluation tables found in README for {repo_id}")
+        return None
+
+    return eval_tables
+
+
+def readme_results(
+    metrics: List[Dict[str, Any]],
+    repo_id: str,
+    task_type: str = "text-generation",
+    dataset_name: str = "Benchmarks",
+    dataset_type: str = "benchmark"
+) -> List[Dict[str, Any]]:
+    """Wrap README metrics in a model-index result set sourced from repo_id."""
+    return [{
+        "task": {"type": task_type},
+        "dataset": {
+            "name": dataset_name,
+            "type": dataset_type
+        },
+        "metrics": metrics,
+        "source": {
+            "name": "Model README",
+            "url": f"https://huggingface.co/{repo_id}"
+        }
+    }]
+
+
+@PROFILER.timed("extract")
+def extract_all_model_evaluations(
+    repo_id: str,
+    task_type: str = "text-generation",
+    dataset_name: str = "Benchmarks",
+    dataset_type: str = "benchmark",
+    table_index: Optional[int] = None,
+    readme_path: Optional[str] = None
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Extract model-index results for every model in a README comparison table.
+
+    One card fetch and one table parse serve all models; use map_models_to_repos
+    to route the results to their own repositories.
+
+    Args:
+        repo_id: Repository whose README holds the table
+        task_type: Task type for model-index (e.g., "text-generation")
+        dataset_name: Name for the benchmark dataset
+        dataset_type: Type identifier for the dataset
+        table_index: 1-indexed table number from inspect-tables output
+        readme_path: Read this local README instead of fetching repo_id's card
+
+    Returns:
+        Mapping of model name (as written in the table) to model-index results,
+        or None if nothing could be extracted
+    """
+    try:
+        if readme_path:
+            tables = iter_tables(local_readme_lines(readme_path))
+        else:
+            load_env()
+            hf_token = os.getenv("HF_TOKEN")
+            snapshot = load_card_snapshot(repo_id, token=hf_token)
+            if not snapshot.content:
+                print(f"No README content found for {repo_id}")
+                return None
+            tables = snapshot.tables()
+
+        selected = select_tables(tables, table_index, repo_id)
+        if selected is None:
+            return None
+
+        per_model = extract_metrics_for_all_models(selected[0])
+        if not per_model:
+            print("No per-model scores found; --all-models needs a comparison or transposed table")
+            return None
+        PROFILER.count("metrics_emitted", sum(map(len, per_model.values())))
+
+        return {
+            name: readme_results(metrics, repo_id, task_type, dataset_name, dataset_type)
+            for name, metrics in per_model.items()
+        }
+
+    except Exception as e:
+        PROFILER.count("extract_errors")
+        print(f"Error extracting evaluations from README: {e}")
+        return None
+
+
+def map_models_to_repos(
+    model_names: List[str],
+    target_repos: Optional[List[str]] = None,
+    name_map: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """
+    Match table model names to the repositories whose cards should receive them.
+
+    Args:
+        model_names: Model names as written in the table
+        target_repos: Repo ids matched by their name (e.g. "org/OLMo-3-7B" ↔ "**Olmo 3 7B**")
+        name_map: Explicit {table model name: repo id} pairs, for names that differ
+
+    Returns:
+        Mapping of table model name to repo id (unmatched names are left out)
+    """
+    by_tokens = {}
+    for name in model_names:
+        by_tokens.setdefault(_model_name_tokens(name)[0], name)
+
+    mapping = {}
+    for repo_id in target_repos or []:
+        name = by_tokens.get(_model_name_tokens(repo_id.split("/")[-1])[0])
+        if name is not None:
+            mapping[name] = repo_id
+        else:
+            print(f"⚠ No model in the table matches {repo_id}")
+    for table_name, repo_id in (name_map or {}).items():
+        name = by_tokens.get(_model_name_tokens(table_name)[0])
+        if name is not None:
+            mapping[name] = repo_id
+        else:
+            print(f"⚠ Model '{table_name}' from the name map is not in the table")
+    return mapping
+
+
+# ============================================================================
+# Table Inspection (using markdown-it-py for accurate parsing)
+# ============================================================================
+
+
+@lru_cache(maxsize=1)
+def _markdown_parser():
+    MarkdownIt = require_markdown_it()
+    # Disable linkify to avoid optional dependency errors; not needed for table parsing.
+    return MarkdownIt("gfm-like", {"linkify": False})
+
+
+def extract_tables_with_parser(markdown_content: str) -> List[ParsedTable]:
+    """
+    Extract tables from markdown using markdown-it-py parser.
+    Uses GFM (GitHub Flavored Markdown) which includes table support.
+
+    The README is tokenized once per distinct content; repeated calls in the
+    same process (inspect, then extract) reuse the parsed tables.
+    """
+    return list(_parse_tables(markdown_content))
+
+
+@lru_cache(maxsize=32)
+def _parse_tables(markdown_content: str) -> Tuple[ParsedTable, ...]:
+    return tuple(iter_tables(markdown_content))
+
+
+def _tables_from_tokens(tokens: List[Any]) -> List[ParsedTable]:
+    tables = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+
+        if token.type == "table_open":
+            table_data = {"headers": [], "rows": []}
+            current_row = []
+            in_header = False
+
+            i += 1
+            while i < len(tokens) and tokens[i].type != "table_close":
+                t = tokens[i]
+                if t.type == "thead_open":
+                    in_header = True
+                elif t.type == "thead_close":
+                    in_header = False
+                elif t.type == "tr_open":
+                    current_row = []
+                elif t.type == "tr_close":
+                    if in_header:
+                        table_data["headers"] = current_row
+                    else:
+                        table_data["rows"].append(current_row)
+                    current_row = []
+                elif t.type == "inline":
+                    current_row.append(t.content.strip())
+                i += 1
+
+            if table_data["headers"] or table_data["rows"]:
+                tables.append(ParsedTable.from_rows(table_data["headers"], table_data["rows"]))
+                PROFILER.count("cells_parsed", len(table_data["headers"]) + sum(map(len, table_data["rows"])))
+
+        i += 1
+
+    return tables
+
+
+@lru_cache(maxsize=1)
+def _block_parser():
+    """markdown-it with inline parsing switched off; only used to find block boundaries."""
+    MarkdownIt = require_markdown_it()
+    return MarkdownIt("gfm-like", {"linkify": False}).disable(["inline", "text_join"], ignoreInvalid=True)
+
+
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+
+# HTML blocks that may span blank lines (CommonMark types 1-5) and their terminators
+_HTML_SPAN_BLOCKS = [
+    (re.compile(r"^ {0,3}<(script|pre|style|textarea)(?=(\s|>|$))", re.IGNORECASE),
+     re.compile(r"</(script|pre|style|textarea)>", re.IGNORECASE)),
+    (re.compile(r"^ {0,3}<!--"), re.compile(r"-->")),
+    (re.compile(r"^ {0,3}<\?"), re.compile(r"\?>")),
+    (re.compile(r"^ {0,3}<![A-Z]"), re.compile(r">")),
+    (re.compile(r"^ {0,3}<!\[CDATA\["), re.compile(r"\]\]>")),
+]
+
+
+def _is_delimiter_row(line: str) -> bool:
+    stripped = line.strip().lstrip("> \t")  # tables may sit inside blockquotes
+    return "-" in stripped and not stripped.strip("|:- \t")
+
+
+def _block_is_closed(block: List[str]) -> bool:
+    """True if no fence or HTML block of `block` runs on past its trailing blank line."""
+    tokens = _block_parser().parse("".join(block))
+    return not any(
+        token.type in ("fence", "html_block") and token.map and token.map[1] >= len(block)
+        for token in tokens
+    )
+
+
+def iter_table_blocks(lines: Iterable[str]) -> Iterable[str]:
+    """
+    Split markdown into top-level blocks and yield the ones that may hold a table.
+
+    A block ends at a blank line followed by an unindented line, unless a code
+    fence or HTML block is still open there. Open constructs are tracked line by
+    line, and splits after blocks that may contain one are confirmed with a
+    block-level parse (no inline parsing), so tokenizing each block on its own
+    gives exactly the tables of the whole document. Only blocks where a line
+    containing `|` is followed by a delimiter row (`|---|:--:|`) are yielded.
+
+    Args:
+        lines: Lines with their line endings (a file object works)
+    """
+    block: List[str] = []
+    has_table = False
+    may_be_open = False  # block has a line that could open a fence or HTML block
+    after_blank = False
+    previous_line = ""
+    closer: Any = None  # closing fence (char, length) or HTML terminator of an open block
+
+    for line in lines:
+        blank = not line.strip(" \t\r\n")
+        if (after_blank and not blank and closer is None and line[:1] not in (" ", "\t")
+                and not (may_be_open and not _block_is_closed(block))):
+            if has_table:
+                yield "".join(block)
+            block, has_table, may_be_open = [], False, False
+        block.append(line)
+        after_blank = blank
+        if "<" in line or "```" in line or "~~~" in line:
+            may_be_open = True
+
+        # Cheap superset check; markdown-it has the final word when the block is parsed
+        if "|" in previous_line and _is_delimiter_row(line):
+            has_table = True
+        previous_line = line
+
+        if isinstance(closer, tuple):
+            closing = _FENCE_RE.match(line)
+            if (closing and closing.group(1)[0] == closer[0] and len(closing.group(1)) >= closer[1]
+                    and not line[closing.end():].strip(" \t\r\n")):
+                closer = None
+            continue
+        if closer is not None:
+            if closer.search(line):
+                closer = None
+            continue
+
+        opening = _FENCE_RE.match(line)
+        if opening and not (opening.group(1)[0] == "`" and "`" in line[opening.end():]):
+            closer = (opening.group(1)[0], len(opening.group(1)))
+            continue
+        for start_re, end_re in _HTML_SPAN_BLOCKS:
+            match = start_re.match(line)
+            if match:
+                if not end_re.search(line, match.start()):
+                    closer = end_re
+                break
+
+    if has_table:
+        yield "".join(block)
+
+
+def iter_tables(source: Union[str, Iterable[str]]) -> Iterable[ParsedTable]:
+    """
+    Yield the tables of a markdown document one at a time.
+
+    Only blocks that can contain a table are tokenized, one block at a time, so
+    memory stays proportional to the largest table rather than the document and
+    callers that stop early (see nth_table, first_evaluation_table) never parse
+    the rest of the README. Produces the same tables as extract_tables_with_parser.
+
+    Args:
+        source: Markdown text, or an iterable of lines such as an open file
+    """
+    if isinstance(source, str):
+        # markdown-it treats \r\n and lone \r as line breaks; only \n is split on below
+        source = io.StringIO(source.replace("\r\n", "\n").replace("\r", "\n"))
+    parser = _markdown_parser()
+    for block in PROFILER.iterate("parse", iter_table_blocks(source)):
+        with PROFILER.phase("parse"):
+            tables = _tables_from_tokens(parser.parse(block))
+        yield from tables
+
+
+def nth_table(source: Union[str, Iterable[str]], n: int) -> Optional[ParsedTable]:
+    """Return the n-th table (1-indexed) of a document, parsing no further than it."""
+    if n < 1:
+        return None
+    return next(islice(iter_tables(source), n - 1, None), None)
+
+
+def first_evaluation_table(source: Union[str, Iterable[str]]) -> Optional[ParsedTable]:
+    """Return the first table that looks like benchmark results, parsing no further than it."""
+    return next((table for table in iter_tables(source) if is_evaluation_table(table)), None)
+
+
+@PROFILER.timed("classify")
+def detect_table_format(table: ParsedTable, repo_id: str) -> Dict[str, Any]:
+    """Analyze a table to detect its format and identify model columns."""
+    headers = table.headers
+    rows = table.rows
+
+    if not headers or not rows:
+        return {"format": "unknown", "columns": headers, "model_columns": [], "row_count": 0, "sample_rows": []}
+
+    first_header = table.header_keys[0] if headers else ""
+    is_first_col_benchmarks = not first_header or first_header in ["", "benchmark", "task", "dataset", "metric", "eval"]
+
+    # Check for numeric columns (first 5 rows)
+    np = require_numpy()
+    sample = table.numeric_mask[:5].copy()
+    # Allow annotated scores such as "85.2 (±0.3)"
+    for r, c in zip(*np.nonzero(table.present_mask[:5] & ~sample)):
+        val = re.sub(r'\s*\([^)]*\)', '', rows[r][c])
+        if parse_numeric_cell(val) is not None:
+            sample[r, c] = True
+    column_counts = sample.sum(axis=0)
+    numeric_columns = [
+        col_idx for col_idx in range(1, min(len(headers), len(column_counts)))
+        if column_counts[col_idx] > len(rows[:5]) / 2
+    ]
+
+    # Determine format
+    if is_first_col_benchmarks and len(numeric_columns) > 1:
+        format_type = "comparison"
+    elif is_first_col_benchmarks and len(numeric_columns) == 1:
+        format_type = "simple"
+    elif len(numeric_columns) > len(headers) / 2:
+        format_type = "transposed"
+    else:
+        format_type = "unknown"
+
+    # Find model columns
+    model_columns = []
+    model_name = repo_id.split("/")[-1] if "/" in repo_id else repo_id
+    model_tokens, _ = _model_name_tokens(model_name)
+
+    for idx, header in enumerate(headers):
+        if idx == 0 and is_first_col_benchmarks:
+            continue
+        if header:
+            header_tokens = table.header_tokens[idx]
+            is_match = model_tokens == header_tokens
+            is_partial = model_tokens.issubset(header_tokens) or header_tokens.issubset(model_tokens)
+            model_columns.append({
+                "index": idx,
+                "header": header,
+                "is_exact_match": is_match,
+                "is_partial_match": is_partial and not is_match
+            })
+
+    return {
+        "format": format_type,
+        "columns": headers,
+        "model_columns": model_columns,
+        "row_count": len(rows),
+        "sample_rows": [row[0] for row in rows[:5] if row]
+    }
+
+
+def inspect_tables(repo_id: str, readme_path: Optional[str] = None) -> None:
+    """Inspect and display all evaluation tables in a model's README (or a local README file)."""
+    try:
+        if readme_path:
+            tables = list(iter_tables(local_readme_lines(readme_path)))
+        else:
+            load_env()
+            hf_token = os.getenv("HF_TOKEN")
+            snapshot = load_card_snapshot(repo_id, token=hf_token)
+
+            if not snapshot.content:
+                print(f"No README content found for {repo_id}")
+                return
+
+            tables = snapshot.tables()
+        PROFILER.count("tables_seen", len(tables))
+
+        if not tables:
+            print(f"No tables found in README for {repo_id}")
+            return
+
+        print(f"\n{'='*70}")
+        print(f"Tables found in README for: {repo_id}")
+        print(f"{'='*70}")
+
+        eval_table_count = 0
+        for table in tables:
+            analysis = detect_table_format(table, repo_id)
+
+            if analysis["format"] == "unknown" and not analysis.get("sample_rows"):
+                continue
+
+            eval_table_count += 1
+            print(f"\n## Table {eval_table_count}")
+            print(f"   Format: {analysis['format']}")
+            print(f"   Rows: {analysis['row_count']}")
+
+            print(f"\n   Columns ({len(analysis['columns'])}):")
+            for col_info in analysis.get("model_columns", []):
+                idx = col_info["index"]
+                header = col_info["header"]
+                if col_info["is_exact_match"]:
+                    print(f"      [{idx}] {header}  ✓ EXACT MATCH")
+                elif col_info["is_partial_match"]:
+                    print(f"      [{idx}] {header}  ~ partial match")
+                else:
+                    print(f"      [{idx}] {header}")
+
+            if analysis.get("sample_rows"):
+                print(f"\n   Sample rows (first column):")
+                for row_val in analysis["sample_rows"][:5]:
+                    print(f"      - {row_val}")
+
+        if eval_table_count == 0:
+            print("\nNo evaluation tables detected.")
+        else:
+            print("\nSuggested next step:")
+            source = f'--readme "{readme_path}"' if readme_path else f'--repo-id "{repo_id}"'
+            print(f'  uv run scripts/evaluation_manager.py extract-readme {source} --table <table-number> [--model-column-index <column-index>]')
+
+        print(f"\n{'='*70}\n")
+
+    except Exception as e:
+        print(f"Error inspecting tables: {e}")
+
+
+# ============================================================================
+# Model Card Fetching and Cache
+# ============================================================================
+
+
+def hf_endpoint() -> str:
+    """Base URL of the Hub; honours HF_ENDPOINT like huggingface_hub does."""
+    return os.getenv("HF_ENDPOINT", "https://huggingface.co").rstrip("/")
+
+
+def readme_url(repo_id: str, revision: str = "main") -> str:
+    return f"{hf_endpoint()}/{repo_id}/resolve/{revision}/README.md"
+
+
+@PROFILER.timed("fetch")
+def fetch_readme(
+    repo_id: str,
+    token: Optional[str] = None,
+    session: Any = None,
+    revision: str = "main"
+) -> str:
+    """
+    Download the raw README.md of a model repository (bypasses the card cache).
+
+    Args:
+        repo_id: Hugging Face model repository ID
+        token: Optional HF token for private repos
+        session: Optional requests.Session to reuse connections across calls
+        revision: Branch, tag or commit sha
+
+    Returns:
+        README text (including YAML front matter)
+    """
+    http = session or shared_session()
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    response = http.get(readme_url(repo_id, revision), headers=headers, timeout=30)
+    response.raise_for_status()
+    return response.text
+
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# RateLimit: "api";r=0;t=42 (remaining requests, seconds until the window resets)
+_RATELIMIT_RE = re.compile(r"\br=(\d+).*?\bt=(\d+)")
+
+
+def http_retries() -> int:
+    """Retries per GET on 429/5xx and dropped connections (EVAL_MANAGER_HTTP_RETRIES, default 3)."""
+    return max(0, int(os.getenv("EVAL_MANAGER_HTTP_RETRIES", "3")))
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta seconds or an HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Token buckets per (host, credential), shared by every pooled session and commit worker.
+
+    With a rate, each bucket refills at `rate` requests per second up to
+    `burst`; a request reserves the next token and waits for it, so workers go
+    out evenly spaced at the allowed rate. A 429 (its Retry-After) or a
+    RateLimit header announcing an exhausted quota pauses the whole bucket, so
+    every worker on that host and token waits once instead of retrying into the
+    limit. `budget` caps the requests of a run across all buckets.
+
+    Time spent waiting is recorded per bucket and as the "throttle" phase.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: Optional[int] = None, budget: Optional[int] = None):
+        self._lock = threading.Lock()
+        # Pauses outlive configure(): the server's window does not reset with a new command
+        self._paused_until: Dict[Tuple[str, str], float] = {}
+        self.configure(rate, burst, budget)
+
+    def configure(self, rate: float = 0.0, burst: Optional[int] = None, budget: Optional[int] = None) -> None:
+        """Set the limits for a run and reset its statistics."""
+        with self._lock:
+            self.rate = max(rate or 0.0, 0.0)
+            self.burst = burst or max(1, math.ceil(self.rate))
+            self.budget = budget
+            self.requests = 0
+            self._buckets: Dict[Tuple[str, str], List[float]] = {}
+            self._stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    @staticmethod
+    def key(url: str, headers: Any = None) -> Tuple[str, str]:
+        """Bucket of a request: its host and a digest of its credential (HF token or API key)."""
+        import hashlib
+        from urllib.parse import urlsplit
+
+        headers = headers or {}
+        credential = headers.get("Authorization") or headers.get("x-api-key") or ""
+        digest = hashlib.sha256(credential.encode("utf-8")).hexdigest()[:8] if credential else "anonymous"
+        return urlsplit(url).netloc, digest
+
+    def _stat(self, key: Tuple[str, str]) -> Dict[str, float]:
+        return self._stats.setdefault(key, {"requests": 0, "waits": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0,
+                                            "rate_limited": 0})
+
+    def acquire(self, key: Tuple[str, str]) -> float:
+        """
+        Take a token for one request to `key`, sleeping as long as needed.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RequestBudgetExceeded: If the run's request budget is used up
+        """
+        with self._lock:
+            if self.budget is not None and self.requests >= self.budget:
+                raise _http_classes()[1](f"request budget of {self.budget} requests exhausted")
+            self.requests += 1
+            self._stat(key)["requests"] += 1
+            now = time.monotonic()
+            wait = 0.0
+            if self.rate:
+                tokens, updated = self._buckets.get(key, (float(self.burst), now))
+                tokens = min(float(self.burst), tokens + (now - updated) * self.rate) - 1
+                self._buckets[key] = [tokens, now]
+                wait = max(0.0, -tokens / self.rate)
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = max(wait - waited, self._paused_until.get(key, 0.0) - time.monotonic())
+            if wait <= 0:
+                break
+            with PROFILER.phase("throttle"):
+                time.sleep(wait)
+            waited += wait
+
+        if waited:
+            PROFILER.count("rate_limit_waits")
+            with self._lock:
+                stat = self._stat(key)
+                stat["waits"] += 1
+                stat["wait_seconds"] += waited
+                stat["max_wait_seconds"] = max(stat["max_wait_seconds"], waited)
+        return waited
+
+    def pause(self, key: Tuple[str, str], seconds: float) -> None:
+        """Hold every request to `key` for `seconds` (e.g. a 429's Retry-After)."""
+        with self._lock:
+            self._paused_until[key] = max(self._paused_until.get(key, 0.0), time.monotonic() + seconds)
+
+    def observe(self, key: Tuple[str, str], response: Any, attempt: int = 0) -> Optional[float]:
+        """
+        Learn from a response's rate-limit headers.
+
+        Returns:
+            For a 429, the seconds the bucket is paused before a retry; else None
+        """
+        headers = getattr(response, "headers", None) or {}
+        if getattr(response, "status_code", None) == 429:
+            delay = retry_after_seconds(headers.get("Retry-After"))
+            if delay is None:
+                delay = min(60.0, 2 ** attempt) * random.uniform(0.5, 1.0)
+            PROFILER.count("rate_limited")
+            with self._lock:
+                self._stat(key)["rate_limited"] += 1
+            self.pause(key, delay)
+            return delay
+
+        # Quota used up but this request got through: wait for the window instead of drawing 429s
+        match = _RATELIMIT_RE.search(headers.get("RateLimit", ""))
+        remaining, reset = match.groups() if match else (headers.get("RateLimit-Remaining"), headers.get("RateLimit-Reset"))
+        if remaining is not None and reset is not None and remaining.strip() == "0":
+            try:
+                self.pause(key, float(reset))
+            except ValueError:
+                pass
+        return None
+
+    def report(self) -> Dict[str, Any]:
+        """Requests and queue waits per bucket (host and credential digest)."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "budget": self.budget,
+                "rate": self.rate or None,
+                "buckets": {
+                    f"{host}/{credential}": {name: round(value, 3) for name, value in stat.items()}
+                    for (host, credential), stat in sorted(self._stats.items())
+                },
+            }
+
+    def summary(self) -> Optional[str]:
+        """One line for stderr if requests had to wait or were rate limited, else None."""
+        with self._lock:
+            stats = list(self._stats.values())
+        waits = sum(stat["waits"] for stat in stats)
+        limited = sum(stat["rate_limited"] for stat in stats)
+        if not waits and not limited:
+            return None
+        total = sum(stat["wait_seconds"] for stat in stats)
+        longest = max(stat["max_wait_seconds"] for stat in stats)
+        return (
+            f"Rate limiter: {self.requests} requests, {waits} queued "
+            f"(waited {total:.1f}s in total, {longest:.1f}s at most), {limited} rate-limited responses"
+        )
+
+
+RATE_LIMITER = RateLimiter()
+
+
+@lru_cache(maxsize=1)
+def _http_classes() -> Tuple[Any, Any, Any]:
+    """(RateLimitedAdapter, RequestBudgetExceeded, ServerErrorRetry), built once requests is imported."""
+    requests = require_requests()
+    from urllib3.util import Retry
+
+    class ServerErrorRetry(Retry):
+        """urllib3 Retry that leaves 429s (even with Retry-After) to RateLimitedAdapter."""
+
+        RETRY_AFTER_STATUS_CODES = frozenset({413, 503})
+
+    class RequestBudgetExceeded(requests.RequestException):
+        """The run's --request-budget is used up; no further requests are sent."""
+
+    class RateLimitedAdapter(requests.adapters.HTTPAdapter):
+        """HTTPAdapter that takes a RATE_LIMITER token per request and waits out 429s."""
+
+        def send(self, request, **kwargs):
+            key = RATE_LIMITER.key(request.url, request.headers)
+            retries = http_retries() if request.method in ("GET", "HEAD") else 0
+            attempt = 0
+            while True:
+                RATE_LIMITER.acquire(key)
+                response = super().send(request, **kwargs)
+                if RATE_LIMITER.observe(key, response, attempt) is None or attempt >= retries:
+                    return response
+                # The bucket is paused for the Retry-After; acquire() waits for it
+                response.close()
+                attempt += 1
+
+    return RateLimitedAdapter, RequestBudgetExceeded, ServerErrorRetry
+
+
+def pooled_session(pool_size: int = 8):
+    """
+    A requests.Session whose connection pool fits `pool_size` concurrent workers.
+
+    Every request goes through RATE_LIMITER. GET and HEAD requests are retried
+    on 5xx responses and dropped connections with exponential backoff and
+    jitter, and on 429 once the host's Retry-After has passed. After the last
+    retry the response is returned as is, so callers still see the status
+    through raise_for_status().
+    """
+    requests = require_requests()
+    adapter_class, _, retry_class = _http_classes()
+
+    retry = retry_class(
+        total=http_retries(),
+        # 429s are handled by RateLimitedAdapter, which pauses every worker on the host
+        status_forcelist=RETRYABLE_STATUS_CODES - {429},
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        backoff_factor=0.5,
+        backoff_max=60,
+        backoff_jitter=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = adapter_class(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def shared_session():
+    """Process-wide pooled session, so repeated calls (e.g. under `serve`) reuse connections."""
+    return pooled_session(16)
+
+
+def cache_root() -> str:
+    """Directory for on-disk caches (EVAL_MANAGER_CACHE_DIR, else the XDG cache dir)."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.getenv("EVAL_MANAGER_CACHE_DIR") or os.path.join(cache_home, "hf-evaluation-manager")
+
+
+def cache_enabled() -> bool:
+    return os.getenv("EVAL_MANAGER_NO_CACHE", "").lower() not in ("1", "true", "yes")
+
+
+_YAML_BLOCK_RE = re.compile(r"^(\s*---[\r\n]+)([\S\s]*?)([\r\n]+---(\r\n|\n|$))")
+
+
+@PROFILER.timed("parse")
+def parse_card_metadata(content: str) -> Dict[str, Any]:
+    """Parse the YAML front matter of a model card into plain JSON-compatible data."""
+    match = _YAML_BLOCK_RE.search(content)
+    if not match:
+        return {}
+    data = load_yaml(match.group(2)) or {}
+    if not isinstance(data, dict):
+        return {}
+    # Round-trip through JSON so fresh and cached metadata look identical (dates become strings)
+    return json.loads(json.dumps(data, default=str))
+
+
+def replace_card_model_index(content: str, model_index: List[Dict[str, Any]]) -> str:
+    """
+    Card text with its model-index replaced by `model_index`.
+
+    Only the `model-index:` block of the front matter is rewritten; other
+    metadata and the card body are kept byte for byte, so the commit diff shows
+    just the evaluation changes. If the front matter cannot be edited in place
+    (e.g. anchors shared with other keys), all of it is re-serialized instead.
+    """
+    match = _YAML_BLOCK_RE.search(content)
+    if not match:
+        return f"---\n{dump_yaml({'model-index': ordered_model_index(model_index)})}---\n{content}"
+
+    front = match.group(2)
+    line_break = "\r\n" if "\r\n" in front else "\n"
+    block = dump_yaml({"model-index": ordered_model_index(model_index)}, line_break=line_break)
+    lines = front.splitlines(keepends=True)
+    start = next((i for i, line in enumerate(lines) if re.match(r"model-index\s*:", line)), None)
+    if start is None:
+        new_front = front + line_break + block.rstrip("\r\n")
+    else:
+        end = start + 1
+        # The block runs until the next top-level key (its items may start at column 0 with "-")
+        while end < len(lines) and (lines[end][:1] in (" ", "\t", "-", "#") or not lines[end].strip()):
+            end += 1
+        while end > start + 1 and (lines[end - 1][:1] == "#" or not lines[end - 1].strip()):
+            end -= 1
+        new_front = "".join(lines[:start]) + block + "".join(lines[end:])
+        if not front.endswith(("\n", "\r")):
+            new_front = new_front.rstrip("\r\n")
+
+    # The edit must leave every other key as it was (compare what YAML readers will see)
+    metadata = load_yaml(front) or {}
+    expected = dict(metadata, **load_yaml(block)) if isinstance(metadata, dict) else None
+    if expected is None or load_yaml(new_front) != expected:
+        new_front = dump_yaml(dict(expected or {}, **{"model-index": ordered_model_index(model_index)}), line_break)
+        new_front = new_front.rstrip("\r\n")
+    return content[:match.start(2)] + new_front + content[match.end(2):]
+
+
+@dataclass
+class CardSnapshot:
+    """
+    A model card README as seen at one point in time.
+
+    Attributes:
+        repo_id: Hugging Face model repository ID
+        revision: Requested branch, tag or commit
+        content: Raw README text (including YAML front matter)
+        data: Parsed YAML front matter (the equivalent of ModelCard.data)
+        digest: sha256 of content; cached artifacts are stored under it
+        etag: ETag returned by the Hub, used for conditional revalidation
+        commit_sha: Commit the README was resolved from (X-Repo-Commit), if known
+        from_cache: True when no download was needed
+    """
+
+    repo_id: str
+    revision: str
+    content: str
+    data: Dict[str, Any]
+    digest: str
+    etag: Optional[str] = None
+    commit_sha: Optional[str] = None
+    from_cache: bool = False
+    cache: Optional["CardCache"] = field(default=None, repr=False)
+
+    def tables(self) -> List[ParsedTable]:
+        """Tables in the README, read from the cache when they were extracted before."""
+        if self.cache is not None:
+            return self.cache.tables(self)
+        return extract_tables_with_parser(self.content)
+
+    def model_card(self):
+        """Build a huggingface_hub ModelCard from this snapshot (for pushing edits)."""
+        ModelCard = require_model_card()
+        return ModelCard(self.content)
+
+
+class CardCache:
+    """
+    Content-addressed on-disk cache of model card READMEs.
+
+    Layout under the cache root:
+        refs/<sha256(repo_id@revision)>.json   etag, commit sha and content digest of a ref
+        blobs/<digest>.md                      raw README
+        blobs/<digest>.json                    parsed YAML metadata and extracted tables
+
+    Refs younger than `ttl` seconds are served without touching the network; older
+    refs are revalidated with If-None-Match, so unchanged cards cost a 304. Refs
+    are touched on every read and the least recently used ones are evicted once
+    the blobs exceed `max_bytes`. The most recent snapshots are also kept in
+    memory, which is what makes repeated calls under `serve` cheap.
+    """
+
+    MEMORY_ENTRIES = 256
+
+    def __init__(
+        self,
+        root: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: float = 300.0,
+        enabled: bool = True
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self._memory: Dict[str, Tuple[float, CardSnapshot]] = {}
+
+    @classmethod
+    def from_env(cls) -> "CardCache":
+        """Configure from EVAL_MANAGER_CACHE_DIR / _CACHE_MAX_MB / _CACHE_TTL / _NO_CACHE."""
+        return cls(
+            root=cache_root(),
+            max_bytes=int(float(os.getenv("EVAL_MANAGER_CACHE_MAX_MB", "512")) * 1024 * 1024),
+            ttl=float(os.getenv("EVAL_MANAGER_CACHE_TTL", "300")),
+            enabled=cache_enabled(),
+        )
+
+    # -- paths -------------------------------------------------------------
+
+    def _ref_path(self, repo_id: str, revision: str) -> str:
+        import hashlib
+
+        key = hashlib.sha256(f"{repo_id}@{revision}".encode("utf-8")).hexdigest()
+        return os.path.join(self.root, "refs", f"{key}.json")
+
+    def _blob_path(self, digest: str, suffix: str) -> str:
+        return os.path.join(self.root, "blobs", f"{digest}{suffix}")
+
+    @staticmethod
+    def _read_json(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_atomic(path: str, text: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    # -- public API --------------------------------------------------------
+
+    @PROFILER.timed("fetch")
+    def load(
+        self,
+        repo_id: str,
+        revision: str = "main",
+        token: Optional[str] = None,
+        session: Any = None,
+        revalidate: bool = False
+    ) -> CardSnapshot:
+        """
+        Return the README of a repository, downloading it only when it changed.
+
+        Args:
+            repo_id: Hugging Face model repository ID
+            revision: Branch, tag or commit sha
+            token: Optional HF token for private repos
+            session: Optional requests.Session to reuse connections
+            revalidate: Always ask the Hub, even for refs younger than the TTL
+
+        Returns:
+            CardSnapshot for the current README
+        """
+        import hashlib
+
+        requests = require_requests()
+        ref_path = self._ref_path(repo_id, revision)
+        remembered = self._memory.get(ref_path) if self.enabled else None
+        if remembered and not revalidate and time.time() - remembered[0] < self.ttl:
+            PROFILER.count("card_cache_memory_hits")
+            return remembered[1]
+
+        ref = self._read_json(ref_path) if self.enabled else None
+        cached = self._snapshot_from_ref(repo_id, revision, ref) if ref else None
+
+        if cached and not revalidate and time.time() - ref.get("validated_at", 0) < self.ttl:
+            PROFILER.count("card_cache_disk_hits")
+            os.utime(ref_path)
+            self._remember(ref_path, ref["validated_at"], cached)
+            return cached
+
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        http = session or shared_session()
+        try:
+            response = http.get(readme_url(repo_id, revision), headers=headers, timeout=30)
+        except requests.RequestException as e:
+            if cached:
+                print(f"Warning: could not revalidate {repo_id} ({e}); using cached card", file=sys.stderr)
+                return cached
+            raise
+
+        if response.status_code == 304 and cached:
+            PROFILER.count("card_cache_revalidated")
+            ref["validated_at"] = time.time()
+            self._write_atomic(ref_path, json.dumps(ref))
+            self._remember(ref_path, ref["validated_at"], cached)
+            return cached
+
+        response.raise_for_status()
+        PROFILER.count("card_cache_misses")
+        content = response.text
+        snapshot = CardSnapshot(
+            repo_id=repo_id,
+            revision=revision,
+            content=content,
+            data=parse_card_metadata(content),
+            digest=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            etag=response.headers.get("ETag"),
+            commit_sha=response.headers.get("X-Repo-Commit"),
+            cache=self if self.enabled else None,
+        )
+        if self.enabled:
+            self._store(ref_path, snapshot)
+            self._remember(ref_path, time.time(), snapshot)
+        return snapshot
+
+    def tables(self, snapshot: CardSnapshot, parse: bool = True) -> Optional[List[ParsedTable]]:
+        """
+        Return the snapshot's tables, extracting and storing them on first use.
+
+        With parse=False, returns None instead of parsing when nothing is stored yet.
+        """
+        meta_path = self._blob_path(snapshot.digest, ".json")
+        meta = self._read_json(meta_path) or {"data": snapshot.data}
+        if "tables" in meta:
+            PROFILER.count("table_cache_hits")
+            return [ParsedTable.from_rows(t["headers"], t["rows"]) for t in meta["tables"]]
+        if not parse:
+            return None
+
+        tables = extract_tables_with_parser(snapshot.content)
+        self.store_tables(snapshot, [(t.headers, t.rows) for t in tables], meta)
+        return tables
+
+    def store_tables(
+        self,
+        snapshot: CardSnapshot,
+        cells: List[Tuple[List[str], List[List[str]]]],
+        meta: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record the (headers, rows) of a snapshot's tables parsed elsewhere, e.g. in a worker."""
+        if not self.enabled:
+            return
+        meta_path = self._blob_path(snapshot.digest, ".json")
+        if meta is None:
+            meta = self._read_json(meta_path) or {"data": snapshot.data}
+        meta["tables"] = [{"headers": headers, "rows": rows} for headers, rows in cells]
+        self._write_atomic(meta_path, json.dumps(meta))
+
+    def invalidate(self, repo_id: str, revision: str = "main") -> None:
+        """Forget a ref so the next load downloads the card again (e.g. after a push)."""
+        ref_path = self._ref_path(repo_id, revision)
+        self._memory.pop(ref_path, None)
+        try:
+            os.remove(ref_path)
+        except OSError:
+            pass
+
+    # -- internals ---------------------------------------------------------
+
+    def _remember(self, ref_path: str, validated_at: float, snapshot: CardSnapshot) -> None:
+        with self._lock:
+            self._memory.pop(ref_path, None)
+            self._memory[ref_path] = (validated_at, snapshot)
+            while len(self._memory) > self.MEMORY_ENTRIES:
+                self._memory.pop(next(iter(self._memory)))
+
+    def _snapshot_from_ref(
+        self, repo_id: str, revision: str, ref: Dict[str, Any]
+    ) -> Optional[CardSnapshot]:
+        digest = ref.get("digest", "")
+        meta = self._read_json(self._blob_path(digest, ".json"))
+        try:
+            with open(self._blob_path(digest, ".md"), encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            return None
+        return CardSnapshot(
+            repo_id=repo_id,
+            revision=revision,
+            content=content,
+            data=meta["data"] if meta and "data" in meta else parse_card_metadata(content),
+            digest=digest,
+            etag=ref.get("etag"),
+            commit_sha=ref.get("commit_sha"),
+            from_cache=True,
+            cache=self,
+        )
+
+    def _store(self, ref_path: str, snapshot: CardSnapshot) -> None:
+        blob_path = self._blob_path(snapshot.digest, ".md")
+        if not os.path.exists(blob_path):
+            self._write_atomic(blob_path, snapshot.content)
+            self._write_atomic(self._blob_path(snapshot.digest, ".json"), json.dumps({"data": snapshot.data}))
+            with self._lock:
+                if self._size is not None:
+                    self._size += len(snapshot.content.encode("utf-8"))
+        self._write_atomic(ref_path, json.dumps({
+            "repo_id": snapshot.repo_id,
+            "revision": snapshot.revision,
+            "etag": snapshot.etag,
+            "commit_sha": snapshot.commit_sha,
+            "digest": snapshot.digest,
+            "validated_at": time.time(),
+        }))
+        self._evict_if_needed()
+
+    def _blob_bytes(self) -> int:
+        total = 0
+        blobs_dir = os.path.join(self.root, "blobs")
+        if os.path.isdir(blobs_dir):
+            for entry in os.scandir(blobs_dir):
+                if entry.is_file():
+                    total += entry.stat().st_size
+        return total
+
+    def _evict_if_needed(self) -> None:
+        with self._lock:
+            if self._size is None:
+                self._size = self._blob_bytes()
+            if self._size <= self.max_bytes:
+                return
+
+            refs_dir = os.path.join(self.root, "refs")
+            refs = sorted(
+                (entry for entry in os.scandir(refs_dir) if entry.name.endswith(".json")),
+                key=lambda entry: entry.stat().st_mtime,
+            )
+            # Drop least recently used refs until we are under 80% of the budget
+            live = {}
+            for entry in refs:
+                ref = self._read_json(entry.path) or {}
+                live.setdefault(ref.get("digest"), []).append(entry.path)
+            target = self.max_bytes * 0.8
+            for entry in refs:
+                if self._size <= target:
+                    break
+                digest = (self._read_json(entry.path) or {}).get("digest")
+                os.remove(entry.path)
+                paths = live.get(digest, [])
+                if entry.path in paths:
+                    paths.remove(entry.path)
+                if digest and not paths:
+                    for suffix in (".md", ".json"):
+                        blob_path = self._blob_path(digest, suffix)
+                        try:
+                            self._size -= os.path.getsize(blob_path)
+                            os.remove(blob_path)
+                        except OSError:
+                            pass
+
+
+@lru_cache(maxsize=1)
+def get_card_cache() -> CardCache:
+    """Process-wide card cache configured from the environment."""
+    return CardCache.from_env()
+
+
+def load_card_snapshot(
+    repo_id: str,
+    token: Optional[str] = None,
+    session: Any = None,
+    revalidate: bool = False
+) -> CardSnapshot:
+    """Load a model card README through the process-wide cache."""
+    return get_card_cache().load(repo_id, token=token, session=session, revalidate=revalidate)
+
+
+# ============================================================================
+# Batch Extraction
+# ============================================================================
+
+
+def read_repo_ids(source: str) -> List[str]:
+    """Read repo ids (one per line, `#` comments allowed) from a file or `-` for stdin."""
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    repo_ids = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            repo_ids.append(line)
+    return repo_ids
+
+
+def _extract_readme_job(
+    repo_id: str,
+    readme_content: str,
+    options: Dict[str, Any],
+    instrument: bool = False,
+    keep_tables: bool = False
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Dict[str, Any]]]]:
+    """
+    Process-pool worker: run table extraction and capture its console output.
+
+    Returns the JSONL record and, with `instrument`, the worker's timings and
+    counters for the parent to merge. With `keep_tables`, every table of the
+    README is parsed up front and its cells are added to the record as
+    "tables", for the parent to store in its CardCache.
+    """
+    PROFILER.reset(enabled=instrument)
+    buffer = io.StringIO()
+    tables = None
+    try:
+        if keep_tables:
+            tables = extract_tables_with_parser(readme_content)
+            options = dict(options, tables=tables)
+        with redirect_stdout(buffer):
+            results = extract_evaluations_from_content(readme_content, repo_id, **options)
+    except Exception as e:
+        PROFILER.count("extract_errors")
+        record = {"repo_id": repo_id, "status": "error", "error": str(e)}
+    else:
+        messages = [line.strip() for line in buffer.getvalue().splitlines() if line.strip()]
+        record = {
+            "repo_id": repo_id,
+            "status": "ok" if results else "no_results",
+            "results": results or [],
+        }
+        if messages:
+            record["messages"] = messages
+        if options.get("metrics_cache") is not None:
+            # Taken out again by the parent for its ExtractionState
+            record["table_metrics"] = options["metrics_cache"]
+    if tables is not None:
+        record["tables"] = [(t.headers, t.rows) for t in tables]
+    return record, (PROFILER.snapshot() if instrument else None)
+
+
+class ExtractionState:
+    """
+    What the last extraction sweep saw per repo, for incremental re-runs.
+
+    Stored as one JSON file: for each repo the README commit sha and digest,
+    a fingerprint of the extraction options, the status of its last record and
+    the metrics of every selected table keyed by table digest. A repo whose
+    README is unchanged is skipped; a changed README only has its changed
+    tables extracted again (see extract_evaluations_from_content's
+    metrics_cache). The file is checkpointed every CHECKPOINT_EVERY updates
+    and saved when a sweep ends, also when it is aborted.
+    """
+
+    VERSION = 1
+    # Updates between saves, so an interrupted sweep keeps most of its progress
+    CHECKPOINT_EVERY = 100
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.repos: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        data = CardCache._read_json(self.path) or {}
+        if data.get("version") == self.VERSION:
+            self.repos = data.get("repos", {})
+
+    @staticmethod
+    def fingerprint(options: Dict[str, Any]) -> str:
+        """Digest of the options that shape the extracted metrics."""
+        import hashlib
+
+        payload = json.dumps(options, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def unchanged(self, repo_id: str, digest: str, commit_sha: Optional[str], fingerprint: str) -> bool:
+        """True if the README (same digest or same commit) was already extracted with these options."""
+        entry = self.repos.get(repo_id)
+        if not entry or entry.get("options") != fingerprint:
+            return False
+        return entry.get("digest") == digest or bool(commit_sha and entry.get("commit_sha") == commit_sha)
+
+    def table_metrics(self, repo_id: str, fingerprint: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Metrics per table digest from the last run (empty if the options changed)."""
+        entry = self.repos.get(repo_id)
+        if not entry or entry.get("options") != fingerprint:
+            return {}
+        return dict(entry.get("tables", {}))
+
+    def update(
+        self,
+        repo_id: str,
+        digest: str,
+        commit_sha: Optional[str],
+        fingerprint: str,
+        record: Dict[str, Any],
+        tables: Dict[str, List[Dict[str, Any]]]
+    ) -> None:
+        with self._lock:
+            self.repos[repo_id] = {
+                "commit_sha": commit_sha,
+                "digest": digest,
+                "options": fingerprint,
+                "status": record["status"],
+                "tables": tables,
+                "updated_at": time.time(),
+            }
+            self._unsaved += 1
+            checkpoint = self._unsaved >= self.CHECKPOINT_EVERY
+        if checkpoint:
+            self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            self._unsaved = 0
+            payload = json.dumps({"version": self.VERSION, "repos": self.repos}, ensure_ascii=False)
+        CardCache._write_atomic(self.path, payload)
+
+
+def extract_readme_batch(
+    repo_ids: List[str],
+    workers: int = 8,
+    processes: Optional[int] = None,
+    output: Any = None,
+    state: Optional[ExtractionState] = None,
+    **options: Any
+) -> Dict[str, int]:
+    """
+    Extract evaluations for many repositories, streaming one JSON line per repo.
+
+    READMEs are fetched concurrently by a bounded thread pool sharing one HTTP
+    session; parsing and metric extraction run in a process pool. Each line is
+    written as soon as its repo finishes, so output order follows completion.
+
+    Args:
+        repo_ids: Hugging Face model repository IDs
+        workers: Number of concurrent README downloads
+        processes: Size of the extraction process pool (default: CPU count)
+        output: Text stream for JSONL records (default: stdout)
+        state: Skip repos whose README did not change since the state was saved,
+            and reuse the metrics of unchanged tables (counted as "unchanged")
+        **options: Passed through to extract_evaluations_from_content
+
+    Returns:
+        Counts of records by status
+    """
+    load_env()
+    requests = require_requests()
+    hf_token = os.getenv("HF_TOKEN")
+    card_cache = get_card_cache()
+    output = output or sys.stdout
+    counts = {"ok": 0, "no_results": 0, "error": 0, "unchanged": 0}
+    fingerprint = ExtractionState.fingerprint(options)
+
+    session = pooled_session(workers)
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as process_pool, \
+                ThreadPoolExecutor(max_workers=workers) as fetch_pool:
+
+            def run(repo_id: str) -> Optional[Dict[str, Any]]:
+                # One bad card (malformed front matter, cache I/O, a dead worker) fails only its own record
+                try:
+                    return process(repo_id)
+                except requests.RequestException as e:
+                    return {"repo_id": repo_id, "status": "error", "error": f"fetch failed: {e}"}
+                except Exception as e:
+                    return {"repo_id": repo_id, "status": "error", "error": f"{type(e).__name__}: {e}"}
+
+            def process(repo_id: str) -> Optional[Dict[str, Any]]:
+                snapshot = card_cache.load(repo_id, token=hf_token, session=session)
+                if state and state.unchanged(repo_id, snapshot.digest, snapshot.commit_sha, fingerprint):
+                    return None
+                # Reuse tables extracted by an earlier run; otherwise the worker parses them
+                tables = card_cache.tables(snapshot, parse=False) if snapshot.from_cache else None
+                job_options = dict(options, tables=tables)
+                if state:
+                    job_options["metrics_cache"] = state.table_metrics(repo_id, fingerprint)
+                record, worker_metrics = process_pool.submit(
+                    _extract_readme_job, repo_id, snapshot.content, job_options, PROFILER.enabled,
+                    tables is None and card_cache.enabled
+                ).result()
+                if worker_metrics:
+                    PROFILER.merge(worker_metrics)
+                if "tables" in record:
+                    card_cache.store_tables(snapshot, record.pop("tables"))
+                table_metrics = record.pop("table_metrics", {})
+                if state and record["status"] != "error":
+                    state.update(repo_id, snapshot.digest, snapshot.commit_sha, fingerprint, record, table_metrics)
+                return record
+
+            futures = [fetch_pool.submit(run, repo_id) for repo_id in repo_ids]
+            for future in as_completed(futures):
+                record = future.result()
+                if record is None:
+                    counts["unchanged"] += 1
+                    continue
+                counts[record["status"]] += 1
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+    finally:
+        session.close()
+        if state:
+            # Keep what finished even when the batch is interrupted
+            state.save()
+    return counts
+
+
+# ============================================================================
+# Local README Files
+# ============================================================================
+
+
+# Cards at least this large are memory-mapped and streamed line by line
+MMAP_THRESHOLD = 1 << 20
+
+
+def local_readme_lines(path: str) -> Iterable[str]:
+    """
+    Yield the lines of a local README (with line endings normalized to \\n).
+
+    Files of MMAP_THRESHOLD bytes or more are memory-mapped, so iter_tables can
+    stream a multi-MB card through the page cache without holding it in memory.
+    """
+    import mmap
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            text = f.read().decode("utf-8", errors="replace")
+            yield from io.StringIO(text.replace("\r\n", "\n").replace("\r", "\n"))
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for raw in iter(mapped.readline, b""):
+                line = raw.decode("utf-8", errors="replace")
+                if "\r" in line:
+                    # markdown-it also breaks lines at a lone \r
+                    yield from io.StringIO(line.replace("\r\n", "\n").replace("\r", "\n"))
+                else:
+                    yield line
+
+
+def read_front_matter(path: str) -> Dict[str, Any]:
+    """Parse the YAML front matter of a local README, reading no further than its closing ---."""
+    head = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            head.append(line)
+            if len(head) == 1 and line.strip() != "---":
+                return {}
+            if len(head) > 1 and line.rstrip("\r\n") == "---":
+                break
+    return parse_card_metadata("".join(head))
+
+
+def find_local_readmes(root: str) -> List[str]:
+    """README.md files (any case) under root, skipping hidden directories such as .git."""
+    found = []
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+        found += [os.path.join(directory, name) for name in sorted(files) if name.lower() == "readme.md"]
+    return found
+
+
+def require_local_readmes(root: str) -> List[str]:
+    """README files under a --readme-dir; exits with an error if it is not a directory or has none."""
+    if not os.path.isdir(root):
+        sys.exit(f"error: --readme-dir {root} is not a directory")
+    paths = find_local_readmes(root)
+    if not paths:
+        sys.exit(f"error: no README.md found under {root}")
+    return paths
+
+
+def local_repo_id(path: str, root: Optional[str] = None) -> str:
+    """
+    Name a local README after its directory.
+
+    Under a --readme-dir root the relative directory is used (org/model for
+    root/org/model/README.md); otherwise the README's parent directory name.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if root:
+        relative = os.path.relpath(directory, os.path.abspath(root))
+        if relative != ".":
+            return relative.replace(os.sep, "/")
+    return os.path.basename(directory)
+
+
+def _extract_local_readme_job(
+    path: str, repo_id: str, options: Dict[str, Any], instrument: bool = False
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Dict[str, Any]]]]:
+    """Process-pool worker: like _extract_readme_job, reading the README from disk itself."""
+    record, metrics = _extract_readme_job(repo_id, local_readme_lines(path), options, instrument)
+    record["path"] = path
+    return record, metrics
+
+
+def extract_local_readme_batch(
+    paths: List[str],
+    root: Optional[str] = None,
+    processes: Optional[int] = None,
+    output: Any = None,
+    state: Optional[ExtractionState] = None,
+    **options: Any
+) -> Dict[str, int]:
+    """
+    Extract evaluations from local README files in parallel, streaming one JSON line per file.
+
+    No Hub requests are made: each worker process reads (memory-maps) its file
+    and runs the same extraction engine as extract_readme_batch.
+
+    Args:
+        paths: README files to process
+        root: Directory the paths were found under; names each record's repo_id
+        processes: Size of the extraction process pool (default: CPU count)
+        output: Text stream for JSONL records (default: stdout)
+        state: Skip files whose content did not change since the state was saved,
+            and reuse the metrics of unchanged tables (counted as "unchanged")
+        **options: Passed through to extract_evaluations_from_content
+
+    Returns:
+        Counts of records by status
+    """
+    output = output or sys.stdout
+    counts = {"ok": 0, "no_results": 0, "error": 0, "unchanged": 0}
+    fingerprint = ExtractionState.fingerprint(options)
+
+    import hashlib
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = {}
+            for path in paths:
+                repo_id = local_repo_id(path, root)
+                job_options = options
+                digest = None
+                if state:
+                    try:
+                        with open(path, "rb") as f:
+                            digest = hashlib.file_digest(f, "sha256").hexdigest()
+                    except OSError:
+                        pass  # reported by the worker
+                    if digest and state.unchanged(repo_id, digest, None, fingerprint):
+                        counts["unchanged"] += 1
+                        continue
+                    job_options = dict(options, metrics_cache=state.table_metrics(repo_id, fingerprint))
+                future = pool.submit(_extract_local_readme_job, path, repo_id, job_options, PROFILER.enabled)
+                futures[future] = (repo_id, digest)
+
+            for future in as_completed(futures):
+                record, worker_metrics = future.result()
+                if worker_metrics:
+                    PROFILER.merge(worker_metrics)
+                table_metrics = record.pop("table_metrics", {})
+                repo_id, digest = futures[future]
+                if state and digest and record["status"] != "error":
+                    state.update(repo_id, digest, None, fingerprint, record, table_metrics)
+                counts[record["status"]] += 1
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+    finally:
+        if state:
+            state.save()
+    return counts
+
+
+# ============================================================================
+# Pull Request Management
+# ============================================================================
+
+
+def discussions_url(repo_id: str) -> str:
+    return f"{hf_endpoint()}/api/models/{repo_id}/discussions"
+
+
+def _discussions_cache_path(repo_id: str) -> str:
+    import hashlib
+
+    key = hashlib.sha256(repo_id.encode("utf-8")).hexdigest()
+    return os.path.join(cache_root(), "discussions", f"{key}.json")
+
+
+@PROFILER.timed("fetch")
+def scan_open_prs(
+    repo_id: str,
+    token: Optional[str] = None,
+    session: Any = None,
+    revalidate: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every open pull request of a model repository, following all pages.
+
+    Pages are cached next to the card cache (discussions/<sha256(repo_id)>.json).
+    A scan younger than EVAL_MANAGER_CACHE_TTL is reused without a request, so a
+    get-prs-batch run doubles as the duplicate-PR check for a following push;
+    older scans are revalidated page by page with If-None-Match.
+
+    Args:
+        repo_id: Hugging Face model repository ID
+        token: Optional HF token for private repos
+        session: Optional requests.Session to reuse connections
+        revalidate: Ask the Hub even if the cached scan is fresh
+
+    Returns:
+        List of open PR dictionaries with num, title, author, and createdAt
+
+    Raises:
+        requests.RequestException: If the Hub cannot be reached and nothing is cached
+    """
+    requests = require_requests()
+    card_cache = get_card_cache()
+    cache_path = _discussions_cache_path(repo_id)
+    cached = CardCache._read_json(cache_path) if card_cache.enabled else None
+
+    if cached and not revalidate and time.time() - cached.get("validated_at", 0) < card_cache.ttl:
+        PROFILER.count("pr_scan_cache_hits")
+        return cached["open_prs"]
+
+    http = session or shared_session()
+    cached_pages = (cached or {}).get("pages", [])
+    pages = []
+    try:
+        page_index = 0
+        while True:
+            headers = {"Authorization": f"Bearer {token}"} if token else {}
+            if page_index < len(cached_pages) and cached_pages[page_index].get("etag"):
+                headers["If-None-Match"] = cached_pages[page_index]["etag"]
+            response = http.get(
+                discussions_url(repo_id),
+                params={"type": "pull_request", "status": "open", "p": page_index},
+                headers=headers,
+                timeout=30,
+                allow_redirects=True,
+            )
+            if response.status_code == 304:
+                PROFILER.count("pr_scan_pages_revalidated")
+                page = cached_pages[page_index]
+            else:
+                PROFILER.count("pr_scan_pages_fetched")
+                response.raise_for_status()
+                data = response.json()
+                page = {
+                    "etag": response.headers.get("ETag"),
+                    "discussions": data.get("discussions", []),
+                    "start": data.get("start", 0),
+                    "count": data.get("count", 0),
+                }
+            pages.append(page)
+            if not page["discussions"] or page["start"] + len(page["discussions"]) >= page["count"]:
+                break
+            page_index += 1
+    except requests.RequestException as e:
+        if cached:
+            print(f"Warning: could not refresh PRs of {repo_id} ({e}); using cached scan", file=sys.stderr)
+            return cached["open_prs"]
+        raise
+
+    open_prs = [
+        {
+            "num": d["num"],
+            "title": d["title"],
+            "author": (d.get("author") or {}).get("name", "unknown"),
+            "createdAt": d.get("createdAt", "unknown"),
+        }
+        for page in pages
+        for d in page["discussions"]
+        if d.get("status") == "open" and d.get("isPullRequest")
+    ]
+
+    if card_cache.enabled:
+        CardCache._write_atomic(cache_path, json.dumps({
+            "repo_id": repo_id,
+            "validated_at": time.time(),
+            "pages": pages,
+            "open_prs": open_prs,
+        }))
+    return open_prs
+
+
+def invalidate_open_prs(repo_id: str) -> None:
+    """Forget the cached PR scan of a repo (after opening a PR on it)."""
+    try:
+        os.remove(_discussions_cache_path(repo_id))
+    except OSError:
+        pass
+
+
+def token_username(token: Optional[str]) -> Optional[str]:
+    """Hub user name of an HF token (None without a token or if the Hub cannot tell)."""
+    return _whoami(hf_endpoint(), token) if token else None
+
+
+@lru_cache(maxsize=8)
+def _whoami(endpoint: str, token: str) -> Optional[str]:
+    requests = require_requests()
+    try:
+        response = shared_session().get(
+            f"{endpoint}/api/whoami-v2", headers={"Authorization": f"Bearer {token}"}, timeout=30
+        )
+        response.raise_for_status()
+        return response.json().get("name")
+    except (requests.RequestException, ValueError):
+        return None
+
+
+def find_duplicate_pr(
+    repo_id: str,
+    title: str,
+    token: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Return an open PR of repo_id with this title opened by the token's user, using the cached scan.
+
+    Titles alone are not enough: commit messages are often constant ("Extract
+    evaluation results from README"), so a PR by someone else, or with other
+    results, would hide new ones. Without a known user nothing is a duplicate.
+    """
+    author = token_username(token)
+    if not author:
+        return None
+    wanted = title.strip().casefold()
+    for pr in scan_open_prs(repo_id, token=token):
+        if pr["author"] == author and pr["title"].strip().casefold() == wanted:
+            return pr
+    return None
+
+
+def get_open_prs(repo_id: str) -> List[Dict[str, Any]]:
+    """
+    Fetch open pull requests for a Hugging Face model repository.
+
+    Args:
+        repo_id: Hugging Face model repository ID (e.g., "allenai/Olmo-3-32B-Think")
+
+    Returns:
+        List of open PR dictionaries with num, title, author, and createdAt
+    """
+    requests = require_requests()
+    load_env()
+
+    try:
+        return scan_open_prs(repo_id, token=os.getenv("HF_TOKEN"), revalidate=True)
+
+    except requests.RequestException as e:
+        print(f"Error fetching PRs from Hugging Face: {e}")
+        return []
+
+
+def get_open_prs_batch(
+    repo_ids: List[str],
+    workers: int = 8,
+    output: Any = None,
+    revalidate: bool = False
+) -> Dict[str, int]:
+    """
+    Scan open pull requests of many repositories, streaming one JSON line per repo.
+
+    Args:
+        repo_ids: Hugging Face model repository IDs
+        workers: Number of concurrent scans (sharing one pooled session)
+        output: Text stream for JSONL records (default: stdout)
+        revalidate: Ask the Hub even for repos scanned within the cache TTL
+
+    Returns:
+        Counts of records by status (with_prs, no_prs, error)
+    """
+    load_env()
+    requests = require_requests()
+    hf_token = os.getenv("HF_TOKEN")
+    output = output or sys.stdout
+    counts = {"with_prs": 0, "no_prs": 0, "error": 0}
+    session = pooled_session(workers)
+
+    def run(repo_id: str) -> Dict[str, Any]:
+        try:
+            prs = scan_open_prs(repo_id, token=hf_token, session=session, revalidate=revalidate)
+        except requests.RequestException as e:
+            return {"repo_id": repo_id, "status": "error", "error": str(e)}
+        return {"repo_id": repo_id, "status": "with_prs" if prs else "no_prs", "open_prs": prs}
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run, repo_id) for repo_id in repo_ids]
+        for future in as_completed(futures):
+            record = future.result()
+            counts[record["status"]] += 1
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+    session.close()
+    return counts
+
+
+def list_open_prs(repo_id: str) -> None:
+    """Display open pull requests for a model repository."""
+    prs = get_open_prs(repo_id)
+
+    print(f"\n{'='*70}")
+    print(f"Open Pull Requests for: {repo_id}")
+    print(f"{'='*70}")
+
+    if not prs:
+        print("\nNo open pull requests found.")
+    else:
+        print(f"\nFound {len(prs)} open PR(s):\n")
+        for pr in prs:
+            print(f"  PR #{pr['num']} - {pr['title']}")
+            print(f"     Author: {pr['author']}")
+            print(f"     Created: {pr['createdAt']}")
+            print(f"     URL: https://huggingface.co/{repo_id}/discussions/{pr['num']}")
+            print()
+
+    print(f"{'='*70}\n")
+
+
+# ============================================================================
+# Method 2: Import from Artificial Analysis
+# ============================================================================
+
+
+AA_MODELS_URL = "https://artificialanalysis.ai/api/v2/data/llms/models"
+
+# In-process catalogue index: (creator_slug, model_slug) -> model data
+_aa_catalogue: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
+
+
+def _index_aa_models(models: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    index = {}
+    for model in models:
+        creator = model.get("model_creator") or {}
+        index[(creator.get("slug"), model.get("slug"))] = model
+    return index
+
+
+@PROFILER.timed("fetch")
+def load_aa_catalogue(refresh: bool = False) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Return the Artificial Analysis model catalogue indexed by (creator_slug, model_slug).
+
+    The catalogue is downloaded at most once per process and kept on disk for
+    AA_CATALOGUE_TTL seconds (default 3600), so repeated lookups and separate
+    import-aa runs share a single API round trip.
+
+    Args:
+        refresh: Ignore cached copies and download the catalogue again
+
+    Returns:
+        Dictionary mapping (creator_slug, model_slug) to model data
+    """
+    global _aa_catalogue
+    if _aa_catalogue is not None and not refresh:
+        return _aa_catalogue
+
+    load_env()
+    cache_path = os.path.join(cache_root(), "aa-models.json")
+    ttl = float(os.getenv("AA_CATALOGUE_TTL", "3600"))
+
+    if cache_enabled() and not refresh:
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if time.time() - cached.get("fetched_at", 0) < ttl:
+                PROFILER.count("aa_catalogue_cache_hits")
+                _aa_catalogue = _index_aa_models(cached.get("data", []))
+                return _aa_catalogue
+        except (OSError, ValueError):
+            pass
+
+    AA_API_KEY = os.getenv("AA_API_KEY")
+    if not AA_API_KEY:
+        raise ValueError("AA_API_KEY environment variable is not set")
+
+    response = shared_session().get(AA_MODELS_URL, headers={"x-api-key": AA_API_KEY}, timeout=30)
+    response.raise_for_status()
+    PROFILER.count("aa_catalogue_cache_misses")
+    models = response.json().get("data", [])
+
+    if cache_enabled():
+        CardCache._write_atomic(cache_path, json.dumps({"fetched_at": time.time(), "data": models}))
+
+    _aa_catalogue = _index_aa_models(models)
+    return _aa_catalogue
+
+
+def get_aa_model_data(creator_slug: str, model_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch model evaluation data from Artificial Analysis API.
+
+    Args:
+        creator_slug: Creator identifier (e.g., "anthropic", "openai")
+        model_name: Model slug/identifier
+
+    Returns:
+        Model data dictionary or None if not found
+    """
+    requests = require_requests()
+
+    try:
+        model = load_aa_catalogue().get((creator_slug, model_name))
+    except requests.RequestException as e:
+        print(f"Error fetching data from Artificial Analysis: {e}")
+        return None
+
+    if model is None:
+        print(f"Model {creator_slug}/{model_name} not found in Artificial Analysis")
+    return model
+
+
+@PROFILER.timed("extract")
+def aa_data_to_model_index(
+    model_data: Dict[str, Any],
+    dataset_name: str = "Artificial Analysis Benchmarks",
+    dataset_type: str = "artificial_analysis",
+    task_type: str = "evaluation"
+) -> List[Dict[str, Any]]:
+    """
+    Convert Artificial Analysis model data to model-index format.
+
+    Args:
+        model_data: Raw model data from AA API
+        dataset_name: Dataset name for model-index
+        dataset_type: Dataset type identifier
+        task_type: Task type for model-index
+
+    Returns:
+        Model-index formatted results
+    """
+    model_name = model_data.get("name", model_data.get("slug", "unknown-model"))
+    evaluations = model_data.get("evaluations", {})
+
+    if not evaluations:
+        print(f"No evaluations found for model {model_name}")
+        return []
+
+    metrics = []
+    for key, value in evaluations.items():
+        if value is not None:
+            metrics.append({
+                "name": benchmark_display_name(key, default=key.replace("_", " ").title()),
+                "type": canonicalize(key),
+                "value": value
+            })
+
+    PROFILER.count("metrics_emitted", len(metrics))
+    results = [{
+        "task": {"type": task_type},
+        "dataset": {
+            "name": dataset_name,
+            "type": dataset_type
+        },
+        "metrics": metrics,
+        "source": {
+            "name": "Artificial Analysis API",
+            "url": "https://artificialanalysis.ai"
+        }
+    }]
+
+    return results
+
+
+def import_aa_evaluations(
+    creator_slug: str,
+    model_name: str,
+    repo_id: str
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Import evaluation results from Artificial Analysis for a model.
+
+    Args:
+        creator_slug: Creator identifier in AA
+        model_name: Model identifier in AA
+        repo_id: Hugging Face repository ID to update
+
+    Returns:
+        Model-index formatted results or None if import fails
+    """
+    model_data = get_aa_model_data(creator_slug, model_name)
+
+    if not model_data:
+        return None
+
+    results = aa_data_to_model_index(model_data)
+    return results
+
+
+def read_aa_import_specs(source: str) -> List[Tuple[str, str, str]]:
+    """
+    Read `creator-slug/model-slug repo-id` pairs (one per line) from a file or `-`.
+
+    Returns:
+        List of (creator_slug, model_slug, repo_id) tuples
+    """
+    specs = []
+    for line in read_repo_ids(source):
+        parts = line.split()
+        if len(parts) != 2 or "/" not in parts[0]:
+            raise ValueError(f"Expected '<creator-slug>/<model-slug> <repo-id>', got: {line!r}")
+        creator_slug, model_slug = parts[0].split("/", 1)
+        specs.append((creator_slug, model_slug, parts[1]))
+    return specs
+
+
+def import_aa_batch(
+    specs: List[Tuple[str, str, str]],
+    create_pr: bool = False,
+    dry_run: bool = False,
+    workers: int = 4,
+    journal: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Import Artificial Analysis evaluations for many models from one catalogue fetch.
+
+    Card updates go through a CommitQueue, so they are pushed concurrently and
+    retried on rate limits and server errors.
+
+    Args:
+        specs: (creator_slug, model_slug, repo_id) tuples
+        create_pr: Whether to create PRs instead of direct pushes
+        dry_run: Print the model-index YAML instead of updating cards
+        workers: Concurrent pushes
+        journal: Optional commit journal path for resuming an interrupted run
+
+    Returns:
+        Counts of updated, missing and failed models
+    """
+    catalogue = load_aa_catalogue()
+    counts = {"updated": 0, "not_found": 0, "failed": 0}
+    queue = CommitQueue(create_pr=create_pr, workers=workers, journal=journal)
+
+    for creator_slug, model_slug, repo_id in specs:
+        model_data = catalogue.get((creator_slug, model_slug))
+        if model_data is None:
+            print(f"✗ {creator_slug}/{model_slug} not found in Artificial Analysis")
+            counts["not_found"] += 1
+            continue
+
+        results = aa_data_to_model_index(model_data)
+        if not results:
+            counts["failed"] += 1
+            continue
+
+        if dry_run:
+            print(f"\n# {repo_id} ← {creator_slug}/{model_slug}")
+            print(dump_yaml({"model-index": ordered_model_index([{"name": repo_id.split("/")[-1], "results": results}])}))
+            counts["updated"] += 1
+            continue
+
+        queue.add(repo_id, results, commit_message=f"Add Artificial Analysis evaluations for {model_slug}")
+
+    if queue.pending:
+        pushed = queue.run()
+        counts["failed"] += pushed.pop("error")
+        counts["updated"] += sum(pushed.values())
+
+    return counts
+
+
+# ============================================================================
+# Method 3: Import from Local Evaluation Logs (lighteval, inspect)
+# ============================================================================
+
+LIGHTEVAL_URL = "https://github.com/huggingface/lighteval"
+INSPECT_URL = "https://inspect.aisi.org.uk"
+
+_JSON_STRUCTURE_RE = re.compile(r'["\[\]{}]')
+_JSON_STRING_BODY_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_SKIPPED = object()
+
+
+def iter_json_members(f: Any, keys: Iterable[str], chunk_size: int = 1 << 16) -> Iterable[Tuple[str, Any]]:
+    """
+    Stream the top-level members of a JSON object from a text file.
+
+    Yields (key, value) in file order. Only members named in `keys` are decoded;
+    the others are yielded with the `_SKIPPED` sentinel and scanned past without
+    building Python objects, and only when the caller asks for the next member.
+    Callers that stop early therefore never read the rest of the file (the
+    samples of an inspect log come after its results).
+
+    Raises:
+        ValueError: If the file is not a JSON object
+    """
+    keys = set(keys)
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+    # Start of the value being decoded; the buffer is kept from there on
+    mark: Optional[int] = None
+
+    def fill() -> None:
+        nonlocal buf, pos, eof, mark
+        keep = pos if mark is None else mark
+        # While a value is being decoded, read as much again as is buffered, so
+        # a value spanning many chunks is re-parsed a logarithmic number of times
+        chunk = f.read(chunk_size if mark is None else max(chunk_size, len(buf) - keep))
+        buf, pos = buf[keep:] + chunk, pos - keep
+        if mark is not None:
+            mark = 0
+        eof = not chunk
+
+    def skip_ws() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf[pos:pos + 1]
+            fill()
+
+    def decode(parse: Any) -> Any:
+        nonlocal pos, mark
+        # Each retry parses from the start of the value again; since every
+        # fill() doubles the buffer, the retries cost at most twice one parse
+        mark = pos
+        while True:
+            try:
+                value, end = parse()
+            except (ValueError, IndexError):
+                if eof:
+                    raise ValueError("truncated or invalid JSON") from None
+                fill()
+                continue
+            # Only accept a value followed by a delimiter: "0." may be "0.25" cut by the chunk
+            if eof or (end < len(buf) and buf[end] in " \t\r\n,:]}"):
+                pos, mark = end, None
+                return value
+            fill()
+
+    def skip_value() -> None:
+        nonlocal pos
+        depth, in_string = 0, False
+        if skip_ws() not in ('"', "[", "{"):
+            decode(lambda: decoder.raw_decode(buf, pos))
+            return
+        while True:
+            if in_string:
+                pos = _JSON_STRING_BODY_RE.match(buf, pos).end()
+                if pos >= len(buf) or buf[pos] != '"':
+                    # Chunk ends inside the string (possibly right after a backslash)
+                    if eof:
+                        raise ValueError("unterminated string in JSON")
+                    fill()
+                    continue
+                pos += 1
+                in_string = False
+                if depth == 0:
+                    return
+                continue
+            match = _JSON_STRUCTURE_RE.search(buf, pos)
+            if match is None:
+                if eof:
+                    raise ValueError("unexpected end of JSON")
+                pos = len(buf)
+                fill()
+                continue
+            pos = match.end()
+            char = match.group(0)
+            if char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    fill()
+    if skip_ws() != "{":
+        raise ValueError("expected a JSON object")
+    pos += 1
+    first = True
+    while True:
+        char = skip_ws()
+        if char == "}":
+            return
+        if not first:
+            if char != ",":
+                raise ValueError("expected ',' between members")
+            pos += 1
+            skip_ws()
+        first = False
+        if skip_ws() != '"':
+            raise ValueError("expected a member name")
+        key = decode(lambda: json.decoder.scanstring(buf, pos + 1))
+        if skip_ws() != ":":
+            raise ValueError(f"expected ':' after {key!r}")
+        pos += 1
+        if key in keys:
+            skip_ws()
+            yield key, decode(lambda: decoder.raw_decode(buf, pos))
+        else:
+            yield key, _SKIPPED
+            skip_value()
+
+
+@dataclass
+class EvalRun:
+    """
+    Results of one evaluation run found on disk.
+
+    Attributes:
+        source: Result source that read it ("lighteval" or "inspect")
+        path: Results file
+        model: Model id as recorded by the harness (provider prefix removed)
+        timestamp: When the run finished (seconds since the epoch); later runs win on merge
+        results: Model-index result sets
+    """
+
+    source: str
+    path: str
+    model: str
+    timestamp: float
+    results: List[Dict[str, Any]]
+
+
+def _score_metrics(scores: Dict[str, Any]) -> Dict[str, float]:
+    """Finite numeric scores of a task, without standard errors."""
+    return {
+        name: float(value)
+        for name, value in scores.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+        and not name.endswith("_stderr") and name not in ("stderr", "std")
+    }
+
+
+def _log_result(
+    benchmark: str,
+    metrics: Dict[str, float],
+    task_type: str,
+    source: Tuple[str, str],
+    shots: Optional[int] = None,
+    config: Optional[str] = None
+) -> Dict[str, Any]:
+    display = benchmark_display_name(benchmark)
+    dataset = {
+        "name": f"{display} ({shots}-shot)" if shots is not None else display,
+        "type": canonicalize(benchmark),
+    }
+    if config:
+        dataset["config"] = config
+    if shots is not None:
+        dataset["args"] = {"num_few_shot": shots}
+    return {
+        "task": {"type": task_type},
+        "dataset": dataset,
+        "metrics": [{"name": name, "type": canonicalize(name), "value": value} for name, value in metrics.items()],
+        "source": {"name": source[0], "url": source[1]},
+    }
+
+
+@PROFILER.timed("extract")
+def lighteval_to_model_index(
+    results: Dict[str, Dict[str, Any]],
+    task_type: str = "text-generation",
+    include_subtasks: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Convert the `results` section of a lighteval results file to model-index.
+
+    Task keys look like `suite|task|few_shot` (or `task|few_shot`). Subtasks
+    (`mmlu:abstract_algebra`) are reported through their group: lighteval's own
+    `:_average` entry when present, otherwise the mean of the subtask scores.
+    Names that are benchmarks of their own (`arc:challenge`) are kept whole.
+    The `all` summary entry is ignored.
+
+    Args:
+        results: Task key -> {metric: value}
+        task_type: Task type for model-index
+        include_subtasks: Also emit one result set per subtask (dataset.config)
+
+    Returns:
+        Model-index formatted results, one result set per benchmark
+    """
+    groups: Dict[Tuple[str, Optional[int]], Dict[str, Any]] = {}
+    for key, scores in results.items():
+        if key == "all" or not isinstance(scores, dict):
+            continue
+        parts = key.split("|")
+        task = parts[1] if len(parts) >= 3 else parts[0]
+        shots = parts[-1] if len(parts) >= 2 else None
+        shots = int(shots) if shots and shots.isdigit() else None
+        base, _, subtask = task.partition(":")
+        if subtask and canonicalize(task) in BENCHMARK_ALIASES:
+            base, subtask = task, ""
+        group = groups.setdefault((base, shots), {"aggregate": None, "subtasks": {}})
+        metrics = _score_metrics(scores)
+        if not subtask or subtask == "_average":
+            group["aggregate"] = metrics
+        else:
+            group["subtasks"][subtask] = metrics
+
+    converted = []
+    source = ("lighteval", LIGHTEVAL_URL)
+    for (base, shots), group in groups.items():
+        aggregate = group["aggregate"]
+        if aggregate is None and group["subtasks"]:
+            values: Dict[str, List[float]] = {}
+            for metrics in group["subtasks"].values():
+                for name, value in metrics.items():
+                    values.setdefault(name, []).append(value)
+            aggregate = {name: sum(v) / len(v) for name, v in values.items()}
+        if aggregate:
+            converted.append(_log_result(base, aggregate, task_type, source, shots))
+        if include_subtasks:
+            for subtask, metrics in group["subtasks"].items():
+                if metrics:
+                    converted.append(_log_result(base, metrics, task_type, source, shots, config=subtask))
+
+    PROFILER.count("metrics_emitted", sum(len(r["metrics"]) for r in converted))
+    return converted
+
+
+@PROFILER.timed("extract")
+def inspect_to_model_index(
+    eval_spec: Dict[str, Any],
+    results: Dict[str, Any],
+    task_type: str = "text-generation"
+) -> List[Dict[str, Any]]:
+    """
+    Convert the `eval` and `results` sections of an inspect log to model-index.
+
+    The task name gives the benchmark (`inspect_evals/mmlu_5_shot` -> MMLU,
+    5-shot); every scorer's metrics become metrics of one result set. With
+    several scorers, metric names are prefixed with the scorer name.
+
+    Returns:
+        Model-index formatted results (empty if the log has no scores)
+    """
+    task = str(eval_spec.get("task", "")).rsplit("/", 1)[-1]
+    match = re.search(r"_(\d+)_shot$", task)
+    shots = int(match.group(1)) if match else None
+    benchmark = task[:match.start()] if match else task
+
+    scores = results.get("scores") or []
+    metrics = {}
+    for score in scores:
+        for name, metric in (score.get("metrics") or {}).items():
+            value = metric.get("value") if isinstance(metric, dict) else metric
+            for metric_name, metric_value in _score_metrics({name: value}).items():
+                label = f"{score.get('name')}/{metric_name}" if len(scores) > 1 else metric_name
+                metrics[label] = metric_value
+
+    if not benchmark or not metrics:
+        return []
+    PROFILER.count("metrics_emitted", len(metrics))
+    return [_log_result(benchmark, metrics, task_type, ("inspect", INSPECT_URL), shots)]
+
+
+def _iso_timestamp(value: Any, default: float) -> float:
+    from datetime import datetime
+
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return default
+
+
+@PROFILER.timed("parse")
+def read_lighteval_results(path: str, **options: Any) -> Optional[EvalRun]:
+    """
+    Read a lighteval results file (`results_<timestamp>.json` under --output-dir).
+
+    Returns None for files that are not lighteval results.
+    """
+    if not path.endswith(".json"):
+        return None
+    known = {"config_general", "results", "versions", "config_tasks", "summary_tasks", "summary_general"}
+    sections = {}
+    with open(path, encoding="utf-8") as f:
+        for key, value in iter_json_members(f, ("config_general", "results")):
+            if key not in known:
+                return None
+            if value is not _SKIPPED:
+                sections[key] = value
+            if len(sections) == 2:
+                break
+    config = sections.get("config_general")
+    if not isinstance(config, dict) or not isinstance(sections.get("results"), dict):
+        return None
+
+    model = str(config.get("model_name") or "")
+    finished = config.get("end_time") or config.get("start_time")
+    return EvalRun(
+        source="lighteval",
+        path=path,
+        model=model,
+        timestamp=float(finished) if isinstance(finished, (int, float)) else os.path.getmtime(path),
+        results=lighteval_to_model_index(sections["results"], **options),
+    )
+
+
+@PROFILER.timed("parse")
+def read_inspect_log(path: str, task_type: str = "text-generation", **options: Any) -> Optional[EvalRun]:
+    """
+    Read an inspect log: a `.eval` archive or a `.json` log.
+
+    Only the header is read (header.json inside `.eval` archives; the members
+    before `samples` in JSON logs), so large logs cost about the same as small
+    ones. Returns None for other files.
+
+    Raises:
+        ValueError: If the run did not finish successfully
+    """
+    if path.endswith(".eval"):
+        import zipfile
+
+        if not zipfile.is_zipfile(path):
+            return None
+        with zipfile.ZipFile(path) as archive:
+            if "header.json" not in archive.namelist():
+                raise ValueError("log has no header.json (run still in progress?)")
+            with archive.open("header.json") as raw:
+                sections = _inspect_sections(io.TextIOWrapper(raw, encoding="utf-8"))
+    elif path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            sections = _inspect_sections(f)
+    else:
+        return None
+    if sections is None:
+        return None
+
+    eval_spec = sections["eval"]
+    status = sections.get("status", "success")
+    if status != "success":
+        raise ValueError(f"run status is {status!r}")
+    # Inspect model names are <provider>/<model id>, e.g. vllm/org/model
+    model = str(eval_spec.get("model", "")).split("/", 1)[-1].split(":", 1)[0]
+    return EvalRun(
+        source="inspect",
+        path=path,
+        model=model,
+        timestamp=_iso_timestamp(eval_spec.get("created"), os.path.getmtime(path)),
+        results=inspect_to_model_index(eval_spec, sections.get("results") or {}, task_type=task_type),
+    )
+
+
+def _inspect_sections(f: Any) -> Optional[Dict[str, Any]]:
+    sections = {}
+    for key, value in iter_json_members(f, ("version", "status", "eval", "results")):
+        if key == "config_general":
+            return None
+        if value is not _SKIPPED:
+            sections[key] = value
+        if "eval" in sections and "results" in sections:
+            break
+        if key == "samples":
+            break
+    if not isinstance(sections.get("eval"), dict) or "version" not in sections:
+        return None
+    return sections
+
+
+# Result file readers, tried in order: each returns an EvalRun, or None for files it does not recognize
+RESULT_SOURCES: Dict[str, Callable[..., Optional[EvalRun]]] = {
+    "lighteval": read_lighteval_results,
+    "inspect": read_inspect_log,
+}
+
+
+def find_result_files(paths: Iterable[str]) -> List[str]:
+    """`.json` and `.eval` files under the given files and directories, skipping hidden directories."""
+    found = []
+    for path in paths:
+        if not os.path.isdir(path):
+            found.append(path)
+            continue
+        for directory, subdirs, files in os.walk(path):
+            subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+            found += [os.path.join(directory, name) for name in sorted(files) if name.endswith((".json", ".eval"))]
+    return found
+
+
+def read_result_file(path: str, sources: Optional[List[str]] = None, **options: Any) -> Optional[EvalRun]:
+    """Read a results file with the first matching result source (all of RESULT_SOURCES by default)."""
+    for name in sources or RESULT_SOURCES:
+        run = RESULT_SOURCES[name](path, **options)
+        if run is not None:
+            return run
+    return None
+
+
+def import_results(
+    paths: Iterable[str],
+    sources: Optional[List[str]] = None,
+    repo_id: Optional[str] = None,
+    name_map: Optional[Dict[str, str]] = None,
+    output: Any = None,
+    **options: Any
+) -> Dict[str, int]:
+    """
+    Turn local lighteval/inspect results into model-index, streaming one JSON line per repo.
+
+    All runs of a model are merged into one record (newer runs win on
+    conflicting metrics), so a results directory with hundreds of runs becomes
+    one push-batch input. Unreadable files get an error record with their path.
+
+    Args:
+        paths: Result files and directories to search
+        sources: Result sources to try (default: all of RESULT_SOURCES)
+        repo_id: Repo receiving every run (default: the model id each run recorded)
+        name_map: {recorded model id: repo id} for models not named after their repo
+        output: Text stream for JSONL records (default: stdout)
+        **options: Passed to the converters (task_type, include_subtasks)
+
+    Returns:
+        Counts of repo records, runs, errors and files that are not results
+    """
+    output = output or sys.stdout
+    counts = {"ok": 0, "no_results": 0, "runs": 0, "error": 0, "skipped": 0}
+    runs_by_repo: Dict[str, List[EvalRun]] = {}
+
+    def emit(record: Dict[str, Any]) -> None:
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    for path in find_result_files(paths):
+        try:
+            run = read_result_file(path, sources, **options)
+        except (OSError, ValueError) as e:
+            counts["error"] += 1
+            emit({"path": path, "status": "error", "error": str(e)})
+            continue
+        if run is None:
+            counts["skipped"] += 1
+            continue
+        counts["runs"] += 1
+        target = repo_id or (name_map or {}).get(run.model) or run.model
+        if target.count("/") != 1 or target.startswith(("/", ".")):
+            counts["error"] += 1
+            emit({"path": path, "status": "error", "error": f"no repo id for model {run.model!r}; use --model-repo-map"})
+            continue
+        runs_by_repo.setdefault(target, []).append(run)
+
+    for target, runs in runs_by_repo.items():
+        results: List[Dict[str, Any]] = []
+        for run in sorted(runs, key=lambda r: r.timestamp):
+            results = merge_model_index_results(results, run.results)
+        status = "ok" if results else "no_results"
+        counts[status] += 1
+        emit({
+            "repo_id": target,
+            "status": status,
+            "results": results,
+            "runs": [run.path for run in runs],
+        })
+    return counts
+
+
+# ============================================================================
+# Model Card Update Functions
+# ============================================================================
+
+
+def _result_key(result: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Identity of a model-index result set: task.type plus the dataset it was scored on."""
+    task = result.get("task") or {}
+    dataset = result.get("dataset") or {}
+    return (task.get("type"), dataset.get("type"), dataset.get("config"), dataset.get("split"))
+
+
+def _metric_key(metric: Dict[str, Any]) -> Any:
+    """Identity of a metric inside a result set (canonical metric.type, falling back to name)."""
+    key = metric.get("type", metric.get("name"))
+    return canonicalize(key) if isinstance(key, str) else key
+
+
+def merge_model_index_results(
+    existing_results: Iterable[Dict[str, Any]],
+    new_results: Iterable[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Merge model-index result sets keyed on (task.type, dataset.type, metric.type).
+
+    Existing result sets keep their order and position. A new metric replaces the
+    existing one with the same key in place; unseen metrics and result sets are
+    appended. Duplicates already present in the card are collapsed, so re-running
+    an import never grows the model-index.
+
+    Args:
+        existing_results: Results currently in the model card
+        new_results: Results to merge in (these win on conflicts)
+
+    Returns:
+        The merged list of result sets (inputs are not modified)
+    """
+    merged: List[Dict[str, Any]] = []
+    by_key: Dict[Tuple[Any, ...], Tuple[Dict[str, Any], Dict[Any, int]]] = {}
+
+    for incoming, result in [(False, r) for r in existing_results] + [(True, r) for r in new_results]:
+        if not isinstance(result, dict):
+            continue
+        key = _result_key(result)
+        if key not in by_key:
+            target = {k: [] if k == "metrics" else json.loads(json.dumps(v)) for k, v in result.items()}
+            target.setdefault("metrics", [])
+            by_key[key] = (target, {})
+            merged.append(target)
+        target, positions = by_key[key]
+        for k, v in result.items():
+            if k != "metrics" and k not in target:
+                target[k] = json.loads(json.dumps(v))
+
+        for metric in result.get("metrics") or []:
+            if not isinstance(metric, dict):
+                continue
+            metric_key = _metric_key(metric)
+            metric = dict(metric)
+            if metric_key in positions:
+                if incoming:
+                    target["metrics"][positions[metric_key]] = metric
+            else:
+                positions[metric_key] = len(target["metrics"])
+                target["metrics"].append(metric)
+
+    return merged
+
+
+def merge_model_index(
+    existing_index: Any,
+    results: List[Dict[str, Any]],
+    model_name: str,
+) -> List[Dict[str, Any]]:
+    """
+    Build the model-index that results in after merging `results` into a card.
+
+    Only the first entry is merged into; any further entries are kept verbatim.
+    """
+    entries = existing_index if isinstance(existing_index, list) else []
+    first = entries[0] if entries and isinstance(entries[0], dict) else {}
+    entry = dict(first)
+    entry["name"] = first.get("name", model_name)
+    entry["results"] = merge_model_index_results(first.get("results") or [], results)
+    return [entry] + list(entries[1:])
+
+
+@PROFILER.timed("push")
+def push_model_index(
+    repo_id: str,
+    results: List[Dict[str, Any]],
+    create_pr: bool = False,
+    commit_message: Optional[str] = None,
+    token: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Merge results into a model card and push it as a single commit.
+
+    Results are merged into the existing model-index (see merge_model_index_results);
+    when the merge leaves the card unchanged nothing is pushed. Errors propagate so
+    callers can decide whether to retry.
+
+    Returns:
+        {"status": ...} with "unchanged", "updated", "pr_created" or "duplicate_pr"
+        (an open PR with the same title by the same user exists, so none was
+        created). For the last two, "pr" is the number of that pull request.
+    """
+    # Load existing card (always revalidated so we never edit a stale copy)
+    snapshot = load_card_snapshot(repo_id, token=token, revalidate=True)
+
+    # Get model name
+    model_name = repo_id.split("/")[-1] if "/" in repo_id else repo_id
+
+    # Merge with the raw model-index from the card metadata
+    existing = snapshot.data.get("model-index")
+    model_index = merge_model_index(existing, results, model_name)
+    if model_index == existing:
+        return {"status": "unchanged"}
+
+    errors = validate_model_index_data({"model-index": model_index})
+    if errors:
+        path, message = errors[0]
+        raise ValueError(f"merged model-index is invalid at {path}: {message}")
+    # Rewrite only the model-index block; ModelCard would re-serialize the whole front matter
+    content = replace_card_model_index(snapshot.content, model_index)
+
+    # Prepare commit message
+    if not commit_message:
+        commit_message = f"Add evaluation results to {model_name}"
+
+    # The same PR is already open (checked against the cached get-prs scan)
+    duplicate = find_duplicate_pr(repo_id, commit_message, token=token) if create_pr else None
+    if duplicate:
+        return {"status": "duplicate_pr", "pr": duplicate["num"]}
+
+    commit_description = (
+        "This commit adds structured evaluation results to the model card. "
+        "The results are formatted using the model-index specification and "
+        "will be displayed in the model card's evaluation widget."
+    )
+
+    # Push update. The upload goes through huggingface_hub's own HTTP client, so
+    # it takes its rate limiter token (and budget) here; the GETs above did so
+    # through the pooled session.
+    HfApi = require_hf_api()
+    RATE_LIMITER.acquire(RATE_LIMITER.key(hf_endpoint(), {"Authorization": f"Bearer {token}"} if token else None))
+    commit = HfApi(token=token).upload_file(
+        path_or_fileobj=content.encode("utf-8"),
+        path_in_repo="README.md",
+        repo_id=repo_id,
+        repo_type="model",
+        commit_message=commit_message,
+        commit_description=commit_description,
+        create_pr=create_pr
+    )
+    get_card_cache().invalidate(repo_id)
+    if create_pr:
+        invalidate_open_prs(repo_id)
+        return {"status": "pr_created", "pr": getattr(commit, "pr_num", None)}
+    return {"status": "updated"}
+
+
+def update_model_card_with_evaluations(
+    repo_id: str,
+    results: List[Dict[str, Any]],
+    create_pr: bool = False,
+    commit_message: Optional[str] = None
+) -> bool:
+    """
+    Update a model card with evaluation results.
+
+    Args:
+        repo_id: Hugging Face repository ID
+        results: Model-index formatted results
+        create_pr: Whether to create a PR instead of direct push
+        commit_message: Custom commit message
+
+    Returns:
+        True if successful (including "unchanged"), False otherwise
+    """
+    try:
+        load_env()
+        hf_token = os.getenv("HF_TOKEN")
+        if not hf_token:
+            raise ValueError("HF_TOKEN environment variable is not set")
+
+        outcome = push_model_index(repo_id, results, create_pr, commit_message, token=hf_token)
+        status = outcome["status"]
+        if status == "unchanged":
+            print(f"✓ Model-index unchanged for {repo_id}; nothing to push")
+            return True
+        if status == "duplicate_pr":
+            print(
+                f"✓ {repo_id} already has your open PR #{outcome['pr']} with this title; "
+                "not creating another (see get-prs)"
+            )
+            return True
+
+        if status == "pr_created":
+            print(f"✓ Pull request #{outcome['pr']} created successfully for {repo_id}")
+        else:
+            print(f"✓ Model card updated successfully for {repo_id}")
+        return True
+
+    except Exception as e:
+        print(f"Error updating model card: {e}")
+        return False
+
+
+def show_evaluations(repo_id: str) -> None:
+    """Display current evaluations in a model card."""
+    try:
+        load_env()
+        hf_token = os.getenv("HF_TOKEN")
+        card_data = load_card_snapshot(repo_id, token=hf_token).data
+
+        if "model-index" not in card_data:
+            print(f"No model-index found in {repo_id}")
+            return
+
+        model_index = card_data["model-index"]
+
+        print(f"\nEvaluations for {repo_id}:")
+        print("=" * 60)
+
+        for model_entry in model_index:
+            model_name = model_entry.get("name", "Unknown")
+            print(f"\nModel: {model_name}")
+
+            results = model_entry.get("results", [])
+            for i, result in enumerate(results, 1):
+                print(f"\n  Result Set {i}:")
+
+                task = result.get("task", {})
+                print(f"    Task: {task.get('type', 'unknown')}")
+
+                dataset = result.get("dataset", {})
+                print(f"    Dataset: {dataset.get('name', 'unknown')}")
+
+                metrics = result.get("metrics", [])
+                print(f"    Metrics ({len(metrics)}):")
+                for metric in metrics:
+                    name = metric.get("name", "Unknown")
+                    value = metric.get("value", "N/A")
+                    print(f"      - {name}: {value}")
+
+                source = result.get("source", {})
+                if source:
+                    print(f"    Source: {source.get('name', 'Unknown')}")
+
+        print("\n" + "=" * 60)
+
+    except Exception as e:
+        print(f"Error showing evaluations: {e}")
+
+
+# Declarative model-index schema; compiled once into nested check functions.
+# "required"/"optional" map keys to sub-schemas, "items" is the schema of list
+# elements and "unique" names the key function used to report duplicate items.
+MODEL_INDEX_SCHEMA: Dict[str, Any] = {
+    "type": "list",
+    "min_items": 1,
+    "items": {
+        "type": "object",
+        "required": {
+            "name": {"type": "str"},
+            "results": {
+                "type": "list",
+                "unique": "result",
+                "items": {
+                    "type": "object",
+                    "required": {
+                        "task": {
+                            "type": "object",
+                            "required": {"type": {"type": "str"}},
+                            "optional": {"name": {"type": "str"}},
+                        },
+                        "dataset": {
+                            "type": "object",
+                            "required": {"name": {"type": "str"}, "type": {"type": "str"}},
+                            "optional": {
+                                "config": {"type": "str"},
+                                "split": {"type": "str"},
+                                "revision": {"type": "str"},
+                                "args": {"type": "any"},
+                            },
+                        },
+                        "metrics": {
+                            "type": "list",
+                            "min_items": 1,
+                            "unique": "metric",
+                            "items": {
+                                "type": "object",
+                                "required": {"type": {"type": "str"}, "value": {"type": "number"}},
+                                "optional": {
+                                    "name": {"type": "str"},
+                                    "config": {"type": "str"},
+                                    "args": {"type": "any"},
+                                    "verified": {"type": "bool"},
+                                    "verifyToken": {"type": "str"},
+                                },
+                            },
+                        },
+                    },
+                    "optional": {
+                        "source": {
+                            "type": "object",
+                            "required": {"url": {"type": "str"}},
+                            "optional": {"name": {"type": "str"}},
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+_UNIQUE_KEYS = {"result": _result_key, "metric": _metric_key}
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+ValidationErrors = List[Tuple[str, str]]
+
+
+def _child_path(path: str, key: Union[str, int]) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if _IDENTIFIER_RE.match(key) else f"{path}[{key!r}]"
+
+
+def _compile_schema(schema: Dict[str, Any]):
+    """Turn a schema node into check(value, path, errors), resolving sub-schemas up front."""
+    kind = schema["type"]
+
+    if kind == "any":
+        return lambda value, path, errors: None
+
+    if kind == "str":
+        def check_str(value, path, errors):
+            if not isinstance(value, str) or not value.strip():
+                errors.append((path, f"expected a non-empty string, got {value!r}"))
+        return check_str
+
+    if kind == "bool":
+        def check_bool(value, path, errors):
+            if not isinstance(value, bool):
+                errors.append((path, f"expected true or false, got {value!r}"))
+        return check_bool
+
+    if kind == "number":
+        def check_number(value, path, errors):
+            # bool is an int subclass, and YAML turns yes/no into booleans
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                errors.append((path, f"expected a number, got {type(value).__name__} {value!r}"))
+            elif not math.isfinite(value):
+                errors.append((path, f"expected a finite number, got {value!r}"))
+        return check_number
+
+    if kind == "object":
+        required = [(key, _compile_schema(sub)) for key, sub in schema.get("required", {}).items()]
+        optional = [(key, _compile_schema(sub)) for key, sub in schema.get("optional", {}).items()]
+
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append((path, f"expected a mapping, got {type(value).__name__}"))
+                return
+            for key, check in required:
+                if key not in value:
+                    errors.append((path, f"missing required field '{key}'"))
+                else:
+                    check(value[key], _child_path(path, key), errors)
+            for key, check in optional:
+                if key in value:
+                    check(value[key], _child_path(path, key), errors)
+        return check_object
+
+    if kind == "list":
+        check_item = _compile_schema(schema["items"])
+        min_items = schema.get("min_items", 0)
+        unique_key = _UNIQUE_KEYS.get(schema.get("unique", ""))
+
+        def check_list(value, path, errors):
+            if not isinstance(value, list):
+                errors.append((path, f"expected a list, got {type(value).__name__}"))
+                return
+            if len(value) < min_items:
+                errors.append((path, f"expected at least {min_items} item(s)"))
+            first_seen: Dict[Any, int] = {}
+            for index, item in enumerate(value):
+                item_path = _child_path(path, index)
+                check_item(item, item_path, errors)
+                if unique_key is None or not isinstance(item, dict):
+                    continue
+                try:
+                    key = unique_key(item)
+                    previous = first_seen.setdefault(key, index)
+                except (AttributeError, TypeError):
+                    continue  # malformed item, already reported above
+                if previous != index:
+                    errors.append((item_path, f"duplicate of {_child_path(path, previous)} (same key {key!r})"))
+        return check_list
+
+    raise ValueError(f"Unknown schema type: {kind}")
+
+
+@lru_cache(maxsize=1)
+def model_index_validator():
+    """The compiled MODEL_INDEX_SCHEMA (built on first use, then shared)."""
+    return _compile_schema(MODEL_INDEX_SCHEMA)
+
+
+def validate_model_index_data(card_data: Dict[str, Any]) -> ValidationErrors:
+    """
+    Check the model-index of parsed card metadata against MODEL_INDEX_SCHEMA.
+
+    Every problem is reported, not just the first one, as (JSON path, message)
+    pairs, e.g. ("$['model-index'][0].results[2].metrics[1].value", "expected a number, ...").
+
+    Returns:
+        An empty list when the model-index is valid
+    """
+    if not isinstance(card_data, dict) or "model-index" not in card_data:
+        return [("$", "no model-index found")]
+    errors: ValidationErrors = []
+    model_index_validator()(card_data["model-index"], "$['model-index']", errors)
+    return errors
+
+
+def load_local_card_data(path: str) -> Dict[str, Any]:
+    """
+    Read card metadata from a local file.
+
+    Markdown files are read through their YAML front matter; other files are
+    parsed as YAML holding either the metadata mapping or a bare model-index list.
+    """
+    if path.lower().endswith(".md"):
+        return read_front_matter(path)
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    data = load_yaml(content)
+    if isinstance(data, list):
+        return {"model-index": data}
+    return data if isinstance(data, dict) else {}
+
+
+def print_validation_report(label: str, errors: ValidationErrors) -> bool:
+    """Print the outcome for one card; returns True when it is valid."""
+    if not errors:
+        print(f"✓ Model-index format is valid for {label}")
+        return True
+    print(f"✗ Model-index of {label} has {len(errors)} error(s):")
+    for path, message in errors:
+        print(f"  {path}: {message}")
+    return False
+
+
+def validate_model_index(repo_id: str) -> bool:
+    """Validate model-index format in a model card."""
+    try:
+        load_env()
+        hf_token = os.getenv("HF_TOKEN")
+        card_data = load_card_snapshot(repo_id, token=hf_token).data
+        return print_validation_report(repo_id, validate_model_index_data(card_data))
+
+    except Exception as e:
+        print(f"Error validating model-index: {e}")
+        return False
+
+
+def validate_model_index_files(paths: List[str]) -> bool:
+    """Validate local card files (README.md front matter or YAML); returns True if all are valid."""
+    all_valid = True
+    for path in paths:
+        try:
+            errors = validate_model_index_data(load_local_card_data(path))
+        except Exception as e:
+            print(f"✗ Could not read {path}: {e}")
+            all_valid = False
+            continue
+        all_valid = print_validation_report(path, errors) and all_valid
+    return all_valid
+
+
+def validate_model_index_batch(
+    repo_ids: List[str],
+    workers: int = 16,
+    output: Any = None
+) -> Dict[str, int]:
+    """
+    Validate the model-index of many repositories, streaming one JSON line per repo.
+
+    Cards are fetched concurrently through the card cache (one pooled session),
+    so re-validating unchanged cards costs at most an ETag round trip each.
+
+    Args:
+        repo_ids: Hugging Face model repository IDs
+        workers: Number of concurrent card fetches
+        output: Text stream for JSONL records (default: stdout)
+
+    Returns:
+        Counts of records by status (valid, invalid, missing, error)
+    """
+    load_env()
+    requests = require_requests()
+    hf_token = os.getenv("HF_TOKEN")
+    card_cache = get_card_cache()
+    output = output or sys.stdout
+    counts = {"valid": 0, "invalid": 0, "missing": 0, "error": 0}
+    session = pooled_session(workers)
+
+    def run(repo_id: str) -> Dict[str, Any]:
+        try:
+            card_data = card_cache.load(repo_id, token=hf_token, session=session).data
+        except requests.RequestException as e:
+            return {"repo_id": repo_id, "status": "error", "error": str(e)}
+        if "model-index" not in card_data:
+            return {"repo_id": repo_id, "status": "missing"}
+        errors = validate_model_index_data(card_data)
+        record: Dict[str, Any] = {"repo_id": repo_id, "status": "invalid" if errors else "valid"}
+        if errors:
+            record["errors"] = [{"path": path, "message": message} for path, message in errors]
+        return record
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run, repo_id) for repo_id in repo_ids]
+        for future in as_completed(futures):
+            record = future.result()
+            counts[record["status"]] += 1
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+    session.close()
+    return counts
+
+
+# ============================================================================
+# Leaderboard Index (SQLite)
+# ============================================================================
+
+LEADERBOARD_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    repo_id TEXT PRIMARY KEY,
+    digest TEXT,
+    commit_sha TEXT,
+    model_name TEXT,
+    status TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    repo_id TEXT NOT NULL REFERENCES cards(repo_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    benchmark TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    task_type TEXT,
+    dataset_name TEXT,
+    dataset_config TEXT,
+    dataset_split TEXT,
+    metric_name TEXT,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS scores_by_benchmark ON scores (benchmark, metric, value);
+CREATE INDEX IF NOT EXISTS scores_by_repo ON scores (repo_id, benchmark);
+"""
+
+
+def _score_benchmark(result: Dict[str, Any], metric: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    (benchmark, metric) under which a model-index metric is indexed.
+
+    Leaderboard-style results name the benchmark in the dataset (`cais/mmlu`,
+    "MMLU (5-Shot)") and the measure in metric.type (`acc`); README and
+    Artificial Analysis results use one generic dataset and put the benchmark
+    in metric.type. A dataset naming a registered benchmark wins; otherwise
+    the metric is the benchmark and its metric is "".
+    """
+    dataset = result.get("dataset") or {}
+    metric_type = str(metric.get("type") or metric.get("name") or "")
+    for name in (str(dataset.get("type") or "").rsplit("/", 1)[-1], str(dataset.get("name") or "")):
+        benchmark = canonicalize(re.sub(r"\s*\([^)]*\)\s*$", "", name)) if name else ""
+        if benchmark in BENCHMARK_ALIASES:
+            return benchmark, canonicalize(metric_type)
+    return canonicalize(metric_type), ""
+
+
+def model_index_scores(card_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten the first model-index entry of a card into score rows (numeric values only)."""
+    model_index = card_data.get("model-index")
+    if not isinstance(model_index, list) or not model_index or not isinstance(model_index[0], dict):
+        return []
+    rows = []
+    for result in model_index[0].get("results") or []:
+        if not isinstance(result, dict):
+            continue
+        task = result.get("task") or {}
+        dataset = result.get("dataset") or {}
+        source = result.get("source") or {}
+        for metric in result.get("metrics") or []:
+            if not isinstance(metric, dict):
+                continue
+            value = metric.get("value")
+            if isinstance(value, str):
+                value = parse_numeric_cell(value)
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or not math.isfinite(value):
+                continue
+            benchmark, metric_key = _score_benchmark(result, metric)
+            if not benchmark:
+                continue
+            rows.append({
+                "position": len(rows),
+                "benchmark": benchmark,
+                "metric": metric_key,
+                "value": float(value),
+                "task_type": task.get("type"),
+                "dataset_name": dataset.get("name"),
+                "dataset_config": dataset.get("config"),
+                "dataset_split": dataset.get("split"),
+                "metric_name": metric.get("name"),
+                "source": source.get("name") if isinstance(source, dict) else None,
+            })
+    return rows
+
+
+class LeaderboardIndex:
+    """
+    Local SQLite index of model-index scores across many model cards.
+
+    Each card contributes one row per numeric metric, keyed by canonical
+    benchmark and metric (see _score_benchmark), with an index on
+    (benchmark, metric, value) so rankings and comparisons are index lookups.
+    Cards are stored with their README digest and commit, so a refresh only
+    re-ingests cards that changed.
+
+    Only the calling thread writes; concurrent fetches hand their cards back
+    to it (see refresh).
+    """
+
+    def __init__(self, path: str):
+        import sqlite3
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.executescript(LEADERBOARD_SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "LeaderboardIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def digest(self, repo_id: str) -> Optional[str]:
+        row = self.db.execute("SELECT digest FROM cards WHERE repo_id = ?", (repo_id,)).fetchone()
+        return row["digest"] if row else None
+
+    def ingest(
+        self,
+        repo_id: str,
+        card_data: Dict[str, Any],
+        digest: Optional[str] = None,
+        commit_sha: Optional[str] = None
+    ) -> int:
+        """Replace the scores of one card; returns the number of score rows stored."""
+        rows = model_index_scores(card_data)
+        model_index = card_data.get("model-index")
+        model_name = model_index[0].get("name") if rows else None
+        with self.db:
+            self.db.execute("DELETE FROM scores WHERE repo_id = ?", (repo_id,))
+            self.db.execute(
+                "INSERT OR REPLACE INTO cards (repo_id, digest, commit_sha, model_name, status, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (repo_id, digest, commit_sha, model_name, "indexed" if rows else "missing", time.time()),
+            )
+            self.db.executemany(
+                "INSERT INTO scores (repo_id, position, benchmark, metric, value, task_type, dataset_name, "
+                "dataset_config, dataset_split, metric_name, source) VALUES (:repo_id, :position, :benchmark, "
+                ":metric, :value, :task_type, :dataset_name, :dataset_config, :dataset_split, :metric_name, :source)",
+                [dict(row, repo_id=repo_id) for row in rows],
+            )
+        return len(rows)
+
+    def remove(self, repo_ids: Iterable[str]) -> int:
+        with self.db:
+            return self.db.executemany("DELETE FROM cards WHERE repo_id = ?", [(r,) for r in repo_ids]).rowcount
+
+    def repo_ids(self) -> List[str]:
+        return [row["repo_id"] for row in self.db.execute("SELECT repo_id FROM cards ORDER BY repo_id")]
+
+    def refresh(self, repo_ids: List[str], workers: int = 16, prune: bool = False) -> Dict[str, int]:
+        """
+        Fetch cards concurrently and re-ingest those whose README changed.
+
+        Cards come through the card cache, so unchanged cards cost at most an
+        ETag round trip and are not rewritten. With `prune`, indexed cards that
+        are not in `repo_ids` are dropped.
+
+        Returns:
+            Counts of cards indexed, unchanged, without model-index (missing),
+            failed (error) and pruned
+        """
+        load_env()
+        requests = require_requests()
+        hf_token = os.getenv("HF_TOKEN")
+        card_cache = get_card_cache()
+        counts = {"indexed": 0, "unchanged": 0, "missing": 0, "error": 0, "pruned": 0}
+        session = pooled_session(workers)
+
+        def fetch(repo_id: str) -> CardSnapshot:
+            return card_cache.load(repo_id, token=hf_token, session=session)
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(fetch, repo_id): repo_id for repo_id in repo_ids}
+            for future in as_completed(futures):
+                repo_id = futures[future]
+                try:
+                    snapshot = future.result()
+                except requests.RequestException as e:
+                    print(f"✗ {repo_id}: {e}", file=sys.stderr)
+                    counts["error"] += 1
+                    continue
+                if self.digest(repo_id) == snapshot.digest:
+                    counts["unchanged"] += 1
+                    continue
+                with PROFILER.phase("index"):
+                    stored = self.ingest(repo_id, snapshot.data, snapshot.digest, snapshot.commit_sha)
+                counts["indexed" if stored else "missing"] += 1
+
+        session.close()
+        if prune:
+            counts["pruned"] = self.remove(set(self.repo_ids()) - set(repo_ids))
+        return counts
+
+    # -- queries -----------------------------------------------------------
+
+    @staticmethod
+    def _primary_scores(where: str = "") -> str:
+        # One score per (repo, benchmark): the metric listed first in the card
+        return (
+            "SELECT * FROM (SELECT s.*, ROW_NUMBER() OVER "
+            "(PARTITION BY s.repo_id, s.benchmark ORDER BY s.position) AS pick FROM scores s"
+            f"{' WHERE ' + where if where else ''}) WHERE pick = 1"
+        )
+
+    def rank(
+        self,
+        benchmark: str,
+        metric: Optional[str] = None,
+        limit: int = 20,
+        author: Optional[str] = None,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        task_type: Optional[str] = None,
+        ascending: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Top models on one benchmark.
+
+        Args:
+            benchmark: Benchmark name in any spelling (canonicalized)
+            metric: Only this metric (e.g. acc_norm); default: each card's first metric for the benchmark
+            limit: Number of rows
+            author: Only repos of this user or organization
+            min_value / max_value: Only scores in this range
+            task_type: Only results with this task.type
+            ascending: Lowest first (for error rates, perplexity, ...)
+
+        Returns:
+            Rows with rank, repo_id, value, metric, metric_name, dataset_name and source
+        """
+        conditions, params = ["s.benchmark = ?"], [canonicalize(benchmark)]
+        if metric is not None:
+            conditions.append("s.metric = ?")
+            params.append(canonicalize(metric) if metric else "")
+        if author:
+            conditions.append("s.repo_id LIKE ? ESCAPE '\\'")
+            params.append(re.sub(r"([%_\\])", r"\\\1", author) + "/%")
+        if min_value is not None:
+            conditions.append("s.value >= ?")
+            params.append(min_value)
+        if max_value is not None:
+            conditions.append("s.value <= ?")
+            params.append(max_value)
+        if task_type:
+            conditions.append("s.task_type = ?")
+            params.append(task_type)
+
+        query = (
+            f"{self._primary_scores(' AND '.join(conditions))} "
+            f"ORDER BY value {'ASC' if ascending else 'DESC'}, repo_id LIMIT ?"
+        )
+        rows = self.db.execute(query, (*params, limit)).fetchall()
+        return [
+            {
+                "rank": i,
+                "repo_id": row["repo_id"],
+                "value": row["value"],
+                "metric": row["metric"],
+                "metric_name": row["metric_name"],
+                "dataset_name": row["dataset_name"],
+                "source": row["source"],
+            }
+            for i, row in enumerate(rows, 1)
+        ]
+
+    def compare(self, repo_ids: List[str], benchmarks: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Scores of several repos side by side.
+
+        Returns:
+            {benchmark: {repo_id: value}} for benchmarks at least one repo has
+            (or the requested ones), using each card's first metric per benchmark
+        """
+        conditions = [f"s.repo_id IN ({', '.join('?' * len(repo_ids))})"]
+        params: List[Any] = list(repo_ids)
+        if benchmarks:
+            conditions.append(f"s.benchmark IN ({', '.join('?' * len(benchmarks))})")
+            params += [canonicalize(b) for b in benchmarks]
+        table: Dict[str, Dict[str, float]] = {canonicalize(b): {} for b in benchmarks or []}
+        query = f"{self._primary_scores(' AND '.join(conditions))} ORDER BY benchmark"
+        for row in self.db.execute(query, params):
+            table.setdefault(row["benchmark"], {})[row["repo_id"]] = row["value"]
+        return table
+
+    def benchmarks(self, author: Optional[str] = None) -> List[Tuple[str, int]]:
+        """Indexed benchmarks with the number of repos reporting each, most common first."""
+        where, params = "", ()
+        if author:
+            where, params = "WHERE repo_id LIKE ? ESCAPE '\\'", (re.sub(r"([%_\\])", r"\\\1", author) + "/%",)
+        return [
+            (row["benchmark"], row["repos"])
+            for row in self.db.execute(
+                f"SELECT benchmark, COUNT(DISTINCT repo_id) AS repos FROM scores {where} "
+                "GROUP BY benchmark ORDER BY repos DESC, benchmark",
+                params,
+            )
+        ]
+
+
+def default_index_path() -> str:
+    return os.path.join(cache_root(), "leaderboard.sqlite")
+
+
+def list_author_models(author: str, token: Optional[str] = None, session: Any = None) -> List[str]:
+    """Repo ids of every model of a user or organization on the Hub (all pages)."""
+    http = session or shared_session()
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    url, params = f"{hf_endpoint()}/api/models", {"author": author, "limit": 1000}
+    repo_ids = []
+    while url:
+        response = http.get(url, params=params, headers=headers, timeout=30)
+        response.raise_for_status()
+        repo_ids += [model["id"] for model in response.json()]
+        # Later pages come from the Link header, query included
+        url, params = response.links.get("next", {}).get("url"), None
+    return repo_ids
+
+
+# ============================================================================
+# Commit Queue (batched card updates)
+# ============================================================================
+
+
+def retry_delay(
+    exc: BaseException,
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0
+) -> Optional[float]:
+    """
+    Seconds to wait before retrying after `exc`, or None if it should not be retried.
+
+    429 and 5xx responses (and dropped connections) are retried. A numeric
+    Retry-After header wins; otherwise the delay doubles per attempt, with jitter.
+    """
+    requests = require_requests()
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        if not isinstance(exc, (ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout)):
+            return None
+    elif status not in RETRYABLE_STATUS_CODES:
+        return None
+
+    retry_after = retry_after_seconds((getattr(response, "headers", None) or {}).get("Retry-After"))
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return min(max_delay, base_delay * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+class CommitJournal:
+    """
+    Append-only JSONL log of finished commits, so an interrupted batch can resume.
+
+    Entries are keyed by a digest of (repo, results, create_pr): if the queued
+    edit for a repo changes, it is pushed again even if the repo was done before.
+    """
+
+    DONE = frozenset({"updated", "pr_created", "unchanged"})
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a crash
+                    if entry.get("status") in self.DONE:
+                        self.done[entry["key"]] = entry["status"]
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+@dataclass
+class PendingCommit:
+    """Model-index edits waiting to be pushed to one repo."""
+
+    repo_id: str
+    results: List[Dict[str, Any]]
+    commit_message: Optional[str] = None
+
+    def key(self, create_pr: bool) -> str:
+        import hashlib
+
+        payload = json.dumps([self.repo_id, self.results, create_pr], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CommitQueue:
+    """
+    Gather model-index edits and push them with a bounded pool of workers.
+
+    Edits queued for the same repo are merged and pushed as one commit. Each
+    request of a push, the README upload included, takes a RATE_LIMITER token
+    for the Hub and the HF token used. Failed pushes are retried with
+    exponential backoff on 429/5xx; a 429 pauses every request to the Hub with
+    that token (pushes and README fetches alike) until the rate-limit window
+    has passed. With a journal, repos already pushed by an earlier (possibly
+    crashed) run are skipped.
+    """
+
+    def __init__(
+        self,
+        create_pr: bool = False,
+        workers: int = 4,
+        journal: Optional[str] = None,
+        max_retries: int = 5,
+        base_delay: float = 1.0
+    ):
+        self.create_pr = create_pr
+        self.workers = workers
+        self.journal = journal
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.pending: Dict[str, PendingCommit] = {}
+
+    def add(
+        self,
+        repo_id: str,
+        results: List[Dict[str, Any]],
+        commit_message: Optional[str] = None
+    ) -> None:
+        """Queue results for repo_id; multiple edits to one repo become one commit."""
+        pending = self.pending.get(repo_id)
+        if pending is None:
+            self.pending[repo_id] = PendingCommit(repo_id, list(results), commit_message)
+        else:
+            pending.results = merge_model_index_results(pending.results, results)
+            pending.commit_message = pending.commit_message or commit_message
+
+    def _push(self, pending: PendingCommit, token: str) -> Dict[str, Any]:
+        key = RATE_LIMITER.key(hf_endpoint(), {"Authorization": f"Bearer {token}"})
+        attempt = 0
+        while True:
+            try:
+                outcome = push_model_index(
+                    pending.repo_id,
+                    pending.results,
+                    create_pr=self.create_pr,
+                    commit_message=pending.commit_message,
+                    token=token
+                )
+                return {**outcome, "attempts": attempt + 1}
+            except Exception as e:
+                delay = retry_delay(e, attempt, self.base_delay)
+                if delay is None or attempt >= self.max_retries:
+                    return {"status": "error", "attempts": attempt + 1, "error": str(e)}
+                if getattr(getattr(e, "response", None), "status_code", None) == 429:
+                    PROFILER.count("rate_limited")
+                    RATE_LIMITER.pause(key, delay)
+                else:
+                    time.sleep(delay)
+                attempt += 1
+
+    def run(self) -> Dict[str, int]:
+        """
+        Push every queued edit, printing one line per repo as it finishes.
+
+        Returns:
+            Counts by status (updated, pr_created, unchanged, duplicate_pr, skipped, error)
+        """
+        load_env()
+        hf_token = os.getenv("HF_TOKEN")
+        if not hf_token:
+            raise ValueError("HF_TOKEN environment variable is not set")
+
+        journal = CommitJournal(self.journal) if self.journal else None
+        counts = {"updated": 0, "pr_created": 0, "unchanged": 0, "duplicate_pr": 0, "skipped": 0, "error": 0}
+
+        jobs = []
+        for pending in self.pending.values():
+            if journal and pending.key(self.create_pr) in journal.done:
+                print(f"- {pending.repo_id}: already done (journal)")
+                counts["skipped"] += 1
+            else:
+                jobs.append(pending)
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._push, pending, hf_token): pending for pending in jobs}
+            for future in as_completed(futures):
+                pending = futures[future]
+                outcome = future.result()
+                counts[outcome["status"]] += 1
+                if journal:
+                    journal.record({
+                        "repo_id": pending.repo_id,
+                        "key": pending.key(self.create_pr),
+                        "time": time.time(),
+                        **outcome,
+                    })
+                if outcome["status"] == "error":
+                    print(f"✗ {pending.repo_id}: {outcome['error']} (after {outcome['attempts']} attempts)")
+                elif outcome.get("pr") is not None:
+                    print(f"✓ {pending.repo_id}: {outcome['status']} (PR #{outcome['pr']})")
+                else:
+                    print(f"✓ {pending.repo_id}: {outcome['status']}")
+
+        self.pending.clear()
+        return counts
+
+
+def read_results_jsonl(source: str) -> Iterable[Dict[str, Any]]:
+    """Yield `{"repo_id", "results"}` records (e.g. extract-readme-batch output) from a file or `-`."""
+    f = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("repo_id") and record.get("results"):
+                yield record
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+if os.getenv("EVAL_MANAGER_BENCHMARK_VOCAB"):
+    # Loaded at import (once everything it calls is defined) so extraction
+    # worker processes see the same vocabulary
+    load_benchmark_vocabulary(os.environ["EVAL_MANAGER_BENCHMARK_VOCAB"])
+
+
+# ============================================================================
+# CLI Interface
+# ============================================================================
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    """Build the command-line parser (shared by main() and `serve` requests)."""
+    import argparse
+    from textwrap import dedent
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Manage evaluation results in Hugging Face model cards.\n\n"
+            "Use standard Python or `uv run scripts/evaluation_manager.py ...` "
+            "to auto-resolve dependencies from the PEP 723 header."
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog=dedent(
+            """\
+            Typical workflows:
+              - Inspect tables first:
+                  uv run scripts/evaluation_manager.py inspect-tables --repo-id <model>
+              - Extract from README (prints YAML by default):
+                  uv run scripts/evaluation_manager.py extract-readme --repo-id <model> --table N
+              - Apply changes:
+                  uv run scripts/evaluation_manager.py extract-readme --repo-id <model> --table N --apply
+              - Import from Artificial Analysis:
+                  AA_API_KEY=... uv run scripts/evaluation_manager.py import-aa --creator-slug org --model-name slug --repo-id <model>
+
+            Tips:
+              - YAML is printed by default; use --apply or --create-pr to write changes.
+              - Set HF_TOKEN (and AA_API_KEY for import-aa); .env is loaded automatically if python-dotenv is installed.
+              - When multiple tables exist, run inspect-tables then select with --table N.
+              - To apply changes (push or PR), rerun extract-readme with --apply or --create-pr.
+            """
+        ),
+    )
+    parser.add_argument("--version", action="version", version="evaluation_manager 1.2.0")
+    parser.add_argument(
+        "--benchmark-vocab",
+        type=str,
+        metavar="PATH",
+        help="Extra benchmark names (one per line) for table detection; also EVAL_MANAGER_BENCHMARK_VOCAB",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the local model card cache (see EVAL_MANAGER_CACHE_DIR / EVAL_MANAGER_CACHE_TTL)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=float(os.getenv("EVAL_MANAGER_RATE_LIMIT", "0")),
+        metavar="RPS",
+        help="Requests per second per host and token (default: EVAL_MANAGER_RATE_LIMIT, else unthrottled; 429s always pause)",
+    )
+    parser.add_argument(
+        "--request-budget",
+        type=int,
+        default=int(os.getenv("EVAL_MANAGER_REQUEST_BUDGET", "0")) or None,
+        metavar="N",
+        help="Send at most N HTTP requests and pushes in this run; later ones fail (default: EVAL_MANAGER_REQUEST_BUDGET)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report start-up and phase timings (import, env, fetch, parse, extract, push) as JSON on stderr",
+    )
+    parser.add_argument(
+        "--metrics",
+        choices=["json", "openmetrics"],
+        help="At the end of the run, report phase timings and counters (tables, cells, metrics, cache hits)",
+    )
+    parser.add_argument(
+        "--metrics-output",
+        "--profile-output",
+        dest="metrics_output",
+        type=str,
+        metavar="PATH",
+        help="Write the --metrics / --profile-startup report to PATH instead of stderr",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=str,
+        metavar="PATH",
+        help="JSON of millisecond limits per phase (plus startup/total); exit with status 3 if one is exceeded",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    # Extract from README command
+    extract_parser = subparsers.add_parser(
+        "extract-readme",
+        help="Extract evaluation tables from model README",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description="Parse README tables into model-index YAML. Default behavior prints YAML; use --apply/--create-pr to write changes.",
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py extract-readme --repo-id username/model
+              uv run scripts/evaluation_manager.py extract-readme --repo-id username/model --table 2 --model-column-index 3
+              uv run scripts/evaluation_manager.py extract-readme --repo-id username/model --table 2 --model-name-override \"**Model 7B**\"  # exact header text
+              uv run scripts/evaluation_manager.py extract-readme --repo-id username/model --table 2 --create-pr
+              uv run scripts/evaluation_manager.py extract-readme --repo-id org/family-card --table 1 --all-models \\
+                  --target-repo org/Model-7B --target-repo org/Model-32B --create-pr
+
+            Apply changes:
+              - Default: prints YAML to stdout (no writes).
+              - Add --apply to push directly, or --create-pr to open a PR.
+            Model selection:
+              - Preferred: --model-column-index <header index shown by inspect-tables>
+              - If using --model-name-override, copy the column header text exactly.
+              - --all-models extracts every model of the table; only models mapped to a repo
+                (--target-repo / --model-repo-map) are written with --apply/--create-pr.
+            """
+        ),
+    )
+    extract_parser.add_argument("--repo-id", type=str, help="HF repository ID (required unless --readme is given)")
+    extract_parser.add_argument("--readme", type=str, metavar="PATH", help="Extract from a local README instead of the Hub card (no network)")
+    extract_parser.add_argument("--table", type=int, help="Table number (1-indexed, from inspect-tables output)")
+    extract_parser.add_argument("--model-column-index", type=int, help="Preferred: column index from inspect-tables output (exact selection)")
+    extract_parser.add_argument("--model-name-override", type=str, help="Exact column header/model name for comparison/transpose tables (when index is not used)")
+    extract_parser.add_argument("--task-type", type=str, default="text-generation", help="Sets model-index task.type (e.g., text-generation, summarization)")
+    extract_parser.add_argument("--dataset-name", type=str, default="Benchmarks", help="Dataset name")
+    extract_parser.add_argument("--dataset-type", type=str, default="benchmark", help="Dataset type")
+    extract_parser.add_argument("--create-pr", action="store_true", help="Create PR instead of direct push")
+    extract_parser.add_argument("--apply", action="store_true", help="Apply changes (default is to print YAML only)")
+    extract_parser.add_argument("--dry-run", action="store_true", help="Preview YAML without updating (default)")
+    extract_parser.add_argument("--all-models", action="store_true", help="Extract every model column/row of the table in one pass")
+    extract_parser.add_argument("--target-repo", action="append", metavar="REPO_ID", help="With --all-models: repo to receive the model whose name matches its repo name (repeatable)")
+    extract_parser.add_argument("--model-repo-map", type=str, metavar="PATH", help="With --all-models: YAML/JSON file mapping table model names to repo ids")
+
+    # Batch extract command
+    batch_parser = subparsers.add_parser(
+        "extract-readme-batch",
+        help="Extract README evaluations for many repos (JSONL output)",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Read repo ids (one per line) from a file or stdin, fetch READMEs concurrently and\n"
+            "stream one JSON result per repo as soon as it finishes. Read-only; nothing is pushed."
+        ),
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py extract-readme-batch --input repos.txt > results.jsonl
+              cat repos.txt | uv run scripts/evaluation_manager.py extract-readme-batch --workers 16
+
+            Output record fields: repo_id, status (ok | no_results | error), results, messages, error.
+            Set HF_ENDPOINT to read READMEs from a mirror or local stand-in server.
+            """
+        ),
+    )
+    batch_parser.add_argument("--input", type=str, default="-", help="File with repo ids, or - for stdin (default)")
+    batch_parser.add_argument("--readme-dir", type=str, metavar="DIR", help="Process every README.md under DIR instead (no network)")
+    batch_parser.add_argument(
+        "--state",
+        type=str,
+        metavar="PATH",
+        help="Sync state file: skip READMEs unchanged since the last run and re-extract only changed tables",
+    )
+    batch_parser.add_argument("--workers", type=int, default=8, help="Concurrent README downloads (default: 8)")
+    batch_parser.add_argument("--processes", type=int, help="Extraction worker processes (default: CPU count)")
+    batch_parser.add_argument("--table", type=int, help="Table number to extract in every README (1-indexed)")
+    batch_parser.add_argument("--task-type", type=str, default="text-generation", help="Sets model-index task.type")
+    batch_parser.add_argument("--dataset-name", type=str, default="Benchmarks", help="Dataset name")
+    batch_parser.add_argument("--dataset-type", type=str, default="benchmark", help="Dataset type")
+
+    # Import from AA command
+    aa_parser = subparsers.add_parser(
+        "import-aa",
+        help="Import evaluation scores from Artificial Analysis",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description="Fetch scores from Artificial Analysis API and write them into model-index.",
+        epilog=dedent(
+            """\
+            Examples:
+              AA_API_KEY=... uv run scripts/evaluation_manager.py import-aa --creator-slug anthropic --model-name claude-sonnet-4 --repo-id username/model
+              uv run scripts/evaluation_manager.py import-aa --creator-slug openai --model-name gpt-4o --repo-id username/model --create-pr
+
+            Requires: AA_API_KEY in env (or .env if python-dotenv installed).
+            """
+        ),
+    )
+    aa_parser.add_argument("--creator-slug", type=str, required=True, help="AA creator slug")
+    aa_parser.add_argument("--model-name", type=str, required=True, help="AA model name")
+    aa_parser.add_argument("--repo-id", type=str, required=True, help="HF repository ID")
+    aa_parser.add_argument("--create-pr", action="store_true", help="Create PR instead of direct push")
+
+    # Batch import from AA command
+    aa_batch_parser = subparsers.add_parser(
+        "import-aa-batch",
+        help="Import Artificial Analysis scores for many models (one catalogue fetch)",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Resolve many models against a single download of the Artificial Analysis catalogue\n"
+            "and write each into its model card."
+        ),
+        epilog=dedent(
+            """\
+            Input format (one per line, # comments allowed):
+              anthropic/claude-sonnet-4 username/claude-sonnet-4-evals
+              openai/gpt-4o username/gpt-4o-evals
+
+            Examples:
+              uv run scripts/evaluation_manager.py import-aa-batch --input models.txt --dry-run
+              uv run scripts/evaluation_manager.py import-aa-batch --input models.txt --create-pr
+
+            The catalogue is cached for AA_CATALOGUE_TTL seconds (default 3600); use --refresh to refetch.
+            """
+        ),
+    )
+    aa_batch_parser.add_argument("--input", type=str, default="-", help="File with '<creator>/<model> <repo-id>' lines, or - for stdin")
+    aa_batch_parser.add_argument("--create-pr", action="store_true", help="Create PRs instead of direct pushes")
+    aa_batch_parser.add_argument("--dry-run", action="store_true", help="Print YAML instead of updating cards")
+    aa_batch_parser.add_argument("--refresh", action="store_true", help="Refetch the catalogue even if cached")
+    aa_batch_parser.add_argument("--workers", type=int, default=4, help="Concurrent card pushes (default: 4)")
+    aa_batch_parser.add_argument("--journal", type=str, metavar="PATH", help="Commit journal; rerun with the same path to resume")
+
+    # Import local evaluation logs command
+    import_results_parser = subparsers.add_parser(
+        "import-results",
+        help="Convert local lighteval results and inspect logs to model-index (JSONL output)",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Find lighteval results files (--output-dir of lighteval_vllm_uv.py) and inspect logs\n"
+            "(.eval archives or .json) under the given paths and print one model-index record per\n"
+            "model repo. Runs of the same model are merged; newer runs win. Read-only."
+        ),
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py import-results --input ./eval-results ./logs > results.jsonl
+              uv run scripts/evaluation_manager.py import-results --input logs/2025-01-01T10-00-00_mmlu.eval --repo-id username/model
+              uv run scripts/evaluation_manager.py import-results --input ./eval-results | \\
+                uv run scripts/evaluation_manager.py push-batch --create-pr
+
+            Runs go to the repo named by the model id they recorded (the vllm/, hf/, ... provider
+            prefix of inspect models is dropped); use --repo-id or --model-repo-map otherwise.
+            Output record fields: repo_id, status (ok | no_results | error), results, runs, path, error.
+            """
+        ),
+    )
+    import_results_parser.add_argument("--input", type=str, nargs="+", required=True, metavar="PATH", help="Result files or directories to search")
+    import_results_parser.add_argument("--format", choices=["auto", *RESULT_SOURCES], default="auto", help="Only read this kind of result file (default: auto)")
+    import_results_parser.add_argument("--repo-id", type=str, help="Repo receiving every run (default: the model id of each run)")
+    import_results_parser.add_argument("--model-repo-map", type=str, metavar="PATH", help="YAML/JSON file mapping recorded model ids to repo ids")
+    import_results_parser.add_argument("--include-subtasks", action="store_true", help="Also emit lighteval subtasks (e.g. each MMLU subject) as dataset configs")
+    import_results_parser.add_argument("--task-type", type=str, default="text-generation", help="Sets model-index task.type")
+
+    # Batch push command
+    push_batch_parser = subparsers.add_parser(
+        "push-batch",
+        help="Push model-index results for many repos (JSONL input)",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Push {repo_id, results} JSON lines (e.g. extract-readme-batch output) through a commit\n"
+            "queue: one commit per repo, bounded concurrency, backoff on 429/5xx, resumable journal."
+        ),
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py extract-readme-batch --input repos.txt > results.jsonl
+              uv run scripts/evaluation_manager.py push-batch --input results.jsonl --create-pr --journal push.journal
+
+            Records without results are ignored. Results are merged into each card's model-index;
+            unchanged cards are not pushed. Rerun with the same --journal to skip finished repos.
+            """
+        ),
+    )
+    push_batch_parser.add_argument("--input", type=str, default="-", help="JSONL file, or - for stdin (default)")
+    push_batch_parser.add_argument("--create-pr", action="store_true", help="Create PRs instead of direct pushes")
+    push_batch_parser.add_argument("--workers", type=int, default=4, help="Concurrent card pushes (default: 4)")
+    push_batch_parser.add_argument("--journal", type=str, metavar="PATH", help="Commit journal; rerun with the same path to resume")
+    push_batch_parser.add_argument("--max-retries", type=int, default=5, help="Retries per repo on 429/5xx (default: 5)")
+    push_batch_parser.add_argument("--commit-message", type=str, help="Commit message for every push")
+
+    # Show evaluations command
+    show_parser = subparsers.add_parser(
+        "show",
+        help="Display current evaluations in model card",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description="Print model-index content from the model card (requires HF_TOKEN for private repos).",
+    )
+    show_parser.add_argument("--repo-id", type=str, required=True, help="HF repository ID")
+
+    # Validate command
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="Validate model-index format",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Check the model-index section of a card against the model-index schema.\n"
+            "All problems are listed with their JSON path; exits with status 1 if any card is invalid."
+        ),
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py validate --repo-id username/model-name
+              uv run scripts/evaluation_manager.py validate --from-file README.md results.yaml
+              uv run scripts/evaluation_manager.py validate --readme path/to/README.md
+              uv run scripts/evaluation_manager.py validate --readme-dir models/
+            """
+        ),
+    )
+    validate_source = validate_parser.add_mutually_exclusive_group(required=True)
+    validate_source.add_argument("--repo-id", type=str, help="HF repository ID")
+    validate_source.add_argument(
+        "--from-file",
+        type=str,
+        nargs="+",
+        metavar="PATH",
+        help="Local README.md (front matter) or YAML file(s) with a model-index",
+    )
+    validate_source.add_argument("--readme", type=str, metavar="PATH", help="Validate a local README.md (no network)")
+    validate_source.add_argument("--readme-dir", type=str, metavar="DIR", help="Validate every README.md under DIR")
+
+    # Batch validate command
+    validate_batch_parser = subparsers.add_parser(
+        "validate-batch",
+        help="Validate the model-index of many repos (JSONL output)",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Read repo ids (one per line) from a file or stdin, validate their model-index\n"
+            "concurrently and stream one JSON record per repo. Exits with status 1 if any is invalid."
+        ),
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py validate-batch --input repos.txt > validation.jsonl
+              uv run scripts/evaluation_manager.py validate-batch --input repos.txt --allow-missing
+
+            Output record fields: repo_id, status (valid | invalid | missing | error), errors, error.
+            """
+        ),
+    )
+    validate_batch_parser.add_argument("--input", type=str, default="-", help="File with repo ids, or - for stdin (default)")
+    validate_batch_parser.add_argument("--workers", type=int, default=16, help="Concurrent card fetches (default: 16)")
+    validate_batch_parser.add_argument(
+        "--allow-missing", action="store_true", help="Do not fail for repos without a model-index"
+    )
+
+    # Leaderboard index commands
+    index_parser = subparsers.add_parser(
+        "index-cards",
+        help="Build or refresh a local leaderboard index of many model cards",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Fetch model cards concurrently and store their model-index scores in a local SQLite\n"
+            "index, keyed by canonical benchmark and metric. Cards unchanged since the last run\n"
+            "are skipped, so rerunning refreshes the index incrementally."
+        ),
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py index-cards --author my-org
+              uv run scripts/evaluation_manager.py index-cards --input repos.txt --db evals.sqlite --prune
+
+            The default index is leaderboard.sqlite in the cache directory (EVAL_MANAGER_CACHE_DIR).
+            """
+        ),
+    )
+    index_source = index_parser.add_mutually_exclusive_group(required=True)
+    index_source.add_argument("--input", type=str, help="File with repo ids, or - for stdin")
+    index_source.add_argument("--author", type=str, help="Index every model of this user or organization")
+    index_parser.add_argument("--db", type=str, metavar="PATH", help="Index file (default: <cache dir>/leaderboard.sqlite)")
+    index_parser.add_argument("--workers", type=int, default=16, help="Concurrent card fetches (default: 16)")
+    index_parser.add_argument("--prune", action="store_true", help="Drop indexed repos that are no longer in the input")
+
+    leaderboard_parser = subparsers.add_parser(
+        "leaderboard",
+        help="Rank indexed models on a benchmark (see index-cards)",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description="Query the local leaderboard index: top models on a benchmark, or the indexed benchmarks.",
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py leaderboard --benchmark GSM8K --author my-org --limit 20
+              uv run scripts/evaluation_manager.py leaderboard --benchmark "ARC-C" --metric-type acc_norm --min 0.5
+              uv run scripts/evaluation_manager.py leaderboard            # list indexed benchmarks
+
+            Benchmark and metric names are matched in any spelling (MMLU-Pro, mmlu_pro, ...).
+            Without --metric-type, each card's first metric for the benchmark is used.
+            """
+        ),
+    )
+    leaderboard_parser.add_argument("--db", type=str, metavar="PATH", help="Index file (default: <cache dir>/leaderboard.sqlite)")
+    leaderboard_parser.add_argument("--benchmark", type=str, help="Benchmark to rank on (omit to list benchmarks)")
+    leaderboard_parser.add_argument("--metric-type", type=str, dest="metric", help="Metric of the benchmark (e.g. acc_norm)")
+    leaderboard_parser.add_argument("--author", type=str, help="Only models of this user or organization")
+    leaderboard_parser.add_argument("--task-type", type=str, help="Only results with this task.type")
+    leaderboard_parser.add_argument("--min", type=float, dest="min_value", help="Only scores >= this value")
+    leaderboard_parser.add_argument("--max", type=float, dest="max_value", help="Only scores <= this value")
+    leaderboard_parser.add_argument("--limit", type=int, default=20, help="Number of models (default: 20)")
+    leaderboard_parser.add_argument("--ascending", action="store_true", help="Lowest scores first")
+    leaderboard_parser.add_argument("--json", action="store_true", help="Print JSON lines instead of a table")
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="Compare indexed models benchmark by benchmark (see index-cards)",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description="Show the indexed scores of several models side by side.",
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py compare --repo-id org/model-a --repo-id org/model-b
+              uv run scripts/evaluation_manager.py compare --repo-id org/model-a --repo-id org/model-b --benchmark mmlu --benchmark gsm8k
+            """
+        ),
+    )
+    compare_parser.add_argument("--db", type=str, metavar="PATH", help="Index file (default: <cache dir>/leaderboard.sqlite)")
+    compare_parser.add_argument("--repo-id", type=str, action="append", required=True, help="Repo to compare (repeatable)")
+    compare_parser.add_argument("--benchmark", type=str, action="append", help="Only these benchmarks (repeatable)")
+    compare_parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+
+    # Inspect tables command
+    inspect_parser = subparsers.add_parser(
+        "inspect-tables",
+        help="Inspect tables in README → outputs suggested extract-readme command",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Workflow:
+  1. inspect-tables     → see table structure, columns, and table numbers
+  2. extract-readme     → run with --table N (from step 1); YAML prints by default
+  3. apply changes      → rerun extract-readme with --apply or --create-pr
+
+Reminder:
+  - Preferred: use --model-column-index <index>. If needed, use --model-name-override with the exact column header text.
+"""
+    )
+    inspect_parser.add_argument("--repo-id", type=str, help="HF repository ID (required unless --readme is given)")
+    inspect_parser.add_argument("--readme", type=str, metavar="PATH", help="Inspect a local README instead of the Hub card")
+
+    # Get PRs command
+    prs_parser = subparsers.add_parser(
+        "get-prs",
+        help="List open pull requests for a model repository",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description="Check for existing open PRs before creating new ones to avoid duplicates.",
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py get-prs --repo-id "allenai/Olmo-3-32B-Think"
+
+            IMPORTANT: Always run this before using --create-pr to avoid duplicate PRs.
+            """
+        ),
+    )
+    prs_parser.add_argument("--repo-id", type=str, required=True, help="HF repository ID")
+
+    # Batch PR scan command
+    prs_batch_parser = subparsers.add_parser(
+        "get-prs-batch",
+        help="List open pull requests for many repos (JSONL output)",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Read repo ids (one per line) from a file or stdin, scan their open PRs concurrently\n"
+            "(all pages, ETag-cached) and stream one JSON record per repo."
+        ),
+        epilog=dedent(
+            """\
+            Examples:
+              uv run scripts/evaluation_manager.py get-prs-batch --input repos.txt > prs.jsonl
+              uv run scripts/evaluation_manager.py get-prs-batch --input repos.txt --workers 16 --refresh
+
+            Output record fields: repo_id, status (with_prs | no_prs | error), open_prs, error.
+            Scans are cached for EVAL_MANAGER_CACHE_TTL seconds; --create-pr pushes made within
+            that window reuse them to skip repos that already have an identical open PR.
+            """
+        ),
+    )
+    prs_batch_parser.add_argument("--input", type=str, default="-", help="File with repo ids, or - for stdin (default)")
+    prs_batch_parser.add_argument("--workers", type=int, default=8, help="Concurrent scans (default: 8)")
+    prs_batch_parser.add_argument("--refresh", action="store_true", help="Revalidate every repo even if recently scanned")
+
+    # Daemon command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Answer commands as JSON-RPC requests from a long-lived process",
+        formatter_class=argparse.RawTextHelpFormatter,
+        description=(
+            "Keep imports, HTTP connections and fetched cards warm and run subcommands sent as\n"
+            "JSON-RPC 2.0 requests, one JSON object per line, over stdin/stdout or a Unix socket."
+        ),
+        epilog=dedent(
+            """\
+            Request: the method is a subcommand; params are its arguments, either as an argv list
+            or as an object of option names (underscores or dashes; true for flags):
+              {"jsonrpc": "2.0", "id": 1, "method": "inspect-tables", "params": {"repo_id": "org/model"}}
+              {"jsonrpc": "2.0", "id": 2, "method": "extract-readme", "params": ["--repo-id", "org/model", "--table", "2"]}
+            Optional "stdin" (object params only) is fed to commands reading --input -.
+            Response result: {"exit_code", "stdout", "stderr", "elapsed_ms"}.
+            Also: "ping" and "shutdown".
+
+            Examples:
+              uv run scripts/evaluation_manager.py serve --socket /tmp/eval-manager.sock &
+              echo '{"id": 1, "method": "show", "params": {"repo_id": "org/model"}}' | nc -U -q1 /tmp/eval-manager.sock
+            """
+        ),
+    )
+    serve_parser.add_argument("--socket", type=str, metavar="PATH", help="Listen on a Unix socket instead of stdin/stdout")
+
+    return parser
+
+
+def run_command(args: "argparse.Namespace") -> None:
+    """Execute a parsed command line (everything main() does after parsing)."""
+    profiling = bool(args.profile_startup or args.metrics or args.metrics_output or args.startup_budget)
+    PROFILER.reset(enabled=profiling)
+    RATE_LIMITER.configure(rate=args.rate_limit, budget=args.request_budget)
+    started = time.perf_counter()
+    try:
+        _dispatch(args)
+    finally:
+        summary = RATE_LIMITER.summary()
+        if summary:
+            print(summary, file=sys.stderr)
+        if profiling:
+            _report_profile(args, time.perf_counter() - started)
+
+
+def _report_profile(args: "argparse.Namespace", elapsed: float) -> None:
+    PROFILER.enabled = False
+    report = PROFILER.report(elapsed + (PROFILER.startup_seconds or 0.0))
+    report["command"] = args.command
+    if RATE_LIMITER.requests:
+        report["rate_limit"] = RATE_LIMITER.report()
+    if args.metrics == "openmetrics":
+        rendered = render_openmetrics(report)
+    else:
+        rendered = json.dumps(report, indent=2) + "\n"
+    if args.metrics_output:
+        try:
+            with open(args.metrics_output, "w", encoding="utf-8") as f:
+                f.write(rendered)
+        except OSError as e:
+            sys.exit(f"error: cannot write --metrics-output: {e}")
+    elif args.profile_startup or args.metrics:
+        sys.stderr.write(rendered)
+
+    if args.startup_budget:
+        try:
+            exceeded = check_startup_budget(report, args.startup_budget)
+        except (OSError, ValueError) as e:
+            sys.exit(f"error: cannot read --startup-budget: {e}")
+        if exceeded:
+            print("Startup budget exceeded:\n  " + "\n  ".join(exceeded), file=sys.stderr)
+            sys.exit(3)
+
+
+def _dispatch(args: "argparse.Namespace") -> None:
+    if args.command in ("extract-readme", "inspect-tables") and not args.repo_id:
+        if not args.readme:
+            sys.exit(f"error: {args.command} needs --repo-id or --readme")
+        if args.command == "extract-readme" and (args.apply or args.create_pr):
+            sys.exit("error: --apply/--create-pr with --readme need --repo-id to name the repo to update")
+        # Local README: its directory stands in for the repo (model name and source URL)
+        args.repo_id = local_repo_id(args.readme)
+
+    if args.no_cache:
+        # Also inherited by extraction worker processes
+        os.environ["EVAL_MANAGER_NO_CACHE"] = "1"
+
+    try:
+        if args.benchmark_vocab:
+            os.environ["EVAL_MANAGER_BENCHMARK_VOCAB"] = args.benchmark_vocab
+            load_benchmark_vocabulary(args.benchmark_vocab)
+
+        # Execute command
+        if args.command == "extract-readme" and args.all_models:
+            per_model = extract_all_model_evaluations(
+                repo_id=args.repo_id,
+                task_type=args.task_type,
+                dataset_name=args.dataset_name,
+                dataset_type=args.dataset_type,
+                table_index=args.table,
+                readme_path=args.readme
+            )
+
+            if not per_model:
+                print("No evaluations extracted")
+                return
+
+            name_map = None
+            if args.model_repo_map:
+                with open(args.model_repo_map, encoding="utf-8") as f:
+                    name_map = load_yaml(f.read()) or {}
+            targets = map_models_to_repos(list(per_model), args.target_repo, name_map)
+
+            print(f"\nExtracted evaluations for {len(per_model)} models (YAML):")
+            for model_name, results in per_model.items():
+                target = targets.get(model_name)
+                print(f"\n# {model_name}" + (f" → {target}" if target else " (no target repo)"))
+                entry_name = target.split("/")[-1] if target else strip_markdown(model_name)
+                print(dump_yaml({"model-index": ordered_model_index([{"name": entry_name, "results": results}])}))
+
+            if args.apply or args.create_pr:
+                if not targets:
+                    print("No models mapped to repositories; use --target-repo or --model-repo-map.")
+                queue = CommitQueue(create_pr=args.create_pr)
+                for model_name, target in targets.items():
+                    queue.add(
+                        target,
+                        per_model[model_name],
+                        commit_message=f"Extract evaluation results from {args.repo_id} README"
+                    )
+                queue.run()
+
+        elif args.command == "extract-readme":
+            results = extract_evaluations_from_readme(
+                repo_id=args.repo_id,
+                task_type=args.task_type,
+                dataset_name=args.dataset_name,
+                dataset_type=args.dataset_type,
+                model_name_override=args.model_name_override,
+                table_index=args.table,
+                model_column_index=args.model_column_index,
+                readme_path=args.readme
+            )
+
+            if not results:
+                print("No evaluations extracted")
+                return
+
+            apply_changes = args.apply or args.create_pr
+
+            # Default behavior: print YAML (dry-run)
+            print("\nExtracted evaluations (YAML):")
+            print(dump_yaml({"model-index": ordered_model_index([{"name": args.repo_id.split('/')[-1], "results": results}])}))
+
+            if apply_changes:
+                if args.model_name_override and args.model_column_index is not None:
+                    print("Note: --model-column-index takes precedence over --model-name-override.")
+                update_model_card_with_evaluations(
+                    repo_id=args.repo_id,
+                    results=results,
+                    create_pr=args.create_pr,
+                    commit_message="Extract evaluation results from README"
+                )
+
+        elif args.command == "extract-readme-batch":
+            options = dict(
+                task_type=args.task_type,
+                dataset_name=args.dataset_name,
+                dataset_type=args.dataset_type,
+                table_index=args.table
+            )
+            state = ExtractionState(args.state) if args.state else None
+            if args.readme_dir:
+                counts = extract_local_readme_batch(
+                    require_local_readmes(args.readme_dir),
+                    root=args.readme_dir,
+                    processes=args.processes,
+                    state=state,
+                    **options
+                )
+            else:
+                counts = extract_readme_batch(
+                    read_repo_ids(args.input),
+                    workers=args.workers,
+                    processes=args.processes,
+                    state=state,
+                    **options
+                )
+            print(
+                f"Processed {sum(counts.values())} repos: {counts['ok']} ok, "
+                f"{counts['no_results']} without results, {counts['error']} errors, "
+                f"{counts['unchanged']} unchanged since the last sync",
+                file=sys.stderr
+            )
+
+        elif args.command == "import-aa":
+            results = import_aa_evaluations(
+                creator_slug=args.creator_slug,
+                model_name=args.model_name,
+                repo_id=args.repo_id
+            )
+
+            if not results:
+                print("No evaluations imported")
+                return
+
+            update_model_card_with_evaluations(
+                repo_id=args.repo_id,
+                results=results,
+                create_pr=args.create_pr,
+                commit_message=f"Add Artificial Analysis evaluations for {args.model_name}"
+            )
+
+        elif args.command == "import-aa-batch":
+            specs = read_aa_import_specs(args.input)
+            if args.refresh:
+                load_aa_catalogue(refresh=True)
+            counts = import_aa_batch(
+                specs,
+                create_pr=args.create_pr,
+                dry_run=args.dry_run,
+                workers=args.workers,
+                journal=args.journal
+            )
+            print(
+                f"\nImported {counts['updated']} of {len(specs)} models "
+                f"({counts['not_found']} not found, {counts['failed']} failed)"
+            )
+
+        elif args.command == "import-results":
+            name_map = None
+            if args.model_repo_map:
+                with open(args.model_repo_map, encoding="utf-8") as f:
+                    name_map = load_yaml(f.read()) or {}
+            counts = import_results(
+                args.input,
+                sources=None if args.format == "auto" else [args.format],
+                repo_id=args.repo_id,
+                name_map=name_map,
+                task_type=args.task_type,
+                include_subtasks=args.include_subtasks
+            )
+            print(
+                f"Imported {counts['runs']} runs into {counts['ok']} repos "
+                f"({counts['no_results']} without results, {counts['error']} errors, "
+                f"{counts['skipped']} other files)",
+                file=sys.stderr
+            )
+
+        elif args.command == "push-batch":
+            queue = CommitQueue(
+                create_pr=args.create_pr,
+                workers=args.workers,
+                journal=args.journal,
+                max_retries=args.max_retries
+            )
+            for record in read_results_jsonl(args.input):
+                queue.add(record["repo_id"], record["results"], commit_message=args.commit_message)
+            if not queue.pending:
+                print("No results to push")
+                return
+            counts = queue.run()
+            print(
+                f"\nPushed {sum(counts.values())} repos: {counts['updated']} updated, "
+                f"{counts['pr_created']} PRs, {counts['unchanged']} unchanged, "
+                f"{counts['duplicate_pr']} with an open PR already, "
+                f"{counts['skipped']} skipped (journal), {counts['error']} failed"
+            )
+
+        elif args.command == "show":
+            show_evaluations(args.repo_id)
+
+        elif args.command == "validate":
+            if args.from_file:
+                valid = validate_model_index_files(args.from_file)
+            elif args.readme:
+                valid = validate_model_index_files([args.readme])
+            elif args.readme_dir:
+                valid = validate_model_index_files(require_local_readmes(args.readme_dir))
+            else:
+                valid = validate_model_index(args.repo_id)
+            if not valid:
+                sys.exit(1)
+
+        elif args.command == "validate-batch":
+            counts = validate_model_index_batch(read_repo_ids(args.input), workers=args.workers)
+            print(
+                f"Validated {sum(counts.values())} repos: {counts['valid']} valid, {counts['invalid']} invalid, "
+                f"{counts['missing']} without model-index, {counts['error']} errors",
+                file=sys.stderr
+            )
+            if counts["invalid"] or counts["error"] or (counts["missing"] and not args.allow_missing):
+                sys.exit(1)
+
+        elif args.command == "index-cards":
+            if args.author:
+                load_env()
+                repo_ids = list_author_models(args.author, token=os.getenv("HF_TOKEN"))
+            else:
+                repo_ids = read_repo_ids(args.input)
+            with LeaderboardIndex(args.db or default_index_path()) as index:
+                counts = index.refresh(repo_ids, workers=args.workers, prune=args.prune)
+            print(
+                f"Indexed {counts['indexed']} of {len(repo_ids)} cards: {counts['unchanged']} unchanged, "
+                f"{counts['missing']} without scores, {counts['error']} errors"
+                + (f", {counts['pruned']} pruned" if args.prune else "")
+            )
+
+        elif args.command == "leaderboard":
+            with LeaderboardIndex(args.db or default_index_path()) as index:
+                if not args.benchmark:
+                    for benchmark, repos in index.benchmarks(author=args.author):
+                        print(f"{benchmark:<40} {repos:>6} models")
+                    return
+                rows = index.rank(
+                    args.benchmark,
+                    metric=args.metric,
+                    limit=args.limit,
+                    author=args.author,
+                    min_value=args.min_value,
+                    max_value=args.max_value,
+                    task_type=args.task_type,
+                    ascending=args.ascending
+                )
+            if args.json:
+                for row in rows:
+                    print(json.dumps(row, ensure_ascii=False))
+            elif not rows:
+                print(f"No indexed scores for {canonicalize(args.benchmark)}")
+            else:
+                print(f"\n{benchmark_display_name(args.benchmark)}:")
+                for row in rows:
+                    metric = f"  ({row['metric_name'] or row['metric']})" if row["metric"] else ""
+                    print(f"{row['rank']:>4}. {row['repo_id']:<50} {row['value']:>10g}{metric}")
+
+        elif args.command == "compare":
+            with LeaderboardIndex(args.db or default_index_path()) as index:
+                table = index.compare(args.repo_id, args.benchmark)
+            if args.json:
+                print(json.dumps(table, ensure_ascii=False, indent=2))
+            else:
+                names = [repo_id.split("/")[-1] for repo_id in args.repo_id]
+                widths = [max(len(name), 10) for name in names]
+                print(f"{'Benchmark':<30} " + " ".join(f"{n:>{w}}" for n, w in zip(names, widths)))
+                for benchmark, scores in table.items():
+                    cells = [
+                        f"{scores[r]:>{w}g}" if r in scores else f"{'-':>{w}}"
+                        for r, w in zip(args.repo_id, widths)
+                    ]
+                    print(f"{benchmark_display_name(benchmark):<30} " + " ".join(cells))
+
+        elif args.command == "inspect-tables":
+            inspect_tables(args.repo_id, readme_path=args.readme)
+
+        elif args.command == "get-prs":
+            list_open_prs(args.repo_id)
+
+        elif args.command == "get-prs-batch":
+            counts = get_open_prs_batch(read_repo_ids(args.input), workers=args.workers, revalidate=args.refresh)
+            print(
+                f"Scanned {sum(counts.values())} repos: {counts['with_prs']} with open PRs, "
+                f"{counts['no_prs']} without, {counts['error']} errors",
+                file=sys.stderr
+            )
+    except ModuleNotFoundError as exc:
+        # Surface dependency hints cleanly when user only needs help output
+        print(exc)
+    except Exception as exc:
+        print(f"Error: {exc}")
+
+
+# ============================================================================
+# Daemon Mode
+# ============================================================================
+
+
+# Options of the top-level parser; they must precede the subcommand on the command line
+_GLOBAL_OPTIONS = {
+    "--no-cache": 0,
+    "--benchmark-vocab": 1,
+    "--profile-startup": 0,
+    "--metrics": 1,
+    "--metrics-output": 1,
+    "--profile-output": 1,
+    "--startup-budget": 1,
+    "--rate-limit": 1,
+    "--request-budget": 1,
+}
+
+
+def rpc_params_to_argv(method: str, params: Any) -> List[str]:
+    """Turn JSON-RPC params (argv list or option object) into a command line."""
+    if params is None:
+        params = []
+    if isinstance(params, dict):
+        args = []
+        for name, value in params.items():
+            if name == "stdin" or value is None or value is False:
+                continue
+            option = "--" + name.replace("_", "-")
+            if value is True:
+                args.append(option)
+            elif isinstance(value, list):
+                for item in value:
+                    args += [option, str(item)]
+            else:
+                args += [option, str(value)]
+    elif isinstance(params, list):
+        args = [str(value) for value in params]
+    else:
+        raise ValueError("params must be a list of arguments or an object of options")
+
+    global_args, command_args = [], []
+    i = 0
+    while i < len(args):
+        nargs = _GLOBAL_OPTIONS.get(args[i])
+        if nargs is None:
+            command_args.append(args[i])
+            i += 1
+        else:
+            global_args += args[i:i + 1 + nargs]
+            i += 1 + nargs
+    return global_args + [method] + command_args
+
+
+def handle_rpc_request(parser: "argparse.ArgumentParser", request: Any) -> Optional[Dict[str, Any]]:
+    """
+    Run one JSON-RPC request in-process and build its response.
+
+    Command output is captured, global flags (--no-cache, --profile-startup, ...)
+    only apply to this request, and notifications (no "id") get no response.
+    Benchmarks registered by --benchmark-vocab are dropped afterwards, so one
+    request cannot change canonicalization for the next. A command that raises
+    is reported with exit_code 1 and its traceback on stderr.
+    """
+    import argparse
+
+    global EVAL_TABLE_MATCHER, BENCHMARK_HEADER_MATCHER
+
+    if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+        return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+
+    request_id = request.get("id")
+    method = request["method"]
+    params = request.get("params")
+
+    def reply(result: Any = None, error: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        if "id" not in request:
+            return None
+        response = {"jsonrpc": "2.0", "id": request_id}
+        if error is None:
+            response["result"] = result
+        else:
+            response["error"] = error
+        return response
+
+    if method == "ping":
+        return reply({"pid": os.getpid()})
+    if method == "shutdown":
+        return reply({"stopping": True})
+    commands = next(a.choices for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    if method not in commands or method == "serve":
+        return reply(error={"code": -32601, "message": f"Method not found: {method}"})
+
+    try:
+        argv = rpc_params_to_argv(method, params)
+    except ValueError as e:
+        return reply(error={"code": -32602, "message": str(e)})
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    stdin_text = params.get("stdin", "") if isinstance(params, dict) else ""
+    saved_env = dict(os.environ)
+    saved_matchers = (EVAL_TABLE_MATCHER, BENCHMARK_HEADER_MATCHER)
+    saved_aliases = dict(BENCHMARK_ALIASES)
+    saved_stdin = sys.stdin
+    exit_code = 0
+    started = time.perf_counter()
+    try:
+        sys.stdin = io.StringIO(stdin_text)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                args = parser.parse_args(argv)
+                run_command(args)
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                # A failing request must not take the daemon down with it
+                import traceback
+
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.stdin = saved_stdin
+        if dict(os.environ) != saved_env:
+            os.environ.clear()
+            os.environ.update(saved_env)
+            get_card_cache.cache_clear()
+        if (EVAL_TABLE_MATCHER, BENCHMARK_HEADER_MATCHER) != saved_matchers:
+            EVAL_TABLE_MATCHER, BENCHMARK_HEADER_MATCHER = saved_matchers
+            _parse_tables.cache_clear()
+        if BENCHMARK_ALIASES != saved_aliases:
+            BENCHMARK_ALIASES.clear()
+            BENCHMARK_ALIASES.update(saved_aliases)
+            clear_benchmark_caches()
+
+    return reply({
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    })
+
+
+def _serve_lines(parser: "argparse.ArgumentParser", reader: Any, writer: Any) -> bool:
+    """Answer line-delimited requests until EOF; returns False after a shutdown request."""
+    # readline() rather than iteration: it returns as soon as a line arrives on a socket
+    for line in iter(reader.readline, ""):
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = None
+            response = {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+        else:
+            response = handle_rpc_request(parser, request)
+        if response is not None:
+            writer.write(json.dumps(response, ensure_ascii=False) + "\n")
+            writer.flush()
+        if isinstance(request, dict) and request.get("method") == "shutdown":
+            return False
+    return True
+
+
+def serve(parser: "argparse.ArgumentParser", socket_path: Optional[str] = None) -> None:
+    """
+    Run subcommands sent as JSON-RPC requests until EOF or a shutdown request.
+
+    Requests are handled one at a time in this process, so imports, the pooled
+    HTTP session and the in-memory card cache stay warm between calls. With a
+    socket path, each connection may send any number of requests.
+    """
+    load_env()
+    # Requests run warm; their profiles have no start-up component
+    PROFILER.startup_seconds = None
+    if socket_path is None:
+        _serve_lines(parser, sys.stdin, sys.stdout)
+        return
+
+    import socket
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    print(f"Listening on {socket_path}", file=sys.stderr)
+    try:
+        running = True
+        while running:
+            connection, _ = server.accept()
+            with connection, connection.makefile("r", encoding="utf-8") as reader, \
+                    connection.makefile("w", encoding="utf-8") as writer:
+                try:
+                    running = _serve_lines(parser, reader, writer)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+    finally:
+        server.close()
+        os.remove(socket_path)
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    # Module body, parser construction and argument parsing
+    PROFILER.startup_seconds = time.perf_counter() - _MODULE_STARTED
+
+    if not args.command:
+        parser.print_help()
+        return
+
+    if args.command == "serve":
+        run_command(args)  # apply global flags for the daemon's lifetime
+        serve(parser, args.socket)
+        return
+
+    run_command(args)
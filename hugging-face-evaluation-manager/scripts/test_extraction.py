@@ -6,10 +6,40 @@ This script demonstrates the table extraction capabilities without
 requiring HF tokens or making actual API calls.
 """
 
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import yaml
 
+import evaluation_manager
+
 from evaluation_manager import (
+    build_parser,
+    canonicalize,
+    ParsedTable,
+    ExtractionState,
+    extract_readme_batch,
+    find_duplicate_pr,
+    merge_model_index,
+    merge_model_index_results,
+    push_model_index,
+    validate_model_index_data,
+    CardCache,
+    RateLimiter,
+    _http_classes,
+    _SKIPPED,
+    iter_json_members,
+    get_card_cache,
+    RATE_LIMITER,
     extract_tables_from_markdown,
+    handle_rpc_request,
     parse_markdown_table,
     is_evaluation_table,
     extract_metrics_from_table
@@ -90,6 +120,12 @@ def test_table_parsing(tables):
 
         parsed_tables.append((header, rows))
 
+    table = ParsedTable.from_rows(["Model", "MMLU", "GSM8K"], [["a", "85.2%", "1,024"], ["b", "—", " 91 % "], ["c"]])
+    assert table.values == [[None, 85.2, 1024.0], [None, None, 91.0], [None]]
+    assert table.matrix.shape == (3, 3) and table.numeric_mask.sum() == 3
+    assert table.percent_mask.tolist() == [[False, True, False], [False, False, True], [False, False, False]]
+    print("\n✓ Cells parse into a float matrix with a percent mask; ragged rows are padded")
+
     return parsed_tables
 
 
@@ -110,6 +146,13 @@ def test_evaluation_detection(parsed_tables):
             eval_tables.append((header, rows))
 
     print(f"\nFound {len(eval_tables)} evaluation tables")
+
+    matcher = evaluation_manager.BENCHMARK_HEADER_MATCHER
+    assert matcher.benchmark_type("mmlu", "**MMLU**") == "mmlu"
+    assert matcher.benchmark_type("mmlu", "MMLU-Pro") is None
+    table = ParsedTable.from_rows(["Model", "MMLU", "MMLU-Pro", "GSM8K", "Params"], [])
+    assert table.header_benchmarks == [None, "mmlu", "mmlu_pro", "gsm8k", None]
+    print("✓ Benchmark headers take their type from the keyword match, or canonicalize when it is partial")
     return eval_tables
 
 
@@ -165,6 +208,453 @@ def test_model_index_format(metrics):
     print(yaml.dump(model_index, sort_keys=False, default_flow_style=False))
 
 
+def serve_request(parser, params):
+    """Send one extract-readme request through the serve handler; return its result."""
+    response = handle_rpc_request(parser, {"jsonrpc": "2.0", "id": 1, "method": "extract-readme", "params": params})
+    return response["result"]
+
+
+def test_serve_isolation():
+    """Test that per-request global flags of `serve` do not leak into later requests."""
+    print("\n" + "=" * 60)
+    print("TEST 6: Serve Request Isolation")
+    print("=" * 60)
+
+    parser = build_parser()
+    with tempfile.TemporaryDirectory() as tmp:
+        readme = os.path.join(tmp, "README.md")
+        with open(readme, "w", encoding="utf-8") as f:
+            f.write("| Benchmark | Score |\n|---|---|\n| NB-X | 50 |\n| MMLU | 60 |\n")
+        vocab = os.path.join(tmp, "vocab.txt")
+        with open(vocab, "w", encoding="utf-8") as f:
+            f.write("Nova Bench = NB-X\n")
+
+        with_vocab = serve_request(parser, {"readme": readme, "table": 1, "benchmark_vocab": vocab})
+        print(f"\nWith --benchmark-vocab: exit {with_vocab['exit_code']}")
+        assert with_vocab["exit_code"] == 0, with_vocab["stderr"]
+        assert "type: nova_bench" in with_vocab["stdout"]
+
+        without_vocab = serve_request(parser, {"readme": readme, "table": 1})
+        print(f"Next request without it: exit {without_vocab['exit_code']}")
+        assert "type: nb_x" in without_vocab["stdout"]
+        assert canonicalize("NB-X") == "nb_x"
+
+        limited = serve_request(parser, {"readme": readme, "table": 1, "rate_limit": 2, "request_budget": 50})
+        print(f"With --rate-limit and --request-budget: exit {limited['exit_code']}")
+        assert limited["exit_code"] == 0, limited["stderr"]
+        assert RATE_LIMITER.rate == 2 and RATE_LIMITER.budget == 50
+
+        missing = os.path.join(tmp, "missing.txt")
+        bad_vocab = serve_request(parser, {"readme": readme, "table": 1, "benchmark_vocab": missing})
+        print(f"With a missing --benchmark-vocab: exit {bad_vocab['exit_code']}")
+        assert "missing.txt" in bad_vocab["stdout"] + bad_vocab["stderr"]
+        bad_budget = serve_request(parser, {"readme": readme, "table": 1, "startup_budget": missing})
+        print(f"With a missing --startup-budget: exit {bad_budget['exit_code']}")
+        assert bad_budget["exit_code"] != 0
+        bad_output = serve_request(parser, {"readme": readme, "table": 1, "metrics_output": tmp})
+        print(f"With an unwritable --metrics-output: exit {bad_output['exit_code']}")
+        assert bad_output["exit_code"] != 0
+        pong = handle_rpc_request(parser, {"jsonrpc": "2.0", "id": 2, "method": "ping"})
+        assert pong["result"]["pid"] == os.getpid()
+
+    print("✓ Benchmark aliases registered by one request are gone for the next")
+    print("✓ Rate limit and request budget are accepted as per-request global flags")
+    print("✓ A failing request is reported and the daemon keeps answering")
+
+
+@contextmanager
+def local_hub(cards, api=None):
+    """
+    Serve model card READMEs from a dict on localhost and point HF_ENDPOINT at it.
+
+    `api` maps other paths (query string ignored) to JSON responses;
+    /api/whoami-v2 answers with the bearer token as the user name. Cards can be
+    edited while the hub runs. Yields the list of (path, status) of the
+    requests served; the card cache lives in a temporary directory.
+    """
+    served = []
+    api = api or {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def send_json(self, data):
+            body = json.dumps(data).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            served.append((self.path, 200))
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/api/whoami-v2":
+                self.send_json({"name": self.headers.get("Authorization", "").removeprefix("Bearer ")})
+                return
+            if path in api:
+                self.send_json(api[path])
+                return
+            repo_id = self.path.split("/resolve/")[0].lstrip("/")
+            if repo_id not in cards:
+                self.send_response(404)
+                self.end_headers()
+                served.append((self.path, 404))
+                return
+            body = cards[repo_id].encode("utf-8")
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            status = 304 if self.headers.get("If-None-Match") == etag else 200
+            self.send_response(status)
+            self.send_header("ETag", etag)
+            if status == 200:
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if status == 200:
+                self.wfile.write(body)
+            served.append((self.path, status))
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    saved_env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["HF_ENDPOINT"] = f"http://127.0.0.1:{server.server_port}"
+        os.environ["EVAL_MANAGER_CACHE_DIR"] = cache_dir
+        os.environ["EVAL_MANAGER_CACHE_TTL"] = "0"
+        os.environ.pop("EVAL_MANAGER_NO_CACHE", None)
+        os.environ.pop("HF_TOKEN", None)
+        get_card_cache.cache_clear()
+        try:
+            yield served
+        finally:
+            server.shutdown()
+            os.environ.clear()
+            os.environ.update(saved_env)
+            get_card_cache.cache_clear()
+
+
+def test_batch_error_isolation():
+    """Test that one unreadable card is reported as an error without aborting the batch."""
+    print("\n" + "=" * 60)
+    print("TEST 7: Batch Error Isolation")
+    print("=" * 60)
+
+    cards = {
+        "lab/good": SAMPLE_README,
+        "lab/broken": "---\nlicense: [unclosed\n---\n" + SAMPLE_README,
+        "lab/other": SAMPLE_README,
+    }
+    with local_hub(cards):
+        output = io.StringIO()
+        counts = extract_readme_batch(list(cards), workers=2, processes=1, output=output, table_index=1)
+    records = {r["repo_id"]: r for r in map(json.loads, output.getvalue().splitlines())}
+    print(f"\nCounts: {counts}")
+    assert set(records) == set(cards)
+    assert records["lab/broken"]["status"] == "error"
+    assert records["lab/good"]["status"] == records["lab/other"]["status"] == "ok"
+    print(f"Error record: {records['lab/broken']['error'][:60]}")
+    print("✓ The malformed card failed alone; the other repos were extracted")
+
+
+class FailingOutput(io.StringIO):
+    """Output stream that breaks after a number of records, like an interrupted run."""
+
+    def __init__(self, records):
+        super().__init__()
+        self.records = records
+
+    def write(self, text):
+        if self.records == 0:
+            raise KeyboardInterrupt
+        self.records -= 1
+        return super().write(text)
+
+
+def test_sync_state_checkpoints():
+    """Test that the sync state survives an aborted batch and is checkpointed."""
+    print("\n" + "=" * 60)
+    print("TEST 8: Sync State Checkpoints")
+    print("=" * 60)
+
+    cards = {f"lab/model-{i}": SAMPLE_README for i in range(3)}
+    with local_hub(cards), tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state.json")
+        try:
+            extract_readme_batch(
+                list(cards), workers=1, processes=1, output=FailingOutput(1),
+                state=ExtractionState(path), table_index=1
+            )
+        except KeyboardInterrupt:
+            pass
+        saved = ExtractionState(path)
+        finished = len(saved.repos)
+        print(f"\nRepos in the state after an interrupted batch: {finished}")
+        assert finished
+
+        counts = extract_readme_batch(
+            list(cards), workers=1, processes=1, output=io.StringIO(), state=saved, table_index=1
+        )
+        print(f"Next run: {counts}")
+        assert counts["unchanged"] == finished and counts["ok"] == len(cards) - finished
+
+        checkpointed = ExtractionState(os.path.join(tmp, "checkpoint.json"))
+        checkpointed.CHECKPOINT_EVERY = 2
+        for i in range(2):
+            checkpointed.update(f"lab/model-{i}", "digest", None, "options", {"status": "ok"}, {})
+        assert len(ExtractionState(checkpointed.path).repos) == 2
+
+    print("✓ Finished repos are kept when a batch is interrupted, and saved every few updates")
+
+
+def run_command_line(parser, method, params):
+    """Run one command through the serve handler; return its exit code and output."""
+    result = handle_rpc_request(parser, {"jsonrpc": "2.0", "id": 1, "method": method, "params": params})["result"]
+    return result["exit_code"], result["stdout"] + result["stderr"]
+
+
+def test_offline_validation():
+    """Test that offline validation fails when it has nothing to check."""
+    print("\n" + "=" * 60)
+    print("TEST 9: Offline Validation")
+    print("=" * 60)
+
+    parser = build_parser()
+    with tempfile.TemporaryDirectory() as tmp:
+        card = os.path.join(tmp, "org", "model", "README.md")
+        os.makedirs(os.path.dirname(card))
+        with open(card, "w", encoding="utf-8") as f:
+            f.write("---\n" + yaml.dump({"model-index": [{"name": "model", "results": []}]}) + "---\n")
+
+        os.makedirs(os.path.dirname(card) + "-empty")
+
+        print()
+        cases = [
+            ({"readme_dir": tmp}, 0),
+            ({"readme": card}, 0),
+            ({"readme_dir": os.path.join(tmp, "missing")}, 1),
+            ({"readme_dir": card}, 1),
+            ({"readme_dir": os.path.dirname(card) + "-empty"}, 1),
+            ({"readme": os.path.join(tmp, "missing.md")}, 1),
+        ]
+        for params, expected in cases:
+            exit_code, output = run_command_line(parser, "validate", params)
+            print(f"validate {params}: exit {exit_code}")
+            assert exit_code == expected, output
+
+    print("✓ Missing or empty README directories fail instead of passing")
+
+
+def test_json_member_stream():
+    """Test the streaming JSON member reader against json.loads, at every chunk size."""
+    print("\n" + "=" * 60)
+    print("TEST 10: Streaming JSON Members")
+    print("=" * 60)
+
+    document = {
+        "config": {"model": "org/model", "path": "C:\\runs\\", "quote": 'say "hi"'},
+        "results": {"mmlu": {"acc": 0.25, "stderr": 1e-3}, "gsm8k": {"acc": -12, "note": "\\\""}},
+        "escapes": ["\\", '\\"', "\u00e9\n", "{[\"]}"],
+        "samples": [{"text": "} ] , \" \\"}, None, True, 0.5],
+        "total": 1234567.5,
+    }
+    text = json.dumps(document, indent=1)
+    wanted = ["results", "escapes", "total"]
+
+    print()
+    for chunk_size in range(1, 40):
+        members = list(iter_json_members(io.StringIO(text), wanted, chunk_size=chunk_size))
+        assert [key for key, _ in members] == list(document), chunk_size
+        for key, value in members:
+            assert value == document[key] if key in wanted else value is _SKIPPED, (chunk_size, key)
+    print("✓ Values split across every chunk boundary decode like json.loads")
+
+    stream = iter_json_members(io.StringIO('{"a": 1, "b": [2, 3]}'), ["a"])
+    assert next(stream) == ("a", 1)
+    assert next(stream) == ("b", _SKIPPED)
+
+    for bad in ['[1, 2]', '{"a": 1', '{"a": [1, 2', '{"a": "open', '{"a" 1}', '{"a": 1 "b": 2}', '{"a": tru}', '']:
+        for chunk_size in (1, 3, 64):
+            try:
+                list(iter_json_members(io.StringIO(bad), ["a", "b"], chunk_size=chunk_size))
+            except ValueError:
+                continue
+            raise AssertionError(f"accepted {bad!r} with chunk size {chunk_size}")
+    print("✓ Truncated or invalid documents raise ValueError")
+
+
+def test_duplicate_pr_guard():
+    """Test that only an open PR with the same title by the same user counts as a duplicate."""
+    print("\n" + "=" * 60)
+    print("TEST 11: Duplicate PR Guard")
+    print("=" * 60)
+
+    title = "Extract evaluation results from README"
+    discussions = [
+        {"num": 3, "title": title, "author": {"name": "someone"}},
+        {"num": 5, "title": title, "author": {"name": "me"}},
+        {"num": 7, "title": "Fix typo", "author": {"name": "me"}},
+    ]
+    for discussion in discussions:
+        discussion.update(status="open", isPullRequest=True)
+    api = {"/api/models/lab/model/discussions": {"discussions": discussions, "start": 0, "count": 3}}
+    with local_hub({}, api):
+        mine = find_duplicate_pr("lab/model", title, token="me")
+        print(f"\nOwn PR with the same title: #{mine['num']}")
+        assert mine["num"] == 5
+        assert find_duplicate_pr("lab/model", title, token="stranger") is None
+        assert find_duplicate_pr("lab/model", "Add evaluation results", token="me") is None
+        assert find_duplicate_pr("lab/model", title, token=None) is None
+
+    print("✓ PRs by other users or with other titles are not duplicates")
+
+
+def eval_result(dataset, *metrics, split=None):
+    """A model-index result set for `dataset` with (type, value) metrics."""
+    result = {
+        "task": {"type": "text-generation"},
+        "dataset": {"name": dataset.upper(), "type": dataset},
+        "metrics": [{"type": metric, "value": value} for metric, value in metrics],
+    }
+    if split:
+        result["dataset"]["split"] = split
+    return result
+
+
+def test_model_index_merge():
+    """Test the keyed model-index merge and that re-pushing the same results is a no-op."""
+    print("\n" + "=" * 60)
+    print("TEST 12: Model-Index Merge")
+    print("=" * 60)
+
+    existing = [
+        eval_result("mmlu", ("acc", 0.5), ("f1", 0.4)),
+        eval_result("gsm8k", ("acc", 0.3)),
+        eval_result("mmlu", ("acc", 0.6), split="test"),
+    ]
+    new = [eval_result("mmlu", ("Acc", 0.7), ("em", 0.2)), eval_result("hellaswag", ("acc", 0.9))]
+    merged = merge_model_index_results(existing, new)
+    print(f"\nMerged {len(existing)} existing and {len(new)} new result sets into {len(merged)}")
+    assert [r["dataset"]["type"] for r in merged] == ["mmlu", "gsm8k", "mmlu", "hellaswag"]
+    assert merged[0]["metrics"] == [{"type": "Acc", "value": 0.7}, {"type": "f1", "value": 0.4},
+                                    {"type": "em", "value": 0.2}]
+    assert merged[2]["metrics"] == [{"type": "acc", "value": 0.6}]
+    assert existing[0]["metrics"][0]["value"] == 0.5
+    print("✓ Metrics are replaced in place by (task.type, dataset.type, metric.type); new ones are appended")
+
+    duplicated = existing + [eval_result("gsm8k", ("acc", 0.1))]
+    assert merge_model_index_results(duplicated, []) == merge_model_index_results(existing, [])
+    assert merge_model_index_results(merged, new) == merged
+    print("✓ Duplicates in the card collapse and re-merging the same results changes nothing")
+
+    index = [{"name": "model", "results": existing}, {"name": "other", "results": []}]
+    assert merge_model_index(index, existing, "ignored") == index
+    assert merge_model_index(None, new, "model") == [{"name": "model", "results": new}]
+
+    card = "---\nlicense: mit\n" + yaml.dump({"model-index": index}, sort_keys=False) + "---\n# Model\n"
+    with local_hub({"lab/model": card}) as served:
+        outcome = push_model_index("lab/model", [existing[1]])
+    print(f"Re-pushing results already in the card: {outcome}")
+    assert outcome == {"status": "unchanged"}
+    assert [status for _, status in served] == [200]
+    print("✓ A push that leaves the model-index unchanged sends nothing")
+
+
+def test_model_index_validation():
+    """Test that the schema validator reports every problem with its JSON path."""
+    print("\n" + "=" * 60)
+    print("TEST 13: Model-Index Validation")
+    print("=" * 60)
+
+    valid = {"model-index": [{"name": "model", "results": [eval_result("mmlu", ("acc", 0.5), ("f1", 1))]}]}
+    assert validate_model_index_data(valid) == []
+    assert validate_model_index_data({"license": "mit"}) == [("$", "no model-index found")]
+
+    invalid = json.loads(json.dumps(valid))
+    results = invalid["model-index"][0]["results"]
+    results[0]["metrics"][0]["value"] = "85.2"
+    results[0]["metrics"].append({"type": "ACC", "value": 0.1})
+    results.append({"task": {"type": "text-generation"}, "dataset": {"type": "gsm8k"}, "metrics": []})
+    results.append(eval_result("mmlu", ("em", 0.3)))
+    errors = dict(validate_model_index_data(invalid))
+    print()
+    for path, message in errors.items():
+        print(f"  {path}: {message}")
+    results_path = "$['model-index'][0].results"
+    assert errors[f"{results_path}[0].metrics[0].value"].startswith("expected a number")
+    assert errors[f"{results_path}[0].metrics[2]"].startswith(f"duplicate of {results_path}[0].metrics[0]")
+    assert errors[f"{results_path}[1].dataset"] == "missing required field 'name'"
+    assert f"{results_path}[1].metrics" in errors
+    assert errors[f"{results_path}[2]"].startswith(f"duplicate of {results_path}[0]")
+    assert validate_model_index_data({"model-index": []})
+    print("✓ Wrong types, missing fields and duplicate keys are all reported")
+
+
+def test_card_cache():
+    """Test ETag revalidation and LRU eviction of the card cache."""
+    print("\n" + "=" * 60)
+    print("TEST 14: Card Cache")
+    print("=" * 60)
+
+    cards = {f"lab/model-{i}": f"# Model {i}\n" + "x" * 2000 for i in range(3)}
+    with local_hub(cards) as served, tempfile.TemporaryDirectory() as root:
+        cache = CardCache(root, ttl=3600)
+        first = cache.load("lab/model-0")
+        assert cache.load("lab/model-0") is first and len(served) == 1
+        again = CardCache(root, ttl=3600).load("lab/model-0")
+        assert again.from_cache and again.content == first.content and len(served) == 1
+        print("\n✓ Fresh refs are served from memory and disk without a request")
+
+        revalidated = cache.load("lab/model-0", revalidate=True)
+        assert served[-1][1] == 304 and revalidated.from_cache
+        cards["lab/model-0"] += "changed\n"
+        changed = cache.load("lab/model-0", revalidate=True)
+        assert served[-1][1] == 200 and changed.content.endswith("changed\n")
+        print("✓ Stale refs are revalidated with If-None-Match; a changed card is downloaded again")
+
+        one_card = cache._blob_bytes() // 2  # both versions of lab/model-0 are stored
+        small = CardCache(os.path.join(root, "small"), max_bytes=int(one_card * 2.5), ttl=3600)
+        for repo_id in cards:
+            small.load(repo_id)
+            time.sleep(0.01)
+        kept = [repo_id for repo_id in cards if os.path.exists(small._ref_path(repo_id, "main"))]
+        print(f"Refs kept under a {small.max_bytes}-byte budget: {kept}")
+        assert kept == ["lab/model-1", "lab/model-2"]
+        assert small._blob_bytes() <= small.max_bytes
+    print("✓ The least recently used card is evicted once the blobs exceed max_bytes")
+
+
+def test_request_budget():
+    """Test that the request budget stops a run once it is used up."""
+    print("\n" + "=" * 60)
+    print("TEST 15: Request Budget")
+    print("=" * 60)
+
+    RequestBudgetExceeded = _http_classes()[1]
+    limiter = RateLimiter(budget=2)
+    key = limiter.key("https://huggingface.co/api/models", {"Authorization": "Bearer me"})
+    limiter.acquire(key)
+    limiter.acquire(key)
+    try:
+        limiter.acquire(key)
+        raise AssertionError("a third request got through a budget of 2")
+    except RequestBudgetExceeded:
+        pass
+    assert limiter.report()["requests"] == 2
+    print("\n✓ Requests beyond the budget raise RequestBudgetExceeded")
+
+    cards = {f"lab/model-{i}": SAMPLE_README for i in range(3)}
+    with local_hub(cards) as served:
+        RATE_LIMITER.configure(budget=2)
+        try:
+            counts = extract_readme_batch(list(cards), workers=1, processes=1, output=io.StringIO(), table_index=1)
+        finally:
+            RATE_LIMITER.configure()
+    print(f"Batch of {len(cards)} cards with a budget of 2: {counts}")
+    assert len(served) == 2
+    assert counts["ok"] == 2 and counts["error"] == 1
+    print("✓ The shared limiter stops fetching once the run's budget is spent")
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -179,6 +669,16 @@ def main():
     eval_tables = test_evaluation_detection(parsed_tables)
     metrics = test_metric_extraction(eval_tables)
     test_model_index_format(metrics)
+    test_serve_isolation()
+    test_batch_error_isolation()
+    test_sync_state_checkpoints()
+    test_offline_validation()
+    test_json_member_stream()
+    test_duplicate_pr_guard()
+    test_model_index_merge()
+    test_model_index_validation()
+    test_card_cache()
+    test_request_budget()
 
     # Summary
     print("\n" + "=" * 60)
@@ -188,6 +688,16 @@ def main():
     print(f"✓ Identified {len(eval_tables)} evaluation tables")
     print(f"✓ Extracted {len(metrics)} metrics")
     print("✓ Generated model-index format successfully")
+    print("✓ Serve requests are isolated from each other")
+    print("✓ Batch extraction survives a malformed card")
+    print("✓ Sync state is saved when a batch is interrupted")
+    print("✓ Offline validation checks at least one card")
+    print("✓ Streamed JSON members match json.loads")
+    print("✓ Duplicate-PR guard matches title and author")
+    print("✓ Model-index merge is keyed and idempotent")
+    print("✓ Schema validation reports every error")
+    print("✓ Card cache revalidates with ETags and evicts by size")
+    print("✓ Request budget caps the requests of a run")
     print("\n" + "=" * 60)
     print("All tests completed! The extraction logic is working correctly.")
     print("=" * 60 + "\n")
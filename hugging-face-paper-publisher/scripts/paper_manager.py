@@ -5,27 +5,156 @@ Manages paper indexing, linking, authorship, and article creation.
 """
 
 import argparse
+import asyncio
+import hashlib
 import os
 import sys
 import re
 import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from datetime import datetime
+from functools import lru_cache
 
 try:
     from huggingface_hub import HfApi, hf_hub_download, HfFolder
     import yaml
     import requests
+    from urllib3.util import Retry
     from dotenv import load_dotenv
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
-    print("Install with: uv add huggingface_hub pyyaml requests python-dotenv")
+    print("Install with: uv add huggingface_hub pyyaml requests python-dotenv 'urllib3>=2'")
     sys.exit(1)
 
 # Load environment variables
 load_dotenv()
 
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def call_with_backoff(
+    func: Callable[..., Any],
+    *args: Any,
+    max_retries: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    **kwargs: Any
+) -> Any:
+    """
+    Call func, retrying 429/5xx responses and dropped connections.
+
+    A numeric Retry-After header is honoured; otherwise the delay doubles
+    per attempt (with jitter) up to max_delay.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            response = getattr(e, "response", None)
+            status = getattr(response, "status_code", None)
+            if status is None:
+                retryable = isinstance(e, (ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout))
+            else:
+                retryable = status in RETRYABLE_STATUS_CODES
+            if not retryable or attempt == max_retries:
+                raise
+
+            delay = min(max_delay, base_delay * 2 ** attempt) * random.uniform(0.5, 1.0)
+            retry_after = (getattr(response, "headers", None) or {}).get("Retry-After")
+            if retry_after:
+                try:
+                    delay = min(max(float(retry_after), 0.0), max_delay)
+                except ValueError:
+                    pass
+            print(f"  Retrying in {delay:.1f}s after: {e}")
+            time.sleep(delay)
+
+
+@lru_cache(maxsize=1)
+def http_session(pool_size: int = 16) -> requests.Session:
+    """
+    Process-wide keep-alive session for Hub page checks and the arXiv API.
+
+    GET requests are retried on 429/5xx and dropped connections, honouring
+    Retry-After and otherwise backing off exponentially with jitter. After the
+    last retry the response is returned, so status checks still see it.
+    """
+    retry = Retry(
+        total=int(os.getenv("PAPER_MANAGER_HTTP_RETRIES", "3")),
+        status_forcelist=RETRYABLE_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        backoff_factor=0.5,
+        backoff_max=60,
+        backoff_jitter=0.5,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def cache_dir() -> Optional[str]:
+    """Response cache directory, or None if PAPER_MANAGER_NO_CACHE is set."""
+    if os.getenv("PAPER_MANAGER_NO_CACHE", "").lower() in ("1", "true", "yes"):
+        return None
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.getenv("PAPER_MANAGER_CACHE_DIR") or os.path.join(cache_home, "hf-paper-manager")
+
+
+def cached_get_text(url: str, ttl: Optional[float] = None) -> str:
+    """
+    GET url and return its body, reusing a copy on disk younger than ttl seconds.
+
+    Only for responses that do not change between runs (arXiv metadata); the
+    default ttl is PAPER_MANAGER_CACHE_TTL (one day). Errors are raised, never cached.
+    """
+    ttl = float(os.getenv("PAPER_MANAGER_CACHE_TTL", "86400")) if ttl is None else ttl
+    directory = cache_dir()
+    path = os.path.join(directory, "http", hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json") if directory else None
+
+    if path:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if time.time() - cached.get("fetched_at", 0) < ttl:
+                return cached["text"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    response = http_session().get(url, timeout=10)
+    response.raise_for_status()
+
+    if path:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"url": url, "fetched_at": time.time(), "text": response.text}, f)
+        os.replace(tmp_path, path)
+    return response.text
+
+
+async def gather_limited(func: Callable[..., Any], items: List[Any], concurrency: int = 8) -> List[Any]:
+    """
+    Run the blocking func(item) for every item on the event loop's threads.
+
+    At most `concurrency` calls are in flight; they share http_session(), so
+    connections are reused. Results come back in the order of items.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: Any) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(func, item)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
 
 class PaperManager:
     """Manages paper publishing operations on Hugging Face Hub."""
@@ -56,7 +185,7 @@ class PaperManager:
         paper_url = f"https://huggingface.co/papers/{arxiv_id}"
 
         try:
-            response = requests.get(paper_url, timeout=10)
+            response = http_session().get(paper_url, timeout=10)
             if response.status_code == 200:
                 print(f"✓ Paper already indexed at {paper_url}")
                 return {"status": "exists", "url": paper_url}
@@ -82,7 +211,7 @@ class PaperManager:
         paper_url = f"https://huggingface.co/papers/{arxiv_id}"
 
         try:
-            response = requests.get(paper_url, timeout=10)
+            response = http_session().get(paper_url, timeout=10)
             if response.status_code == 200:
                 return {
                     "exists": True,
@@ -100,6 +229,15 @@ class PaperManager:
         except requests.RequestException as e:
             return {"exists": False, "error": str(e)}
 
+    def check_papers(self, arxiv_ids: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Check several papers concurrently over one pooled session.
+
+        Returns:
+            list: One check_paper result per arXiv ID, in input order
+        """
+        return asyncio.run(gather_limited(self.check_paper, arxiv_ids, concurrency))
+
     def link_paper_to_repo(
         self,
         repo_id: str,
@@ -126,35 +264,7 @@ class PaperManager:
         print(f"Linking paper {arxiv_id} to {repo_type} {repo_id}...")
 
         try:
-            # Download current README
-            readme_path = hf_hub_download(
-                repo_id=repo_id,
-                filename="README.md",
-                repo_type=repo_type,
-                token=self.token
-            )
-
-            with open(readme_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Parse or create YAML frontmatter
-            updated_content = self._add_paper_to_readme(content, arxiv_id, citation)
-
-            # Upload updated README
-            commit_message = f"Add paper reference: arXiv:{arxiv_id}"
-
-            if create_pr:
-                # Create PR (not implemented in basic version)
-                print("PR creation not yet implemented. Committing directly.")
-
-            self.api.upload_file(
-                path_or_fileobj=updated_content.encode('utf-8'),
-                path_in_repo="README.md",
-                repo_id=repo_id,
-                repo_type=repo_type,
-                commit_message=commit_message,
-                token=self.token
-            )
+            self._commit_paper_links(repo_id, [arxiv_id], repo_type, citation, create_pr)
 
             paper_url = f"https://huggingface.co/papers/{arxiv_id}"
             repo_url = f"https://huggingface.co/{repo_id}"
@@ -174,6 +284,131 @@ class PaperManager:
             print(f"Error linking paper: {e}")
             return {"status": "error", "message": str(e)}
 
+    def _commit_paper_links(
+        self,
+        repo_id: str,
+        arxiv_ids: List[str],
+        repo_type: str = "model",
+        citation: Optional[str] = None,
+        create_pr: bool = False
+    ) -> bool:
+        """
+        Add every paper to the repo README and upload it in a single commit.
+
+        Download and upload are retried on rate limits and server errors.
+
+        Returns:
+            bool: False if all papers were already referenced (nothing uploaded)
+        """
+        # Download current README
+        readme_path = call_with_backoff(
+            hf_hub_download,
+            repo_id=repo_id,
+            filename="README.md",
+            repo_type=repo_type,
+            token=self.token
+        )
+
+        with open(readme_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Parse or create YAML frontmatter
+        updated_content = content
+        for arxiv_id in arxiv_ids:
+            updated_content = self._add_paper_to_readme(updated_content, arxiv_id, citation)
+
+        if updated_content == content:
+            return False
+
+        # Upload updated README
+        commit_message = "Add paper reference: " + ", ".join(f"arXiv:{arxiv_id}" for arxiv_id in arxiv_ids)
+
+        if create_pr:
+            # Create PR (not implemented in basic version)
+            print("PR creation not yet implemented. Committing directly.")
+
+        call_with_backoff(
+            self.api.upload_file,
+            path_or_fileobj=updated_content.encode('utf-8'),
+            path_in_repo="README.md",
+            repo_id=repo_id,
+            repo_type=repo_type,
+            commit_message=commit_message,
+            token=self.token
+        )
+        return True
+
+    def link_papers_batch(
+        self,
+        links: List[Tuple[str, List[str]]],
+        repo_type: str = "model",
+        citation: Optional[str] = None,
+        create_pr: bool = False,
+        workers: int = 4,
+        journal: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Link papers to many repositories concurrently, one README commit per repo.
+
+        Args:
+            links: (repo_id, [arxiv_id, ...]) pairs; duplicate repos are grouped
+            repo_type: Type of repositories ("model", "dataset", or "space")
+            citation: Optional full citation text
+            create_pr: Create a PR instead of direct commit
+            workers: Concurrent repositories
+            journal: Optional JSONL file of finished repos; rerun with the same
+                path to resume after an interruption
+
+        Returns:
+            list: One status dict per repository
+        """
+        grouped: Dict[str, List[str]] = {}
+        for repo_id, arxiv_ids in links:
+            pending = grouped.setdefault(repo_id, [])
+            for arxiv_id in arxiv_ids:
+                arxiv_id = self._clean_arxiv_id(arxiv_id)
+                if arxiv_id not in pending:
+                    pending.append(arxiv_id)
+
+        done = set()
+        if journal and os.path.exists(journal):
+            with open(journal, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get("status") in ("success", "unchanged"):
+                        done.add((entry["repo_id"], tuple(entry["arxiv_ids"])))
+        journal_lock = threading.Lock()
+
+        def run(repo_id: str, arxiv_ids: List[str]) -> Dict[str, Any]:
+            try:
+                changed = self._commit_paper_links(repo_id, arxiv_ids, repo_type, citation, create_pr)
+                result = {"repo_id": repo_id, "arxiv_ids": arxiv_ids, "status": "success" if changed else "unchanged"}
+            except Exception as e:
+                result = {"repo_id": repo_id, "arxiv_ids": arxiv_ids, "status": "error", "message": str(e)}
+            if journal:
+                with journal_lock, open(journal, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(result) + "\n")
+            return result
+
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for repo_id, arxiv_ids in grouped.items():
+                if (repo_id, tuple(arxiv_ids)) in done:
+                    results.append({"repo_id": repo_id, "arxiv_ids": arxiv_ids, "status": "skipped"})
+                    continue
+                futures.append(pool.submit(run, repo_id, arxiv_ids))
+            for future in as_completed(futures):
+                result = future.result()
+                mark = "✗" if result["status"] == "error" else "✓"
+                print(f"{mark} {result['repo_id']}: {result['status']}")
+                results.append(result)
+
+        return results
+
     def _add_paper_to_readme(
         self,
         content: str,
@@ -304,11 +539,8 @@ class PaperManager:
         api_url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
 
         try:
-            response = requests.get(api_url, timeout=10)
-            response.raise_for_status()
-
             # Parse XML response (simplified)
-            content = response.text
+            content = cached_get_text(api_url)
 
             # Extract basic info with regex (proper XML parsing would be better)
             title_match = re.search(r'<title>(.*?)</title>', content, re.DOTALL)
@@ -390,7 +622,9 @@ def main():
 
     # Check command
     check_parser = subparsers.add_parser("check", help="Check if paper exists")
-    check_parser.add_argument("--arxiv-id", required=True, help="arXiv paper ID")
+    check_parser.add_argument("--arxiv-id", help="arXiv paper ID")
+    check_parser.add_argument("--arxiv-ids", help="Comma-separated arXiv IDs, checked concurrently")
+    check_parser.add_argument("--workers", type=int, default=8, help="Concurrent checks for --arxiv-ids (default: 8)")
 
     # Link command
     link_parser = subparsers.add_parser("link", help="Link paper to repository")
@@ -401,6 +635,15 @@ def main():
     link_parser.add_argument("--citation", help="Full citation text")
     link_parser.add_argument("--create-pr", action="store_true", help="Create PR instead of direct commit")
 
+    # Batch link command
+    link_batch_parser = subparsers.add_parser("link-batch", help="Link papers to many repositories")
+    link_batch_parser.add_argument("--input", required=True, help="File with '<repo-id> <arxiv-id> [<arxiv-id> ...]' lines, or - for stdin")
+    link_batch_parser.add_argument("--repo-type", default="model", choices=["model", "dataset", "space"])
+    link_batch_parser.add_argument("--citation", help="Full citation text")
+    link_batch_parser.add_argument("--create-pr", action="store_true", help="Create PR instead of direct commit")
+    link_batch_parser.add_argument("--workers", type=int, default=4, help="Concurrent repositories (default: 4)")
+    link_batch_parser.add_argument("--journal", help="JSONL progress file; rerun with the same path to resume")
+
     # Create command
     create_parser = subparsers.add_parser("create", help="Create research article")
     create_parser.add_argument("--template", required=True, help="Template name")
@@ -438,7 +681,18 @@ def main():
         print(json.dumps(result, indent=2))
 
     elif args.command == "check":
-        result = manager.check_paper(args.arxiv_id)
+        arxiv_ids = [args.arxiv_id] if args.arxiv_id else []
+        if args.arxiv_ids:
+            arxiv_ids.extend([id.strip() for id in args.arxiv_ids.split(",") if id.strip()])
+
+        if not arxiv_ids:
+            print("Error: Must provide --arxiv-id or --arxiv-ids")
+            sys.exit(1)
+
+        if len(arxiv_ids) == 1:
+            result = manager.check_paper(arxiv_ids[0])
+        else:
+            result = manager.check_papers(arxiv_ids, concurrency=args.workers)
         print(json.dumps(result, indent=2))
 
     elif args.command == "link":
@@ -452,15 +706,44 @@ def main():
             print("Error: Must provide --arxiv-id or --arxiv-ids")
             sys.exit(1)
 
-        for arxiv_id in arxiv_ids:
+        if len(arxiv_ids) == 1:
             result = manager.link_paper_to_repo(
                 repo_id=args.repo_id,
-                arxiv_id=arxiv_id,
+                arxiv_id=arxiv_ids[0],
                 repo_type=args.repo_type,
                 citation=args.citation,
                 create_pr=args.create_pr
             )
-            print(json.dumps(result, indent=2))
+        else:
+            # Several papers for one repo: a single README commit
+            result = manager.link_papers_batch(
+                [(args.repo_id, arxiv_ids)],
+                repo_type=args.repo_type,
+                citation=args.citation,
+                create_pr=args.create_pr
+            )[0]
+        print(json.dumps(result, indent=2))
+
+    elif args.command == "link-batch":
+        stream = sys.stdin if args.input == "-" else open(args.input, 'r', encoding='utf-8')
+        links = []
+        for line in stream:
+            parts = line.split("#", 1)[0].split()
+            if len(parts) >= 2:
+                links.append((parts[0], parts[1:]))
+        if stream is not sys.stdin:
+            stream.close()
+
+        results = manager.link_papers_batch(
+            links,
+            repo_type=args.repo_type,
+            citation=args.citation,
+            create_pr=args.create_pr,
+            workers=args.workers,
+            journal=args.journal
+        )
+        failed = sum(1 for result in results if result["status"] == "error")
+        print(f"\nLinked {len(results) - failed} of {len(results)} repositories ({failed} failed)")
 
     elif args.command == "create":
         result = manager.create_research_article(
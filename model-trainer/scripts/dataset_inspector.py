@@ -18,11 +18,20 @@ Usage with HF Jobs:
 """
 
 import argparse
+import asyncio
+import hashlib
+import http.client
+import os
+import random
 import sys
 import json
-import urllib.request
+import threading
+import time
+import urllib.error
 import urllib.parse
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
 
 def parse_args():
@@ -33,32 +42,144 @@ def parse_args():
     parser.add_argument("--preview", type=int, default=150, help="Max chars per field preview")
     parser.add_argument("--samples", type=int, default=5, help="Number of samples to fetch (default: 5)")
     parser.add_argument("--json-output", action="store_true", help="Output as JSON")
+    parser.add_argument("--cache-dir", default=os.getenv("DATASET_INSPECTOR_CACHE_DIR"),
+                        help="Reuse API responses stored here for --cache-ttl seconds (default: no cache)")
+    parser.add_argument("--cache-ttl", type=float, default=3600, help="Response cache lifetime in seconds (default: 3600)")
     return parser.parse_args()
 
 
+class HTTPClient:
+    """
+    Keep-alive JSON client for the Datasets Server API (standard library only).
+
+    Each thread keeps one persistent connection per host, so sequential calls
+    skip the TCP/TLS handshake. 429/5xx responses and dropped connections are
+    retried, honouring Retry-After and otherwise backing off exponentially.
+    With a cache_dir, successful responses are reused for cache_ttl seconds.
+    """
+
+    def __init__(self, retries: int = 3, timeout: float = 10, cache_dir: Optional[str] = None, cache_ttl: float = 3600):
+        self.retries = retries
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self._local = threading.local()
+
+    def _connection(self, scheme: str, host: str) -> http.client.HTTPConnection:
+        connections = self._local.__dict__.setdefault("connections", {})
+        if (scheme, host) not in connections:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connections[(scheme, host)] = cls(host, timeout=self.timeout)
+        return connections[(scheme, host)]
+
+    def _drop_connection(self, scheme: str, host: str) -> None:
+        connection = self._local.__dict__.get("connections", {}).pop((scheme, host), None)
+        if connection:
+            connection.close()
+
+    def _cache_path(self, url: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def get_json(self, url: str) -> Optional[Dict]:
+        """GET url and decode its JSON body; None for 404, urllib.error.HTTPError for other errors."""
+        cache_path = self._cache_path(url)
+        if cache_path:
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    cached = json.load(f)
+                if time.time() - cached.get("fetched_at", 0) < self.cache_ttl:
+                    return cached["data"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        for attempt in range(self.retries + 1):
+            delay = min(30.0, 2 ** attempt) * random.uniform(0.5, 1.0)
+            try:
+                connection = self._connection(parts.scheme, parts.netloc)
+                connection.request("GET", path, headers={"Accept": "application/json"})
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                # Stale keep-alive connection or network error: reconnect and retry
+                self._drop_connection(parts.scheme, parts.netloc)
+                if attempt == self.retries:
+                    raise
+                time.sleep(delay)
+                continue
+
+            if response.status in RETRYABLE_STATUS_CODES and attempt < self.retries:
+                retry_after = response.getheader("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = min(float(retry_after), 60.0)
+                time.sleep(delay)
+                continue
+            if response.status == 404:
+                return None
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+
+            data = json.loads(body.decode())
+            if cache_path:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"url": url, "fetched_at": time.time(), "data": data}, f)
+                os.replace(tmp_path, cache_path)
+            return data
+
+    async def aget_json(self, url: str) -> Optional[Dict]:
+        """get_json on a worker thread (with its own connection), for use with asyncio.gather."""
+        return await asyncio.to_thread(self.get_json, url)
+
+
+CLIENT = HTTPClient()
+
+
 def api_request(url: str) -> Dict:
     """Make API request to Datasets Server"""
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            return json.loads(response.read().decode())
+        return CLIENT.get_json(url)
     except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return None
         raise Exception(f"API request failed: {e.code} {e.reason}")
     except Exception as e:
         raise Exception(f"API request failed: {str(e)}")
 
 
+def splits_url(dataset: str) -> str:
+    return f"https://datasets-server.huggingface.co/splits?dataset={urllib.parse.quote(dataset)}"
+
+
+def rows_url(dataset: str, config: str, split: str, offset: int = 0, length: int = 5) -> str:
+    return f"https://datasets-server.huggingface.co/rows?dataset={urllib.parse.quote(dataset)}&config={config}&split={split}&offset={offset}&length={length}"
+
+
 def get_splits(dataset: str) -> Dict:
     """Get available splits for dataset"""
-    url = f"https://datasets-server.huggingface.co/splits?dataset={urllib.parse.quote(dataset)}"
-    return api_request(url)
+    return api_request(splits_url(dataset))
 
 
 def get_rows(dataset: str, config: str, split: str, offset: int = 0, length: int = 5) -> Dict:
     """Get rows from dataset"""
-    url = f"https://datasets-server.huggingface.co/rows?dataset={urllib.parse.quote(dataset)}&config={config}&split={split}&offset={offset}&length={length}"
-    return api_request(url)
+    return api_request(rows_url(dataset, config, split, offset, length))
+
+
+async def fetch_splits_and_rows(dataset: str, config: str, split: str, length: int) -> tuple:
+    """
+    Request the split list and the rows of the requested config at the same time.
+
+    The rows request is speculative: if it fails (e.g. the config does not
+    exist), the exception is returned in place of the rows so the caller can
+    fall back to another config once the splits are known.
+    """
+    return await asyncio.gather(
+        CLIENT.aget_json(splits_url(dataset)),
+        CLIENT.aget_json(rows_url(dataset, config, split, offset=0, length=length)),
+        return_exceptions=True,
+    )
 
 
 def find_columns(columns: List[str], patterns: List[str]) -> List[str]:
@@ -199,13 +320,19 @@ def format_value_preview(value: Any, max_chars: int) -> str:
 
 
 def main():
+    global CLIENT
     args = parse_args()
+    CLIENT = HTTPClient(cache_dir=args.cache_dir, cache_ttl=args.cache_ttl)
     
     print(f"Fetching dataset info via Datasets Server API...")
     
     try:
-        # Get splits info
-        splits_data = get_splits(args.dataset)
+        # Get splits info, and rows of the requested config in parallel
+        splits_data, prefetched_rows = asyncio.run(
+            fetch_splits_and_rows(args.dataset, args.config, args.split, args.samples)
+        )
+        if isinstance(splits_data, Exception):
+            raise Exception(f"API request failed: {splits_data}")
         if not splits_data or "splits" not in splits_data:
             print(f"ERROR: Could not fetch splits for dataset '{args.dataset}'")
             print(f"       Dataset may not exist or is not accessible via Datasets Server API")
@@ -226,8 +353,11 @@ def main():
             config_to_use = list(available_configs)[0]
             print(f"Config '{args.config}' not found, trying '{config_to_use}'...")
         
-        # Get rows
-        rows_data = get_rows(args.dataset, config_to_use, args.split, offset=0, length=args.samples)
+        # Get rows (already fetched when the requested config has the split)
+        if split_found and not isinstance(prefetched_rows, Exception):
+            rows_data = prefetched_rows
+        else:
+            rows_data = get_rows(args.dataset, config_to_use, args.split, offset=0, length=args.samples)
         
         if not rows_data or "rows" not in rows_data:
             print(f"ERROR: Could not fetch rows for dataset '{args.dataset}'")